@@ -0,0 +1,81 @@
+import gc
+
+import pytest
+
+from wlroots.util.box import Box, BoxArray, FrozenBox
+
+
+def test_box_array_queries():
+    boxes = BoxArray([Box(0, 0, 10, 10), (20, 5, 5, 5), (0, 0, 0, 0)])
+
+    assert len(boxes) == 3
+    assert boxes.find_point(21, 6) == 1
+    assert boxes.find_point(100, 100) is None
+    assert boxes.contains_point(5, 5).tolist() == [True, False, False]
+    assert boxes.area().tolist() == [100, 25, 0]
+
+    union = boxes.union()
+    assert union is not None
+    assert (union.x, union.y, union.width, union.height) == (0, 0, 25, 10)
+
+    closest = boxes.closest_point(30, 0).tolist()
+    assert closest[0][1] == 0
+    assert closest[1][1] == 5
+
+    intersection = boxes.intersect(Box(5, 5, 100, 100))
+    assert intersection.as_memoryview().tolist()[:2] == [[5, 5, 5, 5], [20, 5, 5, 5]]
+
+
+def test_box_array_views():
+    boxes = BoxArray([(1, 2, 3, 4)])
+
+    box = boxes[0]
+    box.width = 30
+    assert boxes.as_memoryview().tolist() == [[1, 2, 30, 4]]
+
+    boxes[0] = Box(5, 6, 7, 8)
+    assert (box.x, box.y, box.width, box.height) == (5, 6, 7, 8)
+    assert BoxArray().union() is None
+
+
+def test_box_array_index():
+    boxes = BoxArray([(1, 2, 3, 4), (5, 6, 7, 8)])
+
+    boxes[-1] = (0, 0, 1, 1)
+    assert boxes.as_memoryview().tolist() == [[1, 2, 3, 4], [0, 0, 1, 1]]
+    assert boxes[-2].x == 1
+
+    with pytest.raises(IndexError):
+        boxes[2]
+    with pytest.raises(IndexError):
+        boxes[-3] = (0, 0, 1, 1)
+
+
+def test_box_array_views_keep_array_alive():
+    boxes = BoxArray([(1, 2, 3, 4)])
+    first = boxes[0]
+    second = boxes[0]
+    del first, boxes
+    gc.collect()
+
+    # Allocate over the memory of the array, had it been freed
+    BoxArray([(0, 0, 0, 0)] * 16)
+    assert (second.x, second.y, second.width, second.height) == (1, 2, 3, 4)
+
+
+def test_frozen_box():
+    box = FrozenBox(0, 0, 10, 10)
+
+    assert box == FrozenBox(0, 0, 10, 10)
+    assert len({box, FrozenBox(0, 0, 10, 10)}) == 1
+    with pytest.raises(AttributeError):
+        box.x = 1
+
+    assert box.intersection(FrozenBox(5, 5, 10, 10)) == FrozenBox(5, 5, 5, 5)
+    assert box.intersection(FrozenBox(10, 0, 10, 10)) is None
+    assert box.union(FrozenBox(20, 20, 5, 5)) == FrozenBox(0, 0, 25, 25)
+    assert box.contains_point(0, 0) and not box.contains_point(10, 5)
+
+    # The cdata is only allocated when the box is passed to wlroots
+    assert box.contains_point(5, 5) == Box(ptr=box._ptr).contains_point(5, 5)
+    assert FrozenBox.from_box(box.to_box()) == box
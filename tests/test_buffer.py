@@ -0,0 +1,90 @@
+from unittest import mock
+
+import pytest
+
+from wlroots import ffi
+from wlroots.util.drm_format import fourcc_code
+from wlroots.wlr_types.buffer import Buffer, BufferDataPtrAccessFlag, BufferMapping
+
+XRGB8888 = fourcc_code("XR24")
+NV12 = fourcc_code("NV12")
+
+READ = BufferDataPtrAccessFlag.READ
+READ_WRITE = BufferDataPtrAccessFlag.READ | BufferDataPtrAccessFlag.WRITE
+
+
+def mapping(fmt, stride, width, height, flags=READ):
+    data = ffi.new("uint8_t[]", list(range(stride * height)))
+    return data, BufferMapping(data, fmt, stride, width, height, flags)
+
+
+def test_as_memoryview():
+    # Two rows of two pixels, padded to a stride of 12 bytes
+    _, pixels = mapping(XRGB8888, 12, 2, 2)
+
+    view = pixels.as_memoryview()
+    assert view.shape == (2, 12)
+    assert view.readonly
+    assert pixels.readonly
+    assert view[1, 0] == 12
+
+    data, pixels = mapping(XRGB8888, 12, 2, 2, READ_WRITE)
+    view = pixels.as_memoryview()
+    assert not view.readonly
+    view[1, 0] = 255
+    assert data[12] == 255
+
+
+def test_as_memoryview_empty():
+    _, pixels = mapping(XRGB8888, 0, 0, 0)
+    assert len(pixels.as_memoryview()) == 0
+
+
+def test_as_numpy_skips_padding():
+    np = pytest.importorskip("numpy")
+    _, pixels = mapping(XRGB8888, 12, 2, 2)
+
+    array = pixels.as_numpy()
+    assert array.shape == (2, 2, 4)
+    assert array.strides == (12, 4, 1)
+    assert not array.flags.writeable
+    # The 4 bytes of padding at the end of the first row are skipped
+    assert np.array_equal(array[1, 0], [12, 13, 14, 15])
+
+    data, pixels = mapping(XRGB8888, 12, 2, 2, READ_WRITE)
+    array = pixels.as_numpy()
+    array[1, 1, 3] = 0
+    assert data[12 + 4 + 3] == 0
+
+
+def test_as_numpy_unknown_format():
+    pytest.importorskip("numpy")
+    _, pixels = mapping(NV12, 12, 2, 2)
+
+    assert pixels.format_info is None
+    assert pixels.as_numpy().shape == (2, 12)
+
+
+def test_map_ends_data_access():
+    buffer_ptr = ffi.new("struct wlr_buffer *")
+    buffer_ptr.width = 2
+    buffer_ptr.height = 2
+    buffer = Buffer(buffer_ptr)
+    data = ffi.new("uint8_t[]", 16)
+
+    with (
+        mock.patch.object(
+            Buffer, "begin_data_ptr_access", return_value=(data, XRGB8888, 8)
+        ) as begin,
+        mock.patch.object(Buffer, "end_data_ptr_access") as end,
+    ):
+        with buffer.map() as pixels:
+            assert (pixels.width, pixels.height, pixels.stride) == (2, 2, 8)
+            end.assert_not_called()
+        begin.assert_called_once_with(READ)
+        end.assert_called_once_with()
+
+        with pytest.raises(KeyError):
+            with buffer.map(READ_WRITE):
+                raise KeyError
+        assert end.call_count == 2
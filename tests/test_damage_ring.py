@@ -0,0 +1,31 @@
+from wlroots.util.box import FrozenBox
+from wlroots.util.region import PixmanRegion32
+from wlroots.wlr_types import DamageRing
+
+
+def test_damage_ring_buffer_age():
+    with DamageRing() as damage_ring:
+        damage_ring.set_bounds(100, 100)
+        damage_ring.rotate()
+
+        assert damage_ring.add_box(FrozenBox(0, 0, 10, 10))
+        damage_ring.rotate()
+        assert damage_ring.add_box(FrozenBox(50, 50, 10, 10))
+
+        assert damage_ring.scissor_boxes(1) == [FrozenBox(50, 50, 10, 10)]
+        assert damage_ring.scissor_boxes(2) == [
+            FrozenBox(0, 0, 10, 10),
+            FrozenBox(50, 50, 10, 10),
+        ]
+        # Unknown buffer contents repaint the whole output
+        assert damage_ring.scissor_boxes(0) == [FrozenBox(0, 0, 100, 100)]
+
+
+def test_damage_ring_add_region():
+    with DamageRing() as damage_ring, PixmanRegion32() as region:
+        damage_ring.set_bounds(100, 100)
+        damage_ring.rotate()
+
+        region.init_rect(90, 90, 20, 20)
+        assert damage_ring.add(region)
+        assert damage_ring.current.extents == FrozenBox(90, 90, 10, 10)
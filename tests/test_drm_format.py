@@ -0,0 +1,15 @@
+from wlroots.util.drm_format import drm_format_info, fourcc_code, fourcc_to_str
+
+
+def test_drm_format_info():
+    xrgb8888 = fourcc_code("XR24")
+    assert xrgb8888 == 0x34325258
+    assert fourcc_to_str(xrgb8888) == "XR24"
+
+    info = drm_format_info(xrgb8888)
+    assert info is not None
+    assert info.name == "XRGB8888"
+    assert info.bytes_per_pixel == 4
+    assert not info.has_alpha
+
+    assert drm_format_info(fourcc_code("NV12")) is None
@@ -0,0 +1,43 @@
+import pytest
+
+from wlroots.util.gamma import GammaProfile, build_gamma_lut, temperature_to_rgb
+
+
+def test_neutral_temperature():
+    assert temperature_to_rgb(6500) == pytest.approx((1.0, 1.0, 1.0))
+
+    red, green, blue = temperature_to_rgb(3000)
+    assert red == pytest.approx(1.0)
+    assert blue < green < red
+
+
+def test_build_gamma_lut():
+    lut = build_gamma_lut(256, GammaProfile())
+    ramps = lut.as_memoryview().tolist()
+
+    assert len(ramps) == 3 * 256
+    for channel in range(3):
+        ramp = ramps[channel * 256 : (channel + 1) * 256]
+        assert ramp[0] == 0
+        assert ramp[-1] == 0xFFFF
+        assert ramp == sorted(ramp)
+
+
+def test_build_gamma_lut_brightness_and_curves():
+    lut = build_gamma_lut(3, GammaProfile(brightness=0.5))
+    assert lut.as_memoryview().tolist()[:3] == [0, 0x4000, 0x8000]
+
+    inverted = ((1.0, 0.0), (1.0, 0.0), (1.0, 0.0))
+    lut = build_gamma_lut(3, GammaProfile(curves=inverted))
+    assert lut.as_memoryview().tolist()[:3] == [0xFFFF, 0x8000, 0]
+
+
+def test_build_gamma_lut_invalid_size():
+    with pytest.raises(ValueError):
+        build_gamma_lut(0, GammaProfile())
+
+
+@pytest.mark.parametrize("gamma", [0, -1.0, float("nan")])
+def test_build_gamma_lut_invalid_gamma(gamma):
+    with pytest.raises(ValueError):
+        build_gamma_lut(256, GammaProfile(gamma=gamma))
@@ -0,0 +1,188 @@
+from types import SimpleNamespace
+
+from pywayland.server import Signal
+
+from wlroots.util.edges import Edges
+from wlroots.util.gestures import Gesture, GestureEngine, GestureSource, GestureType
+from wlroots.util.touch_points import TouchPointRegistry, TrackedTouchPoint
+
+CURSOR_SIGNALS = (
+    "swipe_begin",
+    "swipe_update",
+    "swipe_end",
+    "pinch_begin",
+    "pinch_update",
+    "pinch_end",
+    "hold_begin",
+    "hold_end",
+    "touch_down_event",
+    "touch_motion_event",
+    "touch_up_event",
+    "touch_cancel_event",
+    "touch_frame_event",
+)
+
+
+def make_cursor():
+    return SimpleNamespace(**{name: Signal() for name in CURSOR_SIGNALS})
+
+
+def test_gesture_velocity_window():
+    gesture = Gesture(GestureType.SWIPE, GestureSource.POINTER, 3, 0)
+    assert gesture.velocity == (0.0, 0.0)
+    assert gesture.direction == Edges.NONE
+
+    gesture._move(50, 100.0, 0.0)
+    gesture._move(200, 10.0, 0.0)
+    gesture._move(250, 50.0, 5.0)
+
+    # The samples older than the velocity window are ignored
+    assert gesture.velocity == (1.0, 0.1)
+    assert gesture.direction == Edges.RIGHT
+    assert gesture.duration_msec == 250
+
+
+def test_gesture_velocity_many_samples():
+    gesture = Gesture(GestureType.SWIPE, GestureSource.POINTER, 3, 0)
+    for i in range(1, 21):
+        gesture._move(i * 10, 0.0, -5.0)
+
+    assert gesture.dy == -100.0
+    assert gesture.velocity == (0.0, -0.5)
+    assert gesture.direction == Edges.TOP
+
+
+def test_commit_thresholds():
+    engine = GestureEngine(
+        make_cursor(),
+        swipe_distance=200.0,
+        swipe_velocity=0.5,
+        pinch_threshold=0.1,
+        hold_msec=300,
+    )
+
+    hold = Gesture(GestureType.HOLD, GestureSource.POINTER, 3, 1000)
+    hold.time_msec = 1299
+    assert not engine._is_committed(hold)
+    hold.time_msec = 1300
+    assert engine._is_committed(hold)
+
+    pinch = Gesture(GestureType.PINCH, GestureSource.POINTER, 3, 0)
+    pinch.scale = 1.05
+    assert not engine._is_committed(pinch)
+    pinch.scale = 0.85
+    assert engine._is_committed(pinch)
+
+    # Far enough
+    swipe = Gesture(GestureType.SWIPE, GestureSource.POINTER, 3, 0)
+    swipe._move(500, -250.0, 0.0)
+    assert engine._is_committed(swipe)
+
+    # Neither far nor fast enough
+    swipe = Gesture(GestureType.SWIPE, GestureSource.POINTER, 3, 0)
+    swipe._move(500, 0.0, 50.0)
+    assert not engine._is_committed(swipe)
+
+    # Flung along its direction
+    swipe._move(550, 0.0, 50.0)
+    assert engine._is_committed(swipe)
+
+    # Flung against its direction
+    swipe = Gesture(GestureType.SWIPE, GestureSource.POINTER, 3, 0)
+    swipe._move(500, -100.0, 0.0)
+    swipe._move(550, 50.0, 0.0)
+    assert swipe.direction == Edges.LEFT
+    assert not engine._is_committed(swipe)
+
+
+def test_pointer_gesture():
+    ended = []
+    engine = GestureEngine(make_cursor(), on_end=ended.append, swipe_distance=100.0)
+
+    # Gestures with fewer fingers are left to clients
+    engine._on_swipe_begin(None, SimpleNamespace(fingers=2, time_msec=0))
+    assert engine.active is None
+    engine._on_swipe_end(None, SimpleNamespace(time_msec=10, cancelled=False))
+    assert ended == []
+
+    engine._on_swipe_begin(None, SimpleNamespace(fingers=3, time_msec=0))
+    assert engine.active is not None
+    engine._on_swipe_update(None, SimpleNamespace(time_msec=300, dx=120.0, dy=0.0))
+    engine._on_swipe_end(None, SimpleNamespace(time_msec=310, cancelled=False))
+
+    (gesture,) = ended
+    assert engine.active is None
+    assert gesture.dx == 120.0
+    assert gesture.committed
+
+    engine._on_swipe_begin(None, SimpleNamespace(fingers=3, time_msec=0))
+    engine._on_swipe_update(None, SimpleNamespace(time_msec=300, dx=120.0, dy=0.0))
+    engine._on_swipe_end(None, SimpleNamespace(time_msec=310, cancelled=True))
+    assert ended[1].cancelled
+    assert not ended[1].committed
+
+
+def _touch_points(cursor, points):
+    registry = TouchPointRegistry(cursor)
+    for touch_id, (x, y) in enumerate(points):
+        registry._points[touch_id] = TrackedTouchPoint(
+            touch_id, 0, x, y, None, (0.0, 0.0), 4
+        )
+    return registry
+
+
+def test_touch_swipe():
+    cursor = make_cursor()
+    registry = _touch_points(cursor, [(0.0, 0.0), (100.0, 0.0), (50.0, 100.0)])
+    began = []
+    ended = []
+    engine = GestureEngine(
+        cursor,
+        touch_points=registry,
+        on_begin=began.append,
+        on_end=ended.append,
+        swipe_distance=30.0,
+        touch_slop=16.0,
+    )
+
+    engine._on_touch_frame(None, None)
+    for point in registry:
+        point._move(10, point.layout_x + 10.0, point.layout_y)
+    engine._on_touch_frame(None, None)
+    # Within the slop
+    assert began == []
+
+    for point in registry:
+        point._move(20, point.layout_x + 30.0, point.layout_y)
+    engine._on_touch_frame(None, None)
+    (gesture,) = began
+    assert gesture.type == GestureType.SWIPE
+    assert gesture.source == GestureSource.TOUCH
+    assert gesture.fingers == 3
+    assert gesture.dx == 40.0
+
+    # Lifting a finger ends the gesture
+    del registry._points[2]
+    engine._on_touch_frame(None, None)
+    assert ended == [gesture]
+    assert gesture.committed
+
+
+def test_touch_pinch():
+    cursor = make_cursor()
+    registry = _touch_points(cursor, [(-50.0, 0.0), (50.0, 0.0), (0.0, 50.0)])
+    began = []
+    engine = GestureEngine(cursor, touch_points=registry, on_begin=began.append)
+
+    engine._on_touch_frame(None, None)
+    for point in registry:
+        point._move(10, point.layout_x * 1.5, point.layout_y * 1.5)
+    engine._on_touch_frame(None, None)
+
+    (gesture,) = began
+    assert gesture.type == GestureType.PINCH
+    assert gesture.scale > 1.1
+
+    engine._on_touch_cancel(None, None)
+    assert gesture.cancelled
+    assert not gesture.committed
@@ -0,0 +1,175 @@
+import io
+import time
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+from pywayland.protocol.wayland import WlKeyboard
+from pywayland.server import Display, Signal
+
+from wlroots.util.input_recording import (
+    InputEvent,
+    InputEventType,
+    InputRecorder,
+    InputReplayer,
+    read_input_events,
+)
+from wlroots.wlr_types.input_device import ButtonState
+
+CURSOR_SIGNALS = (
+    "motion_event",
+    "motion_absolute_event",
+    "button_event",
+    "axis_event",
+    "frame_event",
+    "touch_down_event",
+    "touch_up_event",
+    "touch_motion_event",
+    "touch_cancel_event",
+    "touch_frame_event",
+    "swipe_begin",
+    "swipe_update",
+    "swipe_end",
+    "pinch_begin",
+    "pinch_update",
+    "pinch_end",
+    "hold_begin",
+    "hold_end",
+)
+
+
+class FakeDevice:
+    """Signals emitting events built from keyword arguments"""
+
+    def __init__(self, *signals):
+        self._pending = None
+        for name in signals:
+            setattr(self, name, Signal(data_wrapper=lambda _data: self._pending))
+
+    def emit(self, name, **fields):
+        self._pending = SimpleNamespace(**fields)
+        getattr(self, name).emit()
+
+
+def replay(events, **kwargs):
+    finished = []
+    with Display() as display:
+        replayer = InputReplayer(
+            display, events, on_finished=lambda: finished.append(True), **kwargs
+        )
+        replayer.start()
+        deadline = time.monotonic() + 1
+        while not finished and time.monotonic() < deadline:
+            display.get_event_loop().dispatch(10)
+        replayer.stop()
+    assert finished
+    return replayer
+
+
+def test_record_and_read():
+    cursor = FakeDevice(*CURSOR_SIGNALS)
+    keyboard = FakeDevice("key_event")
+    stream = io.BytesIO()
+    recorder = InputRecorder(stream)
+    recorder.attach_cursor(cursor)
+    recorder.attach_keyboard(keyboard)
+
+    cursor.emit(
+        "motion_event",
+        time_msec=1000,
+        delta_x=1.5,
+        delta_y=-2.0,
+        unaccel_delta_x=1.0,
+        unaccel_delta_y=-1.0,
+    )
+    cursor.emit("frame_event")
+    cursor.emit("button_event", time_msec=1016, button=272, button_state=1)
+    cursor.emit("frame_event")
+    cursor.emit("touch_down_event", time_msec=1020, touch_id=3, x=0.25, y=0.5)
+    cursor.emit("touch_frame_event")
+    keyboard.emit("key_event", time_msec=1050, keycode=30, state=1)
+    recorder.close()
+
+    # Nothing is recorded once the recorder is closed
+    keyboard.emit("key_event", time_msec=1060, keycode=30, state=0)
+    assert recorder.event_count == 7
+
+    stream.seek(0)
+    # Frames are recorded with the timestamp of the events they group
+    assert list(read_input_events(stream)) == [
+        InputEvent(InputEventType.MOTION, 1000, (1.5, -2.0, 1.0, -1.0)),
+        InputEvent(InputEventType.FRAME, 1000, ()),
+        InputEvent(InputEventType.BUTTON, 1016, (272, 1)),
+        InputEvent(InputEventType.FRAME, 1016, ()),
+        InputEvent(InputEventType.TOUCH_DOWN, 1020, (3, 0.25, 0.5)),
+        InputEvent(InputEventType.TOUCH_FRAME, 1020, ()),
+        InputEvent(InputEventType.KEY, 1050, (30, 1)),
+    ]
+
+
+def test_read_invalid_recording():
+    with pytest.raises(ValueError):
+        list(read_input_events(io.BytesIO(b"NOTINPUT\x01\x00")))
+
+    keyboard = FakeDevice("key_event")
+    stream = io.BytesIO()
+    InputRecorder(stream).attach_keyboard(keyboard)
+    keyboard.emit("key_event", time_msec=0, keycode=30, state=1)
+    with pytest.raises(ValueError):
+        list(read_input_events(io.BytesIO(stream.getvalue()[:-1])))
+
+
+def test_replay_dispatch():
+    events = [
+        InputEvent(InputEventType.MOTION, 1000, (1.0, 2.0, 1.0, 2.0)),
+        InputEvent(InputEventType.FRAME, 1000, ()),
+        InputEvent(InputEventType.TOUCH_DOWN, 1010, (0, 0.5, 0.5)),
+        InputEvent(InputEventType.TOUCH_FRAME, 1010, ()),
+    ]
+    dispatched = []
+
+    def dispatch(event, time_msec):
+        dispatched.append(event)
+        return True
+
+    cursor = mock.Mock()
+    replayer = replay(events, cursor=cursor, dispatch=dispatch, speed=10.0)
+
+    assert dispatched == events
+    assert replayer.event_count == 4
+    # Handled events skip the default handling
+    cursor.move.assert_not_called()
+
+
+def test_replay_default_handling():
+    events = [
+        InputEvent(InputEventType.MOTION, 1000, (1.0, 2.0, 1.0, 2.0)),
+        InputEvent(InputEventType.FRAME, 1000, ()),
+        InputEvent(InputEventType.BUTTON, 1016, (272, ButtonState.PRESSED)),
+        InputEvent(InputEventType.FRAME, 1016, ()),
+        InputEvent(InputEventType.KEY, 1050, (30, 1)),
+    ]
+    cursor = mock.Mock()
+    seat = mock.Mock()
+    keyboard = mock.Mock()
+    replay(events, cursor=cursor, seat=seat, keyboard=keyboard, speed=0)
+
+    cursor.move.assert_called_once_with(1.0, 2.0)
+    seat.pointer_notify_button.assert_called_once_with(
+        mock.ANY, 272, ButtonState.PRESSED
+    )
+    assert seat.pointer_notify_frame.call_count == 2
+    keyboard.notify_key.assert_called_once_with(
+        mock.ANY, 30, WlKeyboard.key_state.pressed
+    )
+
+
+def test_replay_frames_without_timestamp():
+    # Recordings made before frames were timestamped still replay at once
+    events = [
+        InputEvent(InputEventType.MOTION, 5000, (1.0, 1.0, 1.0, 1.0)),
+        InputEvent(InputEventType.FRAME, 0, ()),
+    ]
+    seat = mock.Mock()
+    replay(events, seat=seat)
+    seat.pointer_notify_frame.assert_called_once_with()
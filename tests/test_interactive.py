@@ -0,0 +1,25 @@
+from wlroots.util.box import FrozenBox
+from wlroots.util.interactive import SizeConstraints, SnapEdgeIndex
+
+
+def test_snap_edge_index():
+    snap_edges = SnapEdgeIndex([FrozenBox(0, 0, 1920, 1080), FrozenBox(100, 50, 0, 0)])
+
+    assert snap_edges.snap_x(8, 10) == 0
+    assert snap_edges.snap_x(1915, 10) == 1920
+    assert snap_edges.snap_x(100, 10) is None
+    assert snap_edges.snap_y(1070, 10) == 1080
+    assert snap_edges.snap_y(500, 10) is None
+
+
+def test_size_constraints():
+    constraints = SizeConstraints(
+        50, 40, 400, 0, base_width=10, width_inc=7, height_inc=1
+    )
+
+    assert constraints.constrain_width(220) == 220
+    assert constraints.constrain_width(226) == 220
+    assert constraints.constrain_width(5) == 52
+    assert constraints.constrain_width(1000) == 395
+    assert constraints.constrain_height(10) == 40
+    assert constraints.constrain_height(5000) == 5000
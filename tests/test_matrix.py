@@ -0,0 +1,49 @@
+import gc
+
+from pywayland.protocol.wayland import WlOutput
+
+from wlroots.util.box import Box, BoxArray
+from wlroots.wlr_types import Matrix, MatrixArray
+
+
+def test_matrix_in_place():
+    matrix = Matrix.identity()
+    other = Matrix.identity()
+    other.translate(2, 3)
+
+    matrix @= other
+    assert matrix.as_memoryview().tolist() == [[1, 0, 2], [0, 1, 3], [0, 0, 1]]
+
+    matrix.set_identity()
+    matrix.imul(other)
+    matrix.imul(other)
+    assert matrix.as_memoryview()[0, 2] == 4
+
+
+def test_project_boxes():
+    projection = Matrix.identity()
+    boxes = BoxArray([Box(0, 0, 10, 10), Box(5, 5, 2, 3)])
+    out = MatrixArray(4)
+
+    result = Matrix.project_boxes(
+        boxes, WlOutput.transform.normal, 0, projection, out=out
+    )
+    assert result is out
+    for i, box in enumerate(boxes):
+        expected = Matrix.identity()
+        expected.project_box_into(box, WlOutput.transform.normal, 0, projection)
+        assert out[i].as_memoryview().tolist() == expected.as_memoryview().tolist()
+    assert out.as_memoryview().tolist()[3] == [[0.0] * 3] * 3
+
+
+def test_matrix_array_views_keep_array_alive():
+    matrices = MatrixArray(1)
+    first = matrices[0]
+    second = matrices[0]
+    second.set_identity()
+    del first, matrices
+    gc.collect()
+
+    # Allocate over the memory of the array, had it been freed
+    MatrixArray(16)
+    assert second.as_memoryview().tolist() == [[1, 0, 0], [0, 1, 0], [0, 0, 1]]
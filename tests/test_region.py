@@ -0,0 +1,43 @@
+from wlroots.util.box import Box
+from wlroots.util.region import PixmanRegion32, RegionOverlap
+
+
+def test_region_algebra():
+    with PixmanRegion32() as region, PixmanRegion32() as other:
+        region.union_rect(0, 0, 10, 10)
+        other.init_rect(5, 5, 10, 10)
+        region.union(other)
+
+        extents = region.extents
+        assert (extents.x, extents.y, extents.width, extents.height) == (0, 0, 15, 15)
+        assert region.contains_point(12, 12)
+        assert not region.contains_point(12, 2)
+        assert region.contains_rectangle(0, 0, 5, 5) == RegionOverlap.IN
+        assert region.contains_rectangle(8, 0, 4, 4) == RegionOverlap.PART
+
+        region.subtract(other)
+        assert not region.contains_point(6, 6)
+        region.translate(10, 0)
+        assert region.contains_point(10, 0)
+
+        other.intersect_rect(0, 0, 6, 6)
+        assert other.n_rects() == 1
+        assert other.rectangles_as_memoryview().tolist() == [[5, 5, 6, 6]]
+
+
+def test_region_rectangles_round_trip():
+    region = PixmanRegion32()
+    region.init_rects([Box(0, 0, 10, 5), Box(20, 0, 5, 5)])
+    try:
+        rects = region.rectangles_as_memoryview()
+        assert rects.tolist() == [[0, 0, 10, 5], [20, 0, 25, 5]]
+
+        with PixmanRegion32() as copy:
+            copy.fini()
+            copy.init_rectangles(rects)
+            assert copy.equal(region)
+            copy.clear()
+            assert not copy.not_empty()
+            assert len(copy.rectangles_as_memoryview()) == 0
+    finally:
+        region.fini()
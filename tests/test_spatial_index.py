@@ -0,0 +1,38 @@
+from wlroots.util.box import Box, FrozenBox
+from wlroots.util.spatial_index import SpatialIndex
+
+
+def test_spatial_index_stacking():
+    index: SpatialIndex[str] = SpatialIndex(cell_size=64)
+    index.insert("a", Box(0, 0, 100, 100))
+    index.insert("b", (50, 50, 100, 100))
+
+    assert index.at(60, 60) == "b"
+    assert index.at(10, 10) == "a"
+    assert index.at(500, 500) is None
+
+    index.raise_to_top("a")
+    assert index.all_at(60, 60) == ["a", "b"]
+    index.lower_to_bottom("a")
+    assert list(index) == ["b", "a"]
+
+
+def test_spatial_index_updates():
+    index: SpatialIndex[int] = SpatialIndex(cell_size=32)
+    index.insert(1, (0, 0, 10, 10))
+    index.insert(2, (100, 100, 10, 10))
+
+    assert index.intersecting(FrozenBox(5, 5, 100, 100)) == [2, 1]
+
+    index.move(2, -50, -50)
+    assert index.at(105, 105) is None
+    assert index.at(-45, -45) == 2
+    assert index.get(2) == FrozenBox(-50, -50, 10, 10)
+
+    index.remove(1)
+    assert 1 not in index
+    assert index.intersecting(FrozenBox(0, 0, 10, 10)) == []
+
+    keys, boxes = index.as_box_array()
+    assert keys == [2]
+    assert boxes.find_point(-45, -45) == 0
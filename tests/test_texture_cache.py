@@ -0,0 +1,76 @@
+import pytest
+from pywayland.server import Display
+
+from wlroots.backend import Backend
+from wlroots.renderer import Renderer
+from wlroots.util.drm_format import fourcc_code
+from wlroots.wlr_types import TextureCache
+
+ARGB8888 = fourcc_code("AR24")
+# 2x2 pixels of 4 bytes
+SIZE = 16
+
+
+def pixels(value):
+    return bytes([value]) * SIZE
+
+
+@pytest.fixture
+def renderer(headless_backend, monkeypatch):
+    monkeypatch.setenv("WLR_RENDERER", "pixman")
+    with Display() as display:
+        with Backend(display) as backend:
+            yield Renderer.autocreate(backend)
+
+
+def test_texture_cache_hits(renderer):
+    cache = TextureCache()
+
+    texture = cache.from_pixels(renderer, ARGB8888, 8, 2, 2, pixels(1))
+    same = cache.from_pixels(renderer, ARGB8888, 8, 2, 2, bytearray(pixels(1)))
+    assert same is texture
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert (len(cache), cache.bytes) == (1, SIZE)
+
+    # Different pixels, and the same pixels with another layout, are misses
+    cache.from_pixels(renderer, ARGB8888, 8, 2, 2, pixels(2))
+    cache.from_pixels(renderer, ARGB8888, 16, 4, 1, pixels(1))
+    assert (cache.hits, cache.misses) == (1, 3)
+    assert (len(cache), cache.bytes) == (3, 3 * SIZE)
+
+    with pytest.raises(ValueError):
+        cache.from_pixels(renderer, ARGB8888, 8, 2, 4, pixels(1))
+
+    cache.clear()
+    assert (len(cache), cache.bytes) == (0, 0)
+    assert texture._ptr is None
+
+
+def test_texture_cache_eviction(renderer):
+    cache = TextureCache(max_bytes=2 * SIZE)
+
+    a = cache.from_pixels(renderer, ARGB8888, 8, 2, 2, pixels(1))
+    b = cache.from_pixels(renderer, ARGB8888, 8, 2, 2, pixels(2))
+    c = cache.from_pixels(renderer, ARGB8888, 8, 2, 2, pixels(3))
+
+    # The textures of the current frame are kept over the budget
+    assert cache.evictions == 0
+    assert cache.bytes == 3 * SIZE
+    assert a._ptr is not None
+
+    # The least recently used texture is evicted once the frame ends
+    cache.end_frame()
+    assert cache.evictions == 1
+    assert cache.bytes == 2 * SIZE
+    assert a._ptr is None
+
+    # Textures used in the frame are kept, others are evicted
+    assert cache.from_pixels(renderer, ARGB8888, 8, 2, 2, pixels(2)) is b
+    cache.from_pixels(renderer, ARGB8888, 8, 2, 2, pixels(4))
+    assert cache.evictions == 2
+    assert cache.bytes == 2 * SIZE
+    assert c._ptr is None
+    assert b._ptr is not None
+
+    cache.discard_renderer(renderer)
+    assert (len(cache), cache.bytes) == (0, 0)
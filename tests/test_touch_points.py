@@ -0,0 +1,87 @@
+from types import SimpleNamespace
+
+import pytest
+from pywayland.server import Signal
+
+from wlroots.util.touch_points import TouchPointRegistry, TrackedTouchPoint
+
+
+def test_history_wraps_around():
+    point = TrackedTouchPoint(0, 0, 0.0, 0.0, None, (0.0, 0.0), history=3)
+    assert list(point.history()) == [(0, 0.0, 0.0)]
+
+    for i in range(1, 6):
+        point._move(i * 10, i * 2.0, -i * 1.0)
+
+    assert list(point.history()) == [(30, 6.0, -3.0), (40, 8.0, -4.0), (50, 10.0, -5.0)]
+    assert (point.layout_x, point.layout_y) == (10.0, -5.0)
+    assert (point.down_layout_x, point.down_layout_y) == (0.0, 0.0)
+
+
+def test_surface_coords():
+    point = TrackedTouchPoint(0, 0, 10.0, 20.0, None, (5.0, 5.0), history=4)
+    assert (point.surface_x, point.surface_y) == (5.0, 15.0)
+
+    point._move(10, 30.0, 10.0)
+    assert (point.surface_x, point.surface_y) == (25.0, 5.0)
+
+
+def test_velocity():
+    point = TrackedTouchPoint(0, 100, 10.0, 20.0, None, (0.0, 0.0), history=4)
+    assert point.velocity() == (0.0, 0.0)
+
+    point._move(110, 20.0, 20.0)
+    assert point.velocity() == pytest.approx((1.0, 0.0))
+
+    # Only the last four positions are used once the history wrapped around
+    point._move(120, 30.0, 20.0)
+    point._move(130, 40.0, 20.0)
+    point._move(140, 60.0, 20.0)
+    point._move(150, 90.0, 50.0)
+    assert point.velocity() == pytest.approx((2.0, 1.0))
+
+
+def test_velocity_without_elapsed_time():
+    point = TrackedTouchPoint(0, 100, 0.0, 0.0, None, (0.0, 0.0), history=4)
+    point._move(100, 50.0, 50.0)
+    assert point.velocity() == (0.0, 0.0)
+
+
+def make_surface():
+    return SimpleNamespace(destroy_event=Signal())
+
+
+def test_surface_destroyed():
+    surface = make_surface()
+    point = TrackedTouchPoint(0, 0, 0.0, 0.0, surface, (0.0, 0.0), history=4)
+    assert point.surface is surface
+
+    surface.destroy_event.emit()
+    assert point.surface is None
+
+
+def test_surface_listener_removed():
+    cursor = SimpleNamespace(
+        touch_down_event=Signal(),
+        touch_motion_event=Signal(),
+        touch_up_event=Signal(),
+        touch_cancel_event=Signal(),
+    )
+    registry = TouchPointRegistry(cursor)
+    surfaces = [make_surface() for _ in range(3)]
+    points = [
+        TrackedTouchPoint(touch_id, 0, 0.0, 0.0, surface, (0.0, 0.0), history=4)
+        for touch_id, surface in enumerate(surfaces)
+    ]
+    for point in points:
+        registry._points[point.touch_id] = point
+
+    registry._on_touch_up(None, SimpleNamespace(touch_id=0))
+    registry._on_touch_cancel(None, SimpleNamespace(touch_id=1))
+    registry.destroy()
+    assert len(registry) == 0
+
+    # The points no longer follow their surfaces once they are forgotten
+    for surface in surfaces:
+        surface.destroy_event.emit()
+    assert [point.surface for point in points] == surfaces
@@ -5,23 +5,23 @@ import signal
 from typing import TYPE_CHECKING, cast
 from weakref import WeakKeyDictionary
 
-from pywayland.protocol.wayland import WlKeyboard, WlSeat
+from pywayland.protocol.wayland import WlSeat
 from pywayland.server import Display, Listener
 from xkbcommon import xkb
 
-from wlroots import ffi, lib
 from wlroots.allocator import Allocator
 from wlroots.backend import Backend
 from wlroots.renderer import Renderer
-from wlroots.util.box import Box
+from wlroots.util.box import Box, FrozenBox
 from wlroots.util.clock import Timespec
-from wlroots.util.edges import Edges
+from wlroots.util.interactive import MoveResizeController, SnapEdgeIndex
 from wlroots.util.log import logger
 from wlroots.wlr_types import (
     Cursor,
     Keyboard,
     Output,
     OutputLayout,
+    OutputLayoutCache,
     OutputState,
     Scene,
     SceneBuffer,
@@ -32,6 +32,7 @@ from wlroots.wlr_types import (
     SceneSurface,
     SceneTree,
     Seat,
+    SeatPointerFocus,
     Surface,
     XCursorManager,
     XdgShell,
@@ -39,7 +40,7 @@ from wlroots.wlr_types import (
 )
 from wlroots.wlr_types.cursor import WarpMode
 from wlroots.wlr_types.input_device import ButtonState, InputDeviceType
-from wlroots.wlr_types.keyboard import KeyboardModifier
+from wlroots.wlr_types.keyboard import KeybindingTable, KeyboardModifier
 from wlroots.wlr_types.xdg_shell import XdgSurface, XdgSurfaceRole
 
 from .cursor_mode import CursorMode
@@ -66,17 +67,6 @@ if TYPE_CHECKING:
 _weakkeydict: WeakKeyDictionary[View, SceneNode] = WeakKeyDictionary()
 
 
-def get_keysyms(xkb_state: ffi.CData, keycode: int) -> list[int]:
-    syms_out = ffi.new("const xkb_keysym_t **")
-    nsyms = lib.xkb_state_key_get_syms(xkb_state, keycode, syms_out)
-    if nsyms > 0:
-        assert syms_out[0] != ffi.NULL
-
-    syms = [syms_out[0][i] for i in range(nsyms)]
-    print(f"got {nsyms} syms: {syms}")
-    return syms
-
-
 class TinywlServer:
     def __init__(
         self,
@@ -115,18 +105,31 @@ class TinywlServer:
 
         # idle_notify_v1 support
         self.idle_notify = idle_notify_v1.IdleNotifierV1(self._display)
+        # input events are frequent, only reset the idle timers so often
+        self._idle_activity = idle_notify_v1.ThrottledIdleNotifierV1(
+            self._display, self.idle_notify
+        )
 
         # the seat manages the keyboard focus information
         self._seat = seat
+        self._pointer_focus = SeatPointerFocus(seat, cursor, cursor_manager)
         self.keyboards: list[KeyboardHandler] = []
         self.cursor_mode = CursorMode.PASSTHROUGH
         self.grabbed_view: View | None = None
-        self.grab_x = 0.0
-        self.grab_y = 0.0
-        self.grab_geobox: Box | None = None
-        self.resize_edges: Edges = Edges.NONE
+        # the offset of the window geometry within the grabbed view
+        self.grab_geometry_x = 0
+        self.grab_geometry_y = 0
+        self.move_resize = MoveResizeController(
+            self._display, self._grab_resize, on_move=self._grab_move
+        )
+
+        # compositor keybindings, checked before key events are sent to clients
+        self._keybindings = KeybindingTable()
+        self._keybindings.add(KeyboardModifier.ALT, "Escape", self._display.terminate)
+        self._keybindings.add(KeyboardModifier.ALT, "F1", self.cycle_views)
 
         self._output_layout = output_layout
+        self._output_layout_cache = OutputLayoutCache(output_layout)
         self._scene_layout = scene_layout
         self.outputs: list[Output] = []
 
@@ -174,68 +177,49 @@ class TinywlServer:
             tree = cast(SceneTree, tree.node.parent)
         return tree.node.data, surface, sx, sy
 
-    def _process_cursor_move(self) -> None:
+    def snap_edges(self, grabbed_view: View) -> SnapEdgeIndex:
+        """The edges of the outputs and of the other views, to snap to"""
+        boxes: list[Box | FrozenBox] = list(self._output_layout_cache.boxes)
+        for view in self.views:
+            if view is grabbed_view or not view.mapped:
+                continue
+            geo_box = view.xdg_surface.get_geometry()
+            boxes.append(
+                FrozenBox(
+                    int(view.x) + geo_box.x,
+                    int(view.y) + geo_box.y,
+                    geo_box.width,
+                    geo_box.height,
+                )
+            )
+        return SnapEdgeIndex(boxes)
+
+    def _grab_move(self, x: int, y: int) -> None:
         # Move the grabbed view to the new position
         assert self.grabbed_view is not None
-        x = self.grabbed_view.x = self._cursor.x - self.grab_x
-        y = self.grabbed_view.y = self._cursor.y - self.grab_y
-        self.grabbed_view.scene_node.set_position(int(x), int(y))
+        self.grabbed_view.x = x - self.grab_geometry_x
+        self.grabbed_view.y = y - self.grab_geometry_y
+        self.grabbed_view.scene_node.set_position(
+            int(self.grabbed_view.x), int(self.grabbed_view.y)
+        )
 
-    def _process_cursor_resize(self) -> None:
+    def _grab_resize(self, x: int, y: int, width: int, height: int) -> None:
+        self._grab_move(x, y)
         assert self.grabbed_view is not None
-        assert self.grab_geobox is not None
-
-        new_left = self.grab_geobox.x
-        new_right = self.grab_geobox.x + self.grab_geobox.width
-        new_top = self.grab_geobox.y
-        new_bottom = self.grab_geobox.y + self.grab_geobox.height
-
-        border_x = int(self._cursor.x - self.grab_x)
-        border_y = int(self._cursor.y - self.grab_y)
-
-        if self.resize_edges & Edges.TOP:
-            new_top = min(border_y, new_bottom - 1)
-        elif self.resize_edges & Edges.BOTTOM:
-            new_bottom = max(border_y, new_top + 1)
-
-        if self.resize_edges & Edges.LEFT:
-            new_left = min(border_x, new_right - 1)
-        elif self.resize_edges & Edges.RIGHT:
-            new_right = max(border_x, new_left + 1)
-
-        geo_box = self.grabbed_view.xdg_surface.get_geometry()
-        self.grabbed_view.x = new_left - geo_box.x
-        self.grabbed_view.y = new_top - geo_box.y
-
-        new_width = new_right - new_left
-        new_height = new_bottom - new_top
-
-        self.grabbed_view.xdg_surface.set_size(new_width, new_height)
+        self.grabbed_view.xdg_surface.set_size(width, height)
 
     def process_cursor_motion(self, time: int) -> None:
-        self.idle_notify.notify_activity(self._seat)
-        if self.cursor_mode == CursorMode.MOVE:
-            self._process_cursor_move()
-            return
-        elif self.cursor_mode == CursorMode.RESIZE:
-            print("RESIZING")
-            self._process_cursor_resize()
+        self._idle_activity.notify_activity(self._seat)
+        if self.cursor_mode in (CursorMode.MOVE, CursorMode.RESIZE):
+            self.move_resize.motion(self._cursor.x, self._cursor.y)
             return
 
-        view, surface, sx, sy = self.view_at(self._cursor.x, self._cursor.y)
+        _, surface, sx, sy = self.view_at(self._cursor.x, self._cursor.y)
         logging.debug("Processing cursor motion: %s, %s", sx, sy)
 
-        if view is None:
-            self._cursor.set_xcursor(self._cursor_manager, "default")
-
-        if surface is None:
-            # Clear pointer focus so future button events and such are not sent
-            # to the last client to have the cursor over it.
-            self._seat.pointer_clear_focus()
-        else:
-            # Send pointer enter and motion events.
-            self._seat.pointer_notify_enter(surface, sx, sy)
-            self._seat.pointer_notify_motion(time, sx, sy)
+        # Send pointer enter and motion events to the surface under the cursor,
+        # or clear pointer focus and show the default cursor image
+        self._pointer_focus.update(time, surface, sx, sy)
 
     def send_modifiers(
         self, modifiers: KeyboardModifiers, input_device: InputDevice
@@ -245,43 +229,21 @@ class TinywlServer:
         self._seat.keyboard_notify_modifiers(modifiers)
 
     def send_key(self, key_event: KeyboardKeyEvent, input_device: InputDevice) -> None:
-        self.idle_notify.notify_activity(self._seat)
+        self._idle_activity.notify_activity(self._seat)
         keyboard = Keyboard.from_input_device(input_device)
-        keyboard_modifier = keyboard.modifier
 
-        handled = False
         # If alt is held down and this button was _pressed_, we attempt to
-        # process it as a compositor keybinding
-        if (
-            keyboard_modifier == KeyboardModifier.ALT
-            and key_event.state == WlKeyboard.key_state.pressed
-        ):
-            # translate libinput keycode -> xkbcommon
-            keycode = key_event.keycode + 8
-            keysyms = get_keysyms(keyboard._ptr.xkb_state, keycode)
-
-            for keysym in keysyms:
-                if self.handle_keybinding(keysym):
-                    handled = True
-                    break
-
-        # Otherwise, we pass it along to the client
-        if not handled:
+        # process it as a compositor keybinding, otherwise we pass it along to
+        # the client
+        if not self._keybindings.dispatch(keyboard, key_event):
             self._seat.set_keyboard(keyboard)
             self._seat.keyboard_notify_key(key_event)
 
-    def handle_keybinding(self, keysym: int) -> bool:
-        if keysym == xkb.keysym_from_name("Escape"):
-            self._display.terminate()
-        elif keysym == xkb.keysym_from_name("F1"):
-            if len(self.views) >= 2:
-                *rest, new_view, prev_view = self.views
-                self.focus_view(new_view)
-                self.views = [prev_view, *rest, new_view]
-
-        else:
-            return False
-        return True
+    def cycle_views(self) -> None:
+        if len(self.views) >= 2:
+            *rest, new_view, prev_view = self.views
+            self.focus_view(new_view)
+            self.views = [prev_view, *rest, new_view]
 
     def focus_view(self, view: View, surface: Surface | None = None) -> None:
         """Focus a given XDG surface
@@ -373,6 +335,9 @@ class TinywlServer:
         state.finish()
 
         self.outputs.append(output)
+        # load the cursor theme at the scale of every output up front, rather
+        # than when the cursor first enters the output
+        self._cursor_manager.load_scales(o.scale for o in self.outputs)
         l_output = self._output_layout.add_auto(output)
         if not l_output:
             logging.warning("Failed to add output to layout.")
@@ -471,6 +436,7 @@ class TinywlServer:
         view, surface, _, _ = self.view_at(self._cursor.x, self._cursor.y)
         if event.button_state == ButtonState.RELEASED:
             # exit interactive move/resize
+            self.move_resize.end()
             self.cursor_mode = CursorMode.PASSTHROUGH
         elif view is not None:
             self.focus_view(view, surface)
@@ -496,6 +462,7 @@ class TinywlServer:
         # This event is rasied by the seat when a client provides a cursor image
         # TODO: check that seat client is correct
         self._cursor.set_surface(event.surface, event.hotspot)
+        self._pointer_focus.invalidate_cursor_image()
 
     def seat_request_set_selection(
         self, listener: Listener, event: RequestSetSelectionEvent
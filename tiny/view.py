@@ -5,8 +5,9 @@ from typing import TYPE_CHECKING
 
 from pywayland.server import Listener
 
-from wlroots.util.box import Box
+from wlroots.util.box import FrozenBox
 from wlroots.util.edges import Edges
+from wlroots.util.interactive import SizeConstraints
 
 from .cursor_mode import CursorMode
 
@@ -84,24 +85,34 @@ class View:
             logging.info("Denied begin interactive")
             # TODO: this doesn't seem to be correct for alacritty, should return here
 
-        self.tinywl_server.grabbed_view = self
-        self.tinywl_server.cursor_mode = cursor_mode
+        server = self.tinywl_server
+        server.grabbed_view = self
+        server.cursor_mode = cursor_mode
 
+        box = self.xdg_surface.get_geometry()
+        server.grab_geometry_x = box.x
+        server.grab_geometry_y = box.y
+        geometry = FrozenBox(
+            int(self.x) + box.x, int(self.y) + box.y, box.width, box.height
+        )
+        snap_edges = server.snap_edges(self)
+
+        cursor = server._cursor
         if cursor_mode == CursorMode.MOVE:
-            self.tinywl_server.grab_x = self.tinywl_server._cursor.x - self.x
-            self.tinywl_server.grab_y = self.tinywl_server._cursor.y - self.y
+            server.move_resize.begin_move(
+                cursor.x, cursor.y, geometry, snap_edges=snap_edges
+            )
         elif cursor_mode == CursorMode.RESIZE:
-            box = self.xdg_surface.get_geometry()
-
-            border_x = self.x + box.x + (box.width if edges & Edges.RIGHT else 0)
-            border_y = self.y + box.y + (box.height if edges & Edges.BOTTOM else 0)
-
-            self.tinywl_server.grab_x = self.tinywl_server._cursor.x - border_x
-            self.tinywl_server.grab_y = self.tinywl_server._cursor.y - border_y
-            self.tinywl_server.grab_geobox = Box(
-                box.x + int(self.x), box.y + int(self.y), box.width, box.height
+            server.move_resize.begin_resize(
+                cursor.x,
+                cursor.y,
+                geometry,
+                edges,
+                constraints=SizeConstraints.from_xdg_toplevel(
+                    self.xdg_surface.toplevel
+                ),
+                snap_edges=snap_edges,
             )
-            self.tinywl_server.resize_edges = edges
 
     def view_at(
         self, layout_x: int, layout_y: int
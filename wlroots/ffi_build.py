@@ -236,11 +236,25 @@ bool wlr_box_empty(const struct wlr_box *box);
 
 void wlr_box_transform(struct wlr_box *dest, const struct wlr_box *box,
     enum wl_output_transform transform, int width, int height);
+
+int wrapped_box_array_find_point(const struct wlr_box *boxes, size_t n,
+    double x, double y);
+void wrapped_box_array_contains_point(const struct wlr_box *boxes, size_t n,
+    double x, double y, bool *dest);
+void wrapped_box_array_closest_point(const struct wlr_box *boxes, size_t n,
+    double x, double y, double *dest);
+void wrapped_box_array_intersection(struct wlr_box *dest,
+    const struct wlr_box *boxes, size_t n, const struct wlr_box *box);
+void wrapped_box_array_area(const struct wlr_box *boxes, size_t n,
+    int64_t *dest);
+bool wrapped_box_array_bounds(const struct wlr_box *boxes, size_t n,
+    struct wlr_box *dest);
 """
 
 # types/wlr_buffer.h
 CDEF += """
 struct wlr_buffer {
+    int width, height;
     ...;
 };
 
@@ -506,6 +520,22 @@ struct wlr_damage_ring {
     struct pixman_region32 current;
     ...;
 };
+
+void wlr_damage_ring_init(struct wlr_damage_ring *ring);
+void wlr_damage_ring_finish(struct wlr_damage_ring *ring);
+
+void wlr_damage_ring_set_bounds(struct wlr_damage_ring *ring,
+    int32_t width, int32_t height);
+
+bool wlr_damage_ring_add(struct wlr_damage_ring *ring,
+    const struct pixman_region32 *damage);
+bool wlr_damage_ring_add_box(struct wlr_damage_ring *ring,
+    const struct wlr_box *box);
+void wlr_damage_ring_add_whole(struct wlr_damage_ring *ring);
+
+void wlr_damage_ring_rotate(struct wlr_damage_ring *ring);
+void wlr_damage_ring_get_buffer_damage(struct wlr_damage_ring *ring,
+    int buffer_age, struct pixman_region32 *damage);
 """
 
 # types/wlr_data_control_v1.h
@@ -780,8 +810,33 @@ struct wlr_gamma_control_manager_v1 {
     void *data;
     ...;
 };
+struct wlr_gamma_control_v1 {
+    struct wl_resource *resource;
+    struct wlr_output *output;
+    struct wlr_gamma_control_manager_v1 *manager;
+    struct wl_list link;
+
+    uint16_t *table;
+    size_t ramp_size;
+
+    void *data;
+    ...;
+};
+
+struct wlr_gamma_control_manager_v1_set_gamma_event {
+    struct wlr_output *output;
+    struct wlr_gamma_control_v1 *control; // may be NULL
+    ...;
+};
+
 struct wlr_gamma_control_manager_v1 *wlr_gamma_control_manager_v1_create(
     struct wl_display *display);
+struct wlr_gamma_control_v1 *wlr_gamma_control_manager_v1_get_control(
+    struct wlr_gamma_control_manager_v1 *manager, struct wlr_output *output);
+bool wlr_gamma_control_v1_apply(struct wlr_gamma_control_v1 *gamma_control,
+    struct wlr_output_state *output_state);
+void wlr_gamma_control_v1_send_failed_and_destroy(
+    struct wlr_gamma_control_v1 *gamma_control);
 """
 
 # types/wlr_input_inhibit_v1.h
@@ -977,6 +1032,8 @@ CDEF += """
 void wlr_keyboard_notify_modifiers(struct wlr_keyboard *keyboard,
     uint32_t mods_depressed, uint32_t mods_latched, uint32_t mods_locked,
     uint32_t group);
+void wlr_keyboard_notify_key(struct wlr_keyboard *keyboard,
+    struct wlr_keyboard_key_event *event);
 """
 
 # types/wlr_linux_dmabuf_v1.h
@@ -1006,6 +1063,10 @@ void wlr_matrix_transform(float mat[static 9],
 void wlr_matrix_project_box(float mat[static 9], const struct wlr_box *box,
     enum wl_output_transform transform, float rotation,
     const float projection[static 9]);
+
+void wrapped_matrix_project_boxes(float (*mats)[9], const struct wlr_box *boxes,
+    size_t n, enum wl_output_transform transform, float rotation,
+    const float projection[static 9]);
 """
 
 # Adapted from /usr/include/pixman-1/pixman.h
@@ -1030,10 +1091,65 @@ struct pixman_box32* pixman_region32_rectangles(struct pixman_region32 *region,
     int *n_rects);
 
 bool pixman_region32_not_empty(struct pixman_region32 *region);
+
+typedef enum {
+    PIXMAN_REGION_OUT,
+    PIXMAN_REGION_IN,
+    PIXMAN_REGION_PART
+} pixman_region_overlap_t;
+
+void pixman_region32_init_with_extents(struct pixman_region32 *region,
+    const struct pixman_box32 *extents);
+bool pixman_region32_init_rects(struct pixman_region32 *region,
+    const struct pixman_box32 *boxes, int count);
+
+bool pixman_region32_copy(struct pixman_region32 *dest,
+    struct pixman_region32 *source);
+bool pixman_region32_union(struct pixman_region32 *new_reg,
+    struct pixman_region32 *reg1, struct pixman_region32 *reg2);
+bool pixman_region32_union_rect(struct pixman_region32 *dest,
+    struct pixman_region32 *source, int x, int y,
+    unsigned int width, unsigned int height);
+bool pixman_region32_intersect(struct pixman_region32 *new_reg,
+    struct pixman_region32 *reg1, struct pixman_region32 *reg2);
+bool pixman_region32_intersect_rect(struct pixman_region32 *dest,
+    struct pixman_region32 *source, int x, int y,
+    unsigned int width, unsigned int height);
+bool pixman_region32_subtract(struct pixman_region32 *reg_d,
+    struct pixman_region32 *reg_m, struct pixman_region32 *reg_s);
+bool pixman_region32_inverse(struct pixman_region32 *new_reg,
+    struct pixman_region32 *reg1, const struct pixman_box32 *inv_rect);
+void pixman_region32_translate(struct pixman_region32 *region, int x, int y);
+
+bool pixman_region32_contains_point(struct pixman_region32 *region,
+    int x, int y, struct pixman_box32 *box);
+pixman_region_overlap_t pixman_region32_contains_rectangle(
+    struct pixman_region32 *region, const struct pixman_box32 *prect);
+struct pixman_box32 *pixman_region32_extents(struct pixman_region32 *region);
+int pixman_region32_n_rects(struct pixman_region32 *region);
+bool pixman_region32_equal(struct pixman_region32 *region1,
+    struct pixman_region32 *region2);
+
+void pixman_region32_reset(struct pixman_region32 *region,
+    const struct pixman_box32 *box);
+void pixman_region32_clear(struct pixman_region32 *region);
 """
 
 # types/wlr_output.h
 CDEF += """
+enum wlr_output_adaptive_sync_status {
+    WLR_OUTPUT_ADAPTIVE_SYNC_DISABLED,
+    WLR_OUTPUT_ADAPTIVE_SYNC_ENABLED,
+};
+
+enum wlr_output_present_flag {
+    WLR_OUTPUT_PRESENT_VSYNC,
+    WLR_OUTPUT_PRESENT_HW_CLOCK,
+    WLR_OUTPUT_PRESENT_HW_COMPLETION,
+    WLR_OUTPUT_PRESENT_ZERO_COPY,
+    ...
+};
+
 struct wlr_output_mode {
     int32_t width, height;
     int32_t refresh; // mHz
@@ -1042,7 +1158,22 @@ struct wlr_output_mode {
     ...;
 };
 
+enum wlr_output_state_field {
+    WLR_OUTPUT_STATE_BUFFER,
+    WLR_OUTPUT_STATE_DAMAGE,
+    WLR_OUTPUT_STATE_MODE,
+    WLR_OUTPUT_STATE_ENABLED,
+    WLR_OUTPUT_STATE_SCALE,
+    WLR_OUTPUT_STATE_TRANSFORM,
+    WLR_OUTPUT_STATE_ADAPTIVE_SYNC_ENABLED,
+    WLR_OUTPUT_STATE_GAMMA_LUT,
+    WLR_OUTPUT_STATE_RENDER_FORMAT,
+    WLR_OUTPUT_STATE_SUBPIXEL,
+    ...
+};
+
 struct wlr_output_state {
+    uint32_t committed; // enum wlr_output_state_field
     bool enabled;
     float scale;
     enum wl_output_transform transform;
@@ -1131,6 +1262,17 @@ struct wlr_output_event_request_state {
     ...;
 };
 
+struct wlr_output_event_present {
+    struct wlr_output *output;
+    uint32_t commit_seq;
+    bool presented;
+    struct timespec *when;
+    unsigned seq;
+    int refresh; // nsec
+    uint32_t flags; // enum wlr_output_present_flag
+    ...;
+};
+
 void wlr_output_enable(struct wlr_output *output, bool enable);
 void wlr_output_create_global(struct wlr_output *output);
 void wlr_output_destroy_global(struct wlr_output *output);
@@ -1149,6 +1291,8 @@ void wlr_output_set_transform(struct wlr_output *output,
 void wlr_output_enable_adaptive_sync(struct wlr_output *output, bool enabled);
 void wlr_output_set_scale(struct wlr_output *output, float scale);
 
+void wlr_output_schedule_frame(struct wlr_output *output);
+
 bool wlr_output_attach_render(struct wlr_output *output, int *buffer_age);
 void wlr_output_transformed_resolution(struct wlr_output *output,
     int *width, int *height);
@@ -1181,6 +1325,10 @@ void wlr_output_state_set_render_format(struct wlr_output_state *state,
     uint32_t format);
 void wlr_output_state_set_subpixel(struct wlr_output_state *state,
     enum wl_output_subpixel subpixel);
+bool wlr_output_state_set_gamma_lut(struct wlr_output_state *state,
+    size_t ramp_size, const uint16_t *r, const uint16_t *g, const uint16_t *b);
+
+size_t wlr_output_get_gamma_size(struct wlr_output *output);
 
 void wlr_output_render_software_cursors(struct wlr_output *output,
     struct pixman_region32 *damage);
@@ -1206,6 +1354,23 @@ struct wlr_output_layout {
     void *data;
     ...;
 };
+
+struct wlr_output_layout_output {
+    struct wlr_output_layout *layout;
+
+    struct wlr_output *output;
+
+    int x, y;
+    struct wl_list link;
+
+    bool auto_configured;
+
+    struct {
+        struct wl_signal destroy;
+    } events;
+    ...;
+};
+
 struct wlr_output_layout *wlr_output_layout_create(void);
 void wlr_output_layout_destroy(struct wlr_output_layout *layout);
 
@@ -2956,6 +3121,14 @@ void wrapped_log_init(enum wlr_log_importance verbosity, wrapped_log_func_t call
 CDEF += """
 void wlr_region_transform(struct pixman_region32 *dst, struct pixman_region32 *src,
     enum wl_output_transform transform, int width, int height);
+void wlr_region_scale(struct pixman_region32 *dst, const struct pixman_region32 *src,
+    float scale);
+void wlr_region_scale_xy(struct pixman_region32 *dst,
+    const struct pixman_region32 *src, float scale_x, float scale_y);
+void wlr_region_expand(struct pixman_region32 *dst, const struct pixman_region32 *src,
+    int distance);
+void wlr_region_rotated_bounds(struct pixman_region32 *dst,
+    const struct pixman_region32 *src, float rotation, int ox, int oy);
 """
 
 # backend/headless.h
@@ -3069,6 +3242,91 @@ void wrapped_log_init(enum wlr_log_importance verbosity, wrapped_log_func_t call
         wlr_log_init(verbosity, wrapped_log_callback);
     }
 }
+
+int wrapped_box_array_find_point(const struct wlr_box *boxes, size_t n,
+    double x, double y)
+{
+    for (size_t i = 0; i < n; i++) {
+        if (wlr_box_contains_point(&boxes[i], x, y)) {
+            return i;
+        }
+    }
+    return -1;
+}
+
+void wrapped_box_array_contains_point(const struct wlr_box *boxes, size_t n,
+    double x, double y, bool *dest)
+{
+    for (size_t i = 0; i < n; i++) {
+        dest[i] = wlr_box_contains_point(&boxes[i], x, y);
+    }
+}
+
+void wrapped_box_array_closest_point(const struct wlr_box *boxes, size_t n,
+    double x, double y, double *dest)
+{
+    for (size_t i = 0; i < n; i++) {
+        wlr_box_closest_point(&boxes[i], x, y, &dest[2 * i], &dest[2 * i + 1]);
+    }
+}
+
+void wrapped_box_array_intersection(struct wlr_box *dest,
+    const struct wlr_box *boxes, size_t n, const struct wlr_box *box)
+{
+    for (size_t i = 0; i < n; i++) {
+        wlr_box_intersection(&dest[i], &boxes[i], box);
+    }
+}
+
+void wrapped_box_array_area(const struct wlr_box *boxes, size_t n,
+    int64_t *dest)
+{
+    for (size_t i = 0; i < n; i++) {
+        dest[i] = wlr_box_empty(&boxes[i]) ?
+            0 : (int64_t)boxes[i].width * boxes[i].height;
+    }
+}
+
+bool wrapped_box_array_bounds(const struct wlr_box *boxes, size_t n,
+    struct wlr_box *dest)
+{
+    bool found = false;
+    int x1 = 0, y1 = 0, x2 = 0, y2 = 0;
+    for (size_t i = 0; i < n; i++) {
+        const struct wlr_box *box = &boxes[i];
+        if (wlr_box_empty(box)) {
+            continue;
+        }
+        if (!found || box->x < x1) {
+            x1 = box->x;
+        }
+        if (!found || box->y < y1) {
+            y1 = box->y;
+        }
+        if (!found || box->x + box->width > x2) {
+            x2 = box->x + box->width;
+        }
+        if (!found || box->y + box->height > y2) {
+            y2 = box->y + box->height;
+        }
+        found = true;
+    }
+    dest->x = x1;
+    dest->y = y1;
+    dest->width = x2 - x1;
+    dest->height = y2 - y1;
+    return found;
+}
+
+void wrapped_matrix_project_boxes(float (*mats)[9], const struct wlr_box *boxes,
+    size_t n, enum wl_output_transform transform, float rotation,
+    const float projection[static 9])
+{
+    for (size_t i = 0; i < n; i++) {
+        wlr_matrix_project_box(mats[i], &boxes[i], transform, rotation,
+            projection);
+    }
+}
 """
 
 # types//wlr_layer_shell_v1.h
@@ -9,7 +9,7 @@ from pywayland.server import Display
 
 from wlroots import Ptr, ffi, lib
 from wlroots.backend import Backend
-from wlroots.util.box import Box
+from wlroots.util.box import Box, FrozenBox
 from wlroots.wlr_types import Matrix, Texture
 
 ColorType = type[list[float] | tuple[float] | ffi.CData]
@@ -80,13 +80,15 @@ class Renderer(Ptr):
             self._ptr, texture._ptr, matrix._ptr, alpha
         )
 
-    def render_rect(self, box: Box, color: ColorType, projection: Matrix) -> None:
+    def render_rect(
+        self, box: Box | FrozenBox, color: ColorType, projection: Matrix
+    ) -> None:
         """Renders a solid rectangle in the specified color."""
         if not isinstance(color, ffi.CData):
             color = ffi.new("float[4]", color)
         lib.wlr_render_rect(self._ptr, box._ptr, color, projection._ptr)
 
-    def scissor(self, box: Box | None) -> None:
+    def scissor(self, box: Box | FrozenBox | None) -> None:
         """
         Defines a scissor box. Only pixels that lie within the scissor box can be
         modified by drawing functions. Providing a NULL `box` disables the scissor
@@ -0,0 +1,25 @@
+# Copyright (c) 2026
+
+from __future__ import annotations
+
+from typing import Any
+
+# NumPy is optional, the modules using it fall back to pure Python or raise
+# ImportError from `require_numpy` when it is not installed
+try:
+    import numpy as _numpy
+
+    np: Any = _numpy
+except ImportError:
+    np = None
+
+
+def require_numpy(feature: str) -> Any:
+    """The numpy module, raising ImportError if it is not installed
+
+    :param feature:
+        The name of the function requiring NumPy, for the error message.
+    """
+    if np is None:
+        raise ImportError(f"NumPy is required for {feature}")
+    return np
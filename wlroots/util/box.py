@@ -3,10 +3,16 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+import math
+from collections.abc import Callable, Iterable, Iterator
 from typing import Any
 
 from wlroots import ffi, lib
+from wlroots.util._numpy import require_numpy
+
+# As in wlr_box_closest_point, the closest point is this far inside the
+# exclusive right and bottom edges
+_EDGE_EPSILON = 1 / 65536
 
 
 def _int_getter(attr: str) -> Callable[..., int]:
@@ -37,6 +43,8 @@ class Box:
             self._ptr = ffi.new("struct wlr_box *")
         else:
             self._ptr = ptr
+        # The cdata owning the memory of the box, when it is a view into it
+        self._owner: ffi.CData | None = None
 
         if x is not None:
             self.x = x
@@ -62,3 +70,267 @@ class Box:
 
     def contains_point(self, x: float, y: float) -> bool:
         return lib.wlr_box_contains_point(self._ptr, x, y)
+
+
+class FrozenBox:
+    """An immutable box, represented by a coordinate and dimensions
+
+    Unlike `Box`, the coordinate and dimensions are plain Python attributes, so
+    creating boxes and doing arithmetic with them doesn't touch cdata. The
+    `struct wlr_box` is only allocated the first time the box is passed to
+    wlroots, and is then reused. Frozen boxes are hashable and can be passed
+    anywhere a `Box` is only read by wlroots.
+    """
+
+    __slots__ = ("_cdata", "height", "width", "x", "y")
+
+    x: int
+    y: int
+    width: int
+    height: int
+    _cdata: ffi.CData | None
+
+    def __init__(self, x: int = 0, y: int = 0, width: int = 0, height: int = 0) -> None:
+        object.__setattr__(self, "x", x)
+        object.__setattr__(self, "y", y)
+        object.__setattr__(self, "width", width)
+        object.__setattr__(self, "height", height)
+        object.__setattr__(self, "_cdata", None)
+
+    @classmethod
+    def from_box(cls, box: Box) -> FrozenBox:
+        """Copy the values of a `Box`"""
+        ptr = box._ptr
+        return cls(ptr.x, ptr.y, ptr.width, ptr.height)
+
+    def to_box(self) -> Box:
+        """A mutable copy of the box"""
+        return Box(self.x, self.y, self.width, self.height)
+
+    @property
+    def _ptr(self) -> ffi.CData:
+        cdata = self._cdata
+        if cdata is None:
+            cdata = ffi.new(
+                "struct wlr_box *",
+                {"x": self.x, "y": self.y, "width": self.width, "height": self.height},
+            )
+            object.__setattr__(self, "_cdata", cdata)
+        return cdata
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"FrozenBox is immutable, cannot set {name}")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"FrozenBox is immutable, cannot delete {name}")
+
+    def __iter__(self) -> Iterator[int]:
+        yield self.x
+        yield self.y
+        yield self.width
+        yield self.height
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FrozenBox):
+            return NotImplemented
+        return (
+            self.x == other.x
+            and self.y == other.y
+            and self.width == other.width
+            and self.height == other.height
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.x, self.y, self.width, self.height))
+
+    def __repr__(self) -> str:
+        return f"FrozenBox({self.x}, {self.y}, {self.width}, {self.height})"
+
+    @property
+    def empty(self) -> bool:
+        return self.width <= 0 or self.height <= 0
+
+    @property
+    def area(self) -> int:
+        return 0 if self.empty else self.width * self.height
+
+    def translate(self, dx: int, dy: int) -> FrozenBox:
+        return FrozenBox(self.x + dx, self.y + dy, self.width, self.height)
+
+    def contains_point(self, x: float, y: float) -> bool:
+        return (
+            not self.empty
+            and self.x <= x < self.x + self.width
+            and self.y <= y < self.y + self.height
+        )
+
+    def closest_point(self, x: float, y: float) -> tuple[float, float]:
+        """The point of the box closest to the given point
+
+        The coordinates are NaN if the box is empty, as with `Box`.
+        """
+        if self.empty:
+            return math.nan, math.nan
+        # The right and bottom edges are exclusive
+        return (
+            min(max(x, self.x), self.x + self.width - _EDGE_EPSILON),
+            min(max(y, self.y), self.y + self.height - _EDGE_EPSILON),
+        )
+
+    def intersection(self, other: FrozenBox) -> FrozenBox | None:
+        """The intersection of the boxes, None if they don't intersect"""
+        if self.empty or other.empty:
+            return None
+        x1 = max(self.x, other.x)
+        y1 = max(self.y, other.y)
+        x2 = min(self.x + self.width, other.x + other.width)
+        y2 = min(self.y + self.height, other.y + other.height)
+        if x2 <= x1 or y2 <= y1:
+            return None
+        return FrozenBox(x1, y1, x2 - x1, y2 - y1)
+
+    def union(self, other: FrozenBox) -> FrozenBox:
+        """The bounding box of both boxes, ignoring empty boxes"""
+        if other.empty:
+            return self
+        if self.empty:
+            return other
+        x1 = min(self.x, other.x)
+        y1 = min(self.y, other.y)
+        x2 = max(self.x + self.width, other.x + other.width)
+        y2 = max(self.y + self.height, other.y + other.height)
+        return FrozenBox(x1, y1, x2 - x1, y2 - y1)
+
+
+class BoxArray:
+    def __init__(
+        self, boxes: Iterable[Box | FrozenBox | tuple[int, int, int, int]] = ()
+    ) -> None:
+        """A contiguous array of boxes, backed by a `struct wlr_box[]`
+
+        The geometry queries run over all boxes in a single call into C, and
+        the boxes can be viewed as a `memoryview` or a NumPy array of shape
+        (n, 4), holding x, y, width and height, without copying.
+
+        :param boxes:
+            The boxes to copy into the array, either as `Box`, `FrozenBox`
+            or (x, y, width, height) tuples.
+        """
+        boxes = list(boxes)
+        self._ptr = ffi.new("struct wlr_box[]", len(boxes))
+        for i, box in enumerate(boxes):
+            self[i] = box
+
+    @classmethod
+    def zeros(cls, size: int) -> BoxArray:
+        """An array of the given number of empty boxes"""
+        box_array = cls()
+        box_array._ptr = ffi.new("struct wlr_box[]", size)
+        return box_array
+
+    def __len__(self) -> int:
+        return len(self._ptr)
+
+    def _index(self, index: int) -> int:
+        if index < 0:
+            index += len(self._ptr)
+        if not 0 <= index < len(self._ptr):
+            raise IndexError("BoxArray index out of range")
+        return index
+
+    def __getitem__(self, index: int) -> Box:
+        """The box at the index, a view into the array rather than a copy"""
+        box = Box(ptr=self._ptr + self._index(index))
+        box._owner = self._ptr
+        return box
+
+    def __setitem__(
+        self, index: int, box: Box | FrozenBox | tuple[int, int, int, int]
+    ) -> None:
+        index = self._index(index)
+        if isinstance(box, Box):
+            self._ptr[index] = box._ptr[0]
+        else:
+            box_ptr = self._ptr[index]
+            box_ptr.x, box_ptr.y, box_ptr.width, box_ptr.height = box
+
+    def __iter__(self) -> Iterator[Box]:
+        for i in range(len(self._ptr)):
+            yield self[i]
+
+    def __repr__(self) -> str:
+        boxes = ", ".join(
+            f"({box.x}, {box.y}, {box.width}, {box.height})" for box in self._ptr
+        )
+        return f"BoxArray([{boxes}])"
+
+    def _buffer(self) -> ffi.buffer:
+        if ffi.sizeof("struct wlr_box") != 4 * ffi.sizeof("int"):
+            raise TypeError("struct wlr_box has an unexpected layout")
+        return ffi.buffer(self._ptr)
+
+    def as_memoryview(self) -> memoryview:
+        """A writable view of the boxes, of shape (n, 4) and int format
+
+        The view of an empty array is one-dimensional, as memoryviews can't
+        have zeros in their shape.
+        """
+        view = memoryview(self._buffer()).cast("B")
+        if not len(self._ptr):
+            return view.cast("i")
+        return view.cast("i", (len(self._ptr), 4))
+
+    def as_numpy(self) -> Any:
+        """A writable NumPy array of the boxes, of shape (n, 4)
+
+        Raises ImportError if NumPy is not installed.
+        """
+        np = require_numpy("BoxArray.as_numpy")
+        return np.frombuffer(self._buffer(), dtype=np.intc).reshape(-1, 4)
+
+    def find_point(self, x: float, y: float) -> int | None:
+        """The index of the first box containing the point, if any"""
+        index = lib.wrapped_box_array_find_point(self._ptr, len(self._ptr), x, y)
+        return None if index < 0 else index
+
+    def contains_point(self, x: float, y: float) -> memoryview[bool]:
+        """Whether each box contains the point, as a view of bools"""
+        dest = ffi.new("bool[]", len(self._ptr))
+        lib.wrapped_box_array_contains_point(self._ptr, len(self._ptr), x, y, dest)
+        return memoryview(ffi.buffer(dest)).cast("?")
+
+    def closest_point(self, x: float, y: float) -> memoryview[float]:
+        """The point of each box closest to the point, of shape (n, 2)
+
+        The coordinates are NaN for empty boxes.
+        """
+        dest = ffi.new("double[]", 2 * len(self._ptr))
+        lib.wrapped_box_array_closest_point(self._ptr, len(self._ptr), x, y, dest)
+        view = memoryview(ffi.buffer(dest)).cast("B")
+        if not len(self._ptr):
+            return view.cast("d")
+        return view.cast("d", (len(self._ptr), 2))
+
+    def intersect(self, box: Box | FrozenBox) -> BoxArray:
+        """The intersection of each box with the given box
+
+        Boxes not intersecting the given box are empty in the result.
+        """
+        result = BoxArray.zeros(len(self._ptr))
+        lib.wrapped_box_array_intersection(
+            result._ptr, self._ptr, len(self._ptr), box._ptr
+        )
+        return result
+
+    def union(self) -> Box | None:
+        """The bounding box of the non-empty boxes, None if there are none"""
+        box = Box()
+        if not lib.wrapped_box_array_bounds(self._ptr, len(self._ptr), box._ptr):
+            return None
+        return box
+
+    def area(self) -> memoryview:
+        """The area of each box, zero for empty boxes"""
+        dest = ffi.new("int64_t[]", len(self._ptr))
+        lib.wrapped_box_array_area(self._ptr, len(self._ptr), dest)
+        return memoryview(ffi.buffer(dest)).cast("q")
@@ -0,0 +1,74 @@
+# Copyright (c) 2026
+
+from __future__ import annotations
+
+from typing import NamedTuple
+
+
+def fourcc_code(code: str) -> int:
+    """The DRM format of a four character code, as with fourcc_code in drm_fourcc.h"""
+    if len(code) != 4:
+        raise ValueError(f"A fourcc code has four characters, got {code!r}")
+    a, b, c, d = (ord(char) for char in code)
+    return a | (b << 8) | (c << 16) | (d << 24)
+
+
+def fourcc_to_str(fmt: int) -> str:
+    """The four character code of a DRM format"""
+    return "".join(chr((fmt >> shift) & 0xFF) for shift in (0, 8, 16, 24))
+
+
+class DrmFormatInfo(NamedTuple):
+    """The memory layout of a single-plane DRM format
+
+    :param fourcc:
+        The DRM format.
+    :param name:
+        The name of the format, as in drm_fourcc.h without its DRM_FORMAT_
+        prefix.
+    :param bytes_per_pixel:
+        The size of a pixel.
+    :param has_alpha:
+        Whether the format has an alpha channel.
+    """
+
+    fourcc: int
+    name: str
+    bytes_per_pixel: int
+    has_alpha: bool
+
+
+_FORMATS = {
+    info.fourcc: info
+    for info in (
+        DrmFormatInfo(fourcc_code(code), name, bytes_per_pixel, has_alpha)
+        for code, name, bytes_per_pixel, has_alpha in (
+            ("R8  ", "R8", 1, False),
+            ("RG16", "RGB565", 2, False),
+            ("BG16", "BGR565", 2, False),
+            ("RG24", "RGB888", 3, False),
+            ("BG24", "BGR888", 3, False),
+            ("XR24", "XRGB8888", 4, False),
+            ("XB24", "XBGR8888", 4, False),
+            ("RX24", "RGBX8888", 4, False),
+            ("BX24", "BGRX8888", 4, False),
+            ("AR24", "ARGB8888", 4, True),
+            ("AB24", "ABGR8888", 4, True),
+            ("RA24", "RGBA8888", 4, True),
+            ("BA24", "BGRA8888", 4, True),
+            ("XR30", "XRGB2101010", 4, False),
+            ("XB30", "XBGR2101010", 4, False),
+            ("AR30", "ARGB2101010", 4, True),
+            ("AB30", "ABGR2101010", 4, True),
+            ("XB48", "XBGR16161616", 8, False),
+            ("AB48", "ABGR16161616", 8, True),
+            ("XB4H", "XBGR16161616F", 8, False),
+            ("AB4H", "ABGR16161616F", 8, True),
+        )
+    )
+}
+
+
+def drm_format_info(fmt: int) -> DrmFormatInfo | None:
+    """The memory layout of a DRM format, None if the format is not known"""
+    return _FORMATS.get(fmt)
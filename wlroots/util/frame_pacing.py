@@ -0,0 +1,387 @@
+# Copyright (c) 2026
+
+from __future__ import annotations
+
+import enum
+import time
+from collections import deque
+from typing import TYPE_CHECKING
+
+from pywayland.server import Listener
+
+from wlroots.util.clock import Timespec
+from wlroots.wlr_types.output import OutputAdaptiveSyncStatus
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from pywayland.server import Display
+    from pywayland.server.eventloop import EventSource
+
+    from wlroots.wlr_types import Output, SceneOutput, Surface
+    from wlroots.wlr_types.output import OutputEventPresent
+
+# Lower bound of the refresh range used when no minimum is given, this is
+# comfortably above the floor of common VRR panels.
+DEFAULT_MIN_REFRESH_HZ = 30.0
+
+
+class FramePacingMode(enum.Enum):
+    VBLANK = enum.auto()
+    SURFACE_COMMIT = enum.auto()
+
+
+class FramePacer:
+    def __init__(
+        self,
+        display: Display,
+        scene_output: SceneOutput,
+        output: Output,
+        *,
+        min_refresh_hz: float | None = None,
+        max_refresh_hz: float | None = None,
+    ) -> None:
+        """Drive the commits of a scene output, adapting to variable refresh rate
+
+        By default, the scene output is rendered and committed on every
+        `frame` event of the output (vblank-driven pacing). When adaptive sync
+        is enabled on the output and a fullscreen surface has been set with
+        `set_fullscreen_surface`, the scene output is instead committed as soon
+        as the surface commits a new buffer, such that the refresh of the
+        output follows the client.
+
+        In that mode, commits are never issued faster than `max_refresh_hz`,
+        and if the client doesn't commit for longer than the period of
+        `min_refresh_hz`, a commit is issued anyway so the output keeps
+        refreshing.
+
+        :param display:
+            The display whose event loop is used for the pacing timer.
+        :param scene_output:
+            The scene output to render and commit.
+        :param output:
+            The output backing the scene output.
+        :param min_refresh_hz:
+            The lowest refresh rate to maintain, defaults to 30 Hz.
+        :param max_refresh_hz:
+            The highest refresh rate to commit at, defaults to the refresh
+            rate of the current mode of the output.
+        """
+        self._scene_output = scene_output
+        self._output = output
+        self._fullscreen_surface: Surface | None = None
+
+        if min_refresh_hz is None:
+            min_refresh_hz = DEFAULT_MIN_REFRESH_HZ
+        if max_refresh_hz is None and output.refresh_mhz > 0:
+            max_refresh_hz = output.refresh_mhz / 1000
+        if max_refresh_hz is not None and max_refresh_hz < min_refresh_hz:
+            raise ValueError(
+                f"Maximum refresh rate ({max_refresh_hz} Hz) must not be lower than the minimum refresh rate ({min_refresh_hz} Hz)"
+            )
+        self._max_interval = 1 / min_refresh_hz
+        self._min_interval = 1 / max_refresh_hz if max_refresh_hz else 0.0
+
+        self._last_commit = 0.0
+        self._commit_pending = False
+        self._suspended = False
+
+        self._timer: EventSource | None = display.get_event_loop().add_timer(
+            self._timer_callback, None
+        )
+
+        self._frame_listener = Listener(self._on_frame)
+        self._destroy_listener = Listener(self._on_output_destroy)
+        output.frame_event.add(self._frame_listener)
+        output.destroy_event.add(self._destroy_listener)
+
+        self._surface_commit_listener: Listener | None = None
+        self._surface_destroy_listener: Listener | None = None
+
+    @property
+    def mode(self) -> FramePacingMode:
+        """The pacing mode currently in effect"""
+        if (
+            self._fullscreen_surface is not None
+            and self._output.adaptive_sync_status == OutputAdaptiveSyncStatus.ENABLED
+        ):
+            return FramePacingMode.SURFACE_COMMIT
+        return FramePacingMode.VBLANK
+
+    def set_fullscreen_surface(self, surface: Surface | None) -> None:
+        """Set the surface whose commits pace the output
+
+        Passing None falls back to vblank-driven pacing.
+        """
+        if surface == self._fullscreen_surface:
+            return
+
+        self._remove_surface_listeners()
+        self._fullscreen_surface = surface
+        self._commit_pending = False
+        if surface is None:
+            return
+
+        self._surface_commit_listener = Listener(self._on_surface_commit)
+        self._surface_destroy_listener = Listener(self._on_surface_destroy)
+        surface.commit_event.add(self._surface_commit_listener)
+        surface.destroy_event.add(self._surface_destroy_listener)
+
+    @property
+    def suspended(self) -> bool:
+        """Whether pacing is suspended, e.g. because the output is powered off"""
+        return self._suspended
+
+    def suspend(self) -> None:
+        """Stop committing the scene output until `resume` is called"""
+        self._suspended = True
+        self._commit_pending = False
+        if self._timer is not None:
+            self._timer.timer_update(0)
+
+    def resume(self) -> None:
+        """Resume committing the scene output"""
+        self._suspended = False
+
+    def destroy(self) -> None:
+        """Stop pacing the scene output and release all resources"""
+        self._remove_surface_listeners()
+        self._fullscreen_surface = None
+        self._frame_listener.remove()
+        self._destroy_listener.remove()
+        if self._timer is not None:
+            self._timer.remove()
+            self._timer = None
+
+    def _remove_surface_listeners(self) -> None:
+        if self._surface_commit_listener is not None:
+            self._surface_commit_listener.remove()
+            self._surface_commit_listener = None
+        if self._surface_destroy_listener is not None:
+            self._surface_destroy_listener.remove()
+            self._surface_destroy_listener = None
+
+    def _commit(self) -> None:
+        self._commit_pending = False
+        self._last_commit = time.monotonic()
+        self._scene_output.commit()
+        self._scene_output.send_frame_done(Timespec.get_monotonic_time())
+
+    def _arm_timer(self, delay: float) -> None:
+        if self._timer is not None:
+            # A delay of zero would disarm the timer
+            self._timer.timer_update(max(1, round(delay * 1000)))
+
+    def _on_frame(self, listener: Listener, data: Any) -> None:
+        if self._suspended:
+            return
+
+        if self.mode == FramePacingMode.VBLANK or self._commit_pending:
+            self._commit()
+            return
+
+        # Nothing new from the client, make sure the output is refreshed at
+        # the minimum rate in case it stays idle
+        elapsed = time.monotonic() - self._last_commit
+        self._arm_timer(self._max_interval - elapsed)
+
+    def _on_surface_commit(self, listener: Listener, data: Any) -> None:
+        if self._suspended or self.mode != FramePacingMode.SURFACE_COMMIT:
+            return
+
+        elapsed = time.monotonic() - self._last_commit
+        if self._output.frame_pending:
+            # The frame event will pick up the pending commit
+            self._commit_pending = True
+        elif elapsed < self._min_interval:
+            self._commit_pending = True
+            self._arm_timer(self._min_interval - elapsed)
+        else:
+            self._commit()
+
+    def _timer_callback(self, data: Any) -> int:
+        if self._suspended:
+            return 0
+
+        if self._output.frame_pending:
+            self._commit_pending = True
+        elif self.mode == FramePacingMode.SURFACE_COMMIT or self._commit_pending:
+            self._commit()
+        return 0
+
+    def _on_surface_destroy(self, listener: Listener, data: Any) -> None:
+        self.set_fullscreen_surface(None)
+
+    def _on_output_destroy(self, listener: Listener, data: Any) -> None:
+        self.destroy()
+
+
+class RenderDelayScheduler:
+    def __init__(
+        self,
+        display: Display,
+        scene_output: SceneOutput,
+        output: Output,
+        *,
+        delay_ms: float | None = None,
+        safety_margin_ms: float = 1.5,
+        history: int = 64,
+    ) -> None:
+        """Delay rendering of a scene output until shortly before the next vblank
+
+        Rather than rendering as soon as the `frame` event of the output fires,
+        which happens right after the previous vblank, the scene output is
+        rendered and committed `delay_ms` milliseconds before the predicted
+        next vblank. This gives clients committing late in the refresh cycle
+        a chance to make it into the frame, reducing input-to-photon latency.
+
+        The next vblank is predicted from the `present` events of the output.
+        While no prediction is available, frames are rendered immediately.
+
+        :param display:
+            The display whose event loop is used for the render timer.
+        :param scene_output:
+            The scene output to render and commit.
+        :param output:
+            The output backing the scene output.
+        :param delay_ms:
+            How long before the predicted vblank rendering starts. When None,
+            the delay is tuned automatically from the slowest of the last
+            `history` measured render times plus `safety_margin_ms`.
+        :param safety_margin_ms:
+            The slack added on top of the measured render time when tuning the
+            delay automatically.
+        :param history:
+            The number of render time measurements to tune the delay from.
+        """
+        self._scene_output = scene_output
+        self._output = output
+
+        self.auto_tune = delay_ms is None
+        self._delay = (delay_ms if delay_ms is not None else 0.0) / 1000
+        self._safety_margin = safety_margin_ms / 1000
+        self._render_times: deque[float] = deque(maxlen=history)
+
+        self._next_vblank: float | None = None
+        self._refresh_period = 0.0
+        self._render_scheduled = False
+        self._suspended = False
+
+        self._timer: EventSource | None = display.get_event_loop().add_timer(
+            self._timer_callback, None
+        )
+
+        self._frame_listener = Listener(self._on_frame)
+        self._present_listener = Listener(self._on_present)
+        self._destroy_listener = Listener(self._on_output_destroy)
+        output.frame_event.add(self._frame_listener)
+        output.present_event.add(self._present_listener)
+        output.destroy_event.add(self._destroy_listener)
+
+    @property
+    def delay_ms(self) -> float:
+        """How long before the predicted vblank rendering is started
+
+        Setting the delay disables automatic tuning.
+        """
+        return self._delay * 1000
+
+    @delay_ms.setter
+    def delay_ms(self, delay_ms: float) -> None:
+        self.auto_tune = False
+        self._delay = delay_ms / 1000
+
+    @property
+    def predicted_vblank(self) -> float | None:
+        """The predicted time of the next vblank, in `time.monotonic` seconds"""
+        return self._next_vblank
+
+    @property
+    def suspended(self) -> bool:
+        """Whether rendering is suspended, e.g. because the output is powered off"""
+        return self._suspended
+
+    def suspend(self) -> None:
+        """Stop rendering the scene output until `resume` is called"""
+        self._suspended = True
+        self._render_scheduled = False
+        # The vblank timings are stale once the output wakes up again
+        self._next_vblank = None
+        if self._timer is not None:
+            self._timer.timer_update(0)
+
+    def resume(self) -> None:
+        """Resume rendering the scene output"""
+        self._suspended = False
+
+    def destroy(self) -> None:
+        """Stop scheduling the scene output and release all resources"""
+        self._frame_listener.remove()
+        self._present_listener.remove()
+        self._destroy_listener.remove()
+        if self._timer is not None:
+            self._timer.remove()
+            self._timer = None
+
+    def _render(self) -> None:
+        self._render_scheduled = False
+
+        start = time.monotonic()
+        self._scene_output.commit()
+        end = time.monotonic()
+        self._scene_output.send_frame_done(Timespec.get_monotonic_time())
+
+        self._render_times.append(end - start)
+        if self.auto_tune:
+            self._delay = max(self._render_times) + self._safety_margin
+
+    def _on_frame(self, listener: Listener, data: Any) -> None:
+        if self._suspended or self._render_scheduled:
+            return
+
+        now = time.monotonic()
+        if self._next_vblank is None:
+            self._render()
+            return
+
+        # Can't start rendering earlier than the frame event, which follows
+        # the vblank that was just presented, so the delay is kept below the
+        # refresh period without changing the configured or tuned delay
+        delay = self._delay
+        if self._refresh_period > 0:
+            delay = min(delay, max(self._refresh_period - 1e-3, 0.0))
+
+        # Skip over any vblank we are already too late for
+        next_vblank = self._next_vblank
+        while next_vblank - delay <= now and self._refresh_period > 0:
+            next_vblank += self._refresh_period
+
+        start = next_vblank - delay
+        if start - now < 1e-3 or self._timer is None:
+            self._render()
+        else:
+            self._render_scheduled = True
+            self._timer.timer_update(int((start - now) * 1000))
+
+    def _on_present(self, listener: Listener, event: OutputEventPresent) -> None:
+        when = event.when
+        if not event.presented or when is None:
+            return
+
+        refresh_nsec = event.refresh_nsec
+        if refresh_nsec == 0 and self._output.refresh_mhz > 0:
+            refresh_nsec = 10**12 // self._output.refresh_mhz
+        if refresh_nsec == 0:
+            self._next_vblank = None
+            return
+
+        self._refresh_period = refresh_nsec * 1e-9
+        self._next_vblank = when.time + self._refresh_period
+
+    def _timer_callback(self, data: Any) -> int:
+        if self._render_scheduled:
+            self._render()
+        return 0
+
+    def _on_output_destroy(self, listener: Listener, data: Any) -> None:
+        self.destroy()
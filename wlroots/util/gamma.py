@@ -0,0 +1,321 @@
+# Copyright (c) 2026
+
+from __future__ import annotations
+
+import math
+from array import array
+from typing import TYPE_CHECKING, NamedTuple
+
+from pywayland.server import Listener
+
+from wlroots import ffi
+from wlroots.util._numpy import np
+from wlroots.wlr_types.output import OutputState
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from typing import Any
+
+    from wlroots.wlr_types.gamma_control_v1 import (
+        GammaControlManagerV1,
+        GammaControlManagerV1SetGammaEvent,
+    )
+    from wlroots.wlr_types.output import Output
+
+    Curves = tuple[Sequence[float], Sequence[float], Sequence[float]]
+
+NEUTRAL_TEMPERATURE = 6500
+
+# Marks a gamma table not set by the controller, e.g. by a client
+_EXTERNAL_LUT = object()
+
+
+def temperature_to_rgb(temperature: float) -> tuple[float, float, float]:
+    """The white point of the given color temperature, in Kelvin
+
+    The channels are scaled such that the neutral temperature of 6500K maps to
+    (1.0, 1.0, 1.0), lower temperatures attenuate green and blue.
+    """
+    red, green, blue = _blackbody(temperature)
+    neutral = _blackbody(NEUTRAL_TEMPERATURE)
+    return (
+        min(red / neutral[0], 1.0),
+        min(green / neutral[1], 1.0),
+        min(blue / neutral[2], 1.0),
+    )
+
+
+def _blackbody(temperature: float) -> tuple[float, float, float]:
+    # Approximation of the color of a black body radiator, after Tanner Helland
+    t = min(max(temperature, 1000), 40000) / 100
+    if t <= 66:
+        red = 255.0
+        green = 99.4708025861 * math.log(t) - 161.1195681661
+    else:
+        red = 329.698727446 * (t - 60) ** -0.1332047592
+        green = 288.1221695283 * (t - 60) ** -0.0755148492
+    if t >= 66:
+        blue = 255.0
+    elif t <= 19:
+        blue = 0.0
+    else:
+        blue = 138.5177312231 * math.log(t - 10) - 305.0447927307
+    return (
+        min(max(red, 0.0), 255.0),
+        min(max(green, 0.0), 255.0),
+        min(max(blue, 0.0), 255.0),
+    )
+
+
+class GammaProfile(NamedTuple):
+    """
+    A gamma profile, defining the gamma table of an output.
+
+    `temperature` is the color temperature in Kelvin, `brightness` scales all
+    channels and `gamma`, which must be positive, is the exponent of the
+    transfer curve. `curves` may hold per-channel calibration curves, e.g. from
+    the vcgt tag of an ICC profile, as evenly spaced samples in [0, 1] which
+    are applied last.
+
+    Profiles are hashable, curves should be given as tuples for this reason.
+    """
+
+    temperature: float = NEUTRAL_TEMPERATURE
+    brightness: float = 1.0
+    gamma: float = 1.0
+    curves: Curves | None = None
+
+
+class GammaLut:
+    def __init__(self, size: int, data: Any) -> None:
+        """A gamma table for an output with the given gamma size
+
+        :param size:
+            The number of entries of each ramp.
+        :param data:
+            A buffer of 3 * `size` uint16 values, holding the red, green and
+            blue ramps one after the other.
+        """
+        self.size = size
+        self._data = data
+        self._ptr = ffi.from_buffer("uint16_t[]", data)
+
+    @property
+    def red(self) -> ffi.CData:
+        return self._ptr
+
+    @property
+    def green(self) -> ffi.CData:
+        return self._ptr + self.size
+
+    @property
+    def blue(self) -> ffi.CData:
+        return self._ptr + 2 * self.size
+
+    def as_memoryview(self) -> memoryview:
+        """A view of the three ramps, without copying"""
+        return memoryview(self._data)
+
+    def apply(self, output_state: OutputState) -> bool:
+        """Set the gamma table on the output state"""
+        return output_state.set_gamma_lut(self.size, self.red, self.green, self.blue)
+
+
+def build_gamma_lut(size: int, profile: GammaProfile) -> GammaLut:
+    """Compute the gamma table of the given size for the profile
+
+    The table is computed with NumPy when it is available.
+    """
+    if size <= 0:
+        raise ValueError(f"Gamma size must be positive, got: {size}")
+    if not profile.gamma > 0:
+        raise ValueError(f"Gamma must be positive, got: {profile.gamma}")
+
+    white = temperature_to_rgb(profile.temperature)
+    if np is not None:
+        data = _build_ramps_numpy(size, profile, white)
+    else:
+        data = _build_ramps_python(size, profile, white)
+    return GammaLut(size, data)
+
+
+def _build_ramps_numpy(
+    size: int, profile: GammaProfile, white: tuple[float, float, float]
+) -> Any:
+    base = np.linspace(0.0, 1.0, size) ** (1 / profile.gamma)
+    table = np.empty((3, size), dtype=np.uint16)
+    for channel in range(3):
+        values = base * (white[channel] * profile.brightness)
+        if profile.curves is not None:
+            curve = np.asarray(profile.curves[channel], dtype=np.float64)
+            values = np.interp(values, np.linspace(0.0, 1.0, len(curve)), curve)
+        np.rint(np.clip(values, 0.0, 1.0) * 0xFFFF, out=values)
+        table[channel] = values
+    return table.reshape(-1)
+
+
+def _build_ramps_python(
+    size: int, profile: GammaProfile, white: tuple[float, float, float]
+) -> array[int]:
+    exponent = 1 / profile.gamma
+    step = 1 / (size - 1) if size > 1 else 0.0
+    base = [(i * step) ** exponent for i in range(size)]
+
+    table = array("H")
+    for channel in range(3):
+        scale = white[channel] * profile.brightness
+        values = (value * scale for value in base)
+        if profile.curves is not None:
+            curve = profile.curves[channel]
+            values = (_interp(value, curve) for value in values)
+        table.extend(round(min(max(value, 0.0), 1.0) * 0xFFFF) for value in values)
+    return table
+
+
+def _interp(value: float, curve: Sequence[float]) -> float:
+    last = len(curve) - 1
+    if last <= 0:
+        return curve[0] if curve else value
+    position = min(max(value, 0.0), 1.0) * last
+    index = min(int(position), last - 1)
+    fraction = position - index
+    return curve[index] + (curve[index + 1] - curve[index]) * fraction
+
+
+class _OutputGamma:
+    def __init__(self, output: Output, destroy_listener: Listener) -> None:
+        self.output = output
+        self.destroy_listener = destroy_listener
+        self.profile: GammaProfile | None = None
+        self.applied: GammaLut | object | None = None
+        self.luts: dict[GammaProfile, GammaLut] = {}
+        self.client_controlled = False
+
+
+class GammaController:
+    def __init__(self, manager: GammaControlManagerV1 | None = None) -> None:
+        """Apply gamma profiles to outputs
+
+        The gamma table computed for each output and profile is cached, and is
+        only committed to the output when it differs from the table currently
+        applied.
+
+        If a gamma control manager is given, gamma tables set by clients, such
+        as night light daemons, take precedence over the profile of the output
+        until the client destroys its gamma control.
+
+        :param manager:
+            The gamma control manager to handle client requests for.
+        """
+        self._outputs: dict[ffi.CData, _OutputGamma] = {}
+
+        self._set_gamma_listener: Listener | None = None
+        if manager is not None:
+            self._set_gamma_listener = Listener(self._on_set_gamma)
+            manager.set_gamma_event.add(self._set_gamma_listener)
+
+    def set_profile(self, output: Output, profile: GammaProfile | None) -> bool:
+        """Set the gamma profile of the output
+
+        Setting None resets the gamma table of the output. Returns False if the
+        output rejected the gamma table.
+        """
+        output_gamma = self._get_output_gamma(output)
+        output_gamma.profile = profile
+        if output_gamma.client_controlled:
+            return True
+        return self._apply_profile(output_gamma)
+
+    def get_profile(self, output: Output) -> GammaProfile | None:
+        """Get the gamma profile set on the output"""
+        output_gamma = self._outputs.get(output._ptr)
+        return output_gamma.profile if output_gamma is not None else None
+
+    def get_lut(self, output: Output, profile: GammaProfile) -> GammaLut | None:
+        """Get the gamma table of the profile for the output
+
+        Returns None if the output doesn't support gamma tables.
+        """
+        size = output.get_gamma_size()
+        if size == 0:
+            return None
+
+        output_gamma = self._get_output_gamma(output)
+        lut = output_gamma.luts.get(profile)
+        if lut is None or lut.size != size:
+            lut = build_gamma_lut(size, profile)
+            output_gamma.luts[profile] = lut
+        return lut
+
+    def destroy(self) -> None:
+        """Stop managing the gamma tables of all outputs"""
+        for output_gamma in self._outputs.values():
+            output_gamma.destroy_listener.remove()
+        self._outputs.clear()
+        if self._set_gamma_listener is not None:
+            self._set_gamma_listener.remove()
+            self._set_gamma_listener = None
+
+    def _get_output_gamma(self, output: Output) -> _OutputGamma:
+        output_gamma = self._outputs.get(output._ptr)
+        if output_gamma is None:
+            destroy_listener = Listener(self._on_output_destroy)
+            output.destroy_event.add(destroy_listener)
+            output_gamma = _OutputGamma(output, destroy_listener)
+            self._outputs[output._ptr] = output_gamma
+        return output_gamma
+
+    def _apply_profile(self, output_gamma: _OutputGamma) -> bool:
+        output = output_gamma.output
+        lut = None
+        if output_gamma.profile is not None:
+            lut = self.get_lut(output, output_gamma.profile)
+            if lut is None:
+                return False
+
+        if lut is output_gamma.applied:
+            return True
+
+        state = OutputState()
+        try:
+            if lut is None:
+                # Committing an empty gamma table resets it
+                state.set_gamma_lut(0, ffi.NULL, ffi.NULL, ffi.NULL)
+            elif not lut.apply(state):
+                return False
+            if not output.commit(state):
+                return False
+        finally:
+            state.finish()
+
+        output_gamma.applied = lut
+        return True
+
+    def _on_set_gamma(
+        self, listener: Listener, event: GammaControlManagerV1SetGammaEvent
+    ) -> None:
+        output_gamma = self._get_output_gamma(event.output)
+        control = event.control
+        if control is None:
+            # The client is gone, restore the profile of the output
+            output_gamma.client_controlled = False
+            self._apply_profile(output_gamma)
+            return
+
+        state = OutputState()
+        try:
+            if not control.apply(state) or not output_gamma.output.commit(state):
+                control.send_failed_and_destroy()
+                return
+        finally:
+            state.finish()
+
+        output_gamma.client_controlled = True
+        output_gamma.applied = _EXTERNAL_LUT
+
+    def _on_output_destroy(self, listener: Listener, data: Any) -> None:
+        for key, output_gamma in self._outputs.items():
+            if output_gamma.destroy_listener is listener:
+                del self._outputs[key]
+                listener.remove()
+                break
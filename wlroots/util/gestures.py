@@ -0,0 +1,508 @@
+# Copyright (c) 2026
+
+from __future__ import annotations
+
+import enum
+import math
+from collections import deque
+from typing import TYPE_CHECKING
+
+from pywayland.server import Listener
+
+from wlroots.util.edges import Edges
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any
+
+    from wlroots import ffi
+    from wlroots.util.touch_points import TouchPointRegistry
+    from wlroots.wlr_types import Cursor, Output, PointerGesturesV1, Seat
+    from wlroots.wlr_types.pointer import (
+        PointerHoldBeginEvent,
+        PointerHoldEndEvent,
+        PointerPinchBeginEvent,
+        PointerPinchEndEvent,
+        PointerPinchUpdateEvent,
+        PointerSwipeBeginEvent,
+        PointerSwipeEndEvent,
+        PointerSwipeUpdateEvent,
+    )
+
+    GestureCallback = Callable[["Gesture"], None]
+
+# Only samples this recent are used to estimate the velocity, in ms
+VELOCITY_WINDOW_MSEC = 100
+
+
+class GestureType(enum.Enum):
+    SWIPE = enum.auto()
+    PINCH = enum.auto()
+    HOLD = enum.auto()
+
+
+class GestureSource(enum.Enum):
+    POINTER = enum.auto()
+    TOUCH = enum.auto()
+
+
+class Gesture:
+    """The state of a gesture, from its beginning up to its end
+
+    `dx` and `dy` are the total motion since the beginning of the gesture,
+    `scale` is relative to the beginning and `rotation` is the total rotation
+    in degrees, clockwise.
+    """
+
+    __slots__ = (
+        "_samples",
+        "cancelled",
+        "committed",
+        "dx",
+        "dy",
+        "fingers",
+        "rotation",
+        "scale",
+        "source",
+        "start_time_msec",
+        "time_msec",
+        "type",
+    )
+
+    def __init__(
+        self,
+        gesture_type: GestureType,
+        source: GestureSource,
+        fingers: int,
+        time_msec: int,
+    ) -> None:
+        self.type = gesture_type
+        self.source = source
+        self.fingers = fingers
+        self.start_time_msec = time_msec
+        self.time_msec = time_msec
+        self.dx = 0.0
+        self.dy = 0.0
+        self.scale = 1.0
+        self.rotation = 0.0
+        self.cancelled = False
+        # Whether the gesture met the thresholds of the engine when it ended,
+        # e.g. a swipe far or fast enough to switch workspaces
+        self.committed = False
+        self._samples: deque[tuple[int, float, float]] = deque(maxlen=16)
+        self._samples.append((time_msec, 0.0, 0.0))
+
+    @property
+    def duration_msec(self) -> int:
+        return self.time_msec - self.start_time_msec
+
+    @property
+    def velocity(self) -> tuple[float, float]:
+        """The recent velocity of the gesture, in px/ms"""
+        samples = self._samples
+        last_time, last_x, last_y = samples[-1]
+        for time_msec, x, y in samples:
+            if last_time - time_msec <= VELOCITY_WINDOW_MSEC:
+                break
+        elapsed = last_time - time_msec
+        if elapsed <= 0:
+            return 0.0, 0.0
+        return (last_x - x) / elapsed, (last_y - y) / elapsed
+
+    @property
+    def direction(self) -> Edges:
+        """The edge the gesture moves towards, along its dominant axis"""
+        if self.dx == 0 and self.dy == 0:
+            return Edges.NONE
+        if abs(self.dx) >= abs(self.dy):
+            return Edges.RIGHT if self.dx > 0 else Edges.LEFT
+        return Edges.BOTTOM if self.dy > 0 else Edges.TOP
+
+    def _move(self, time_msec: int, dx: float, dy: float) -> None:
+        self.time_msec = time_msec
+        self.dx += dx
+        self.dy += dy
+        self._samples.append((time_msec, self.dx, self.dy))
+
+
+class _TouchTracking:
+    def __init__(self, registry: TouchPointRegistry) -> None:
+        centroid = registry.centroid()
+        assert centroid is not None
+        self.centroid = centroid
+        self.spread = _spread(registry, centroid)
+        self.angles = {
+            point.touch_id: _angle(point.layout_x, point.layout_y, centroid)
+            for point in registry
+        }
+        self.gesture: Gesture | None = None
+
+
+def _spread(registry: TouchPointRegistry, centroid: tuple[float, float]) -> float:
+    return sum(
+        math.hypot(point.layout_x - centroid[0], point.layout_y - centroid[1])
+        for point in registry
+    ) / len(registry)
+
+
+def _angle(x: float, y: float, centroid: tuple[float, float]) -> float:
+    return math.degrees(math.atan2(y - centroid[1], x - centroid[0]))
+
+
+class GestureEngine:
+    def __init__(
+        self,
+        cursor: Cursor,
+        *,
+        touch_points: TouchPointRegistry | None = None,
+        on_begin: GestureCallback | None = None,
+        on_update: GestureCallback | None = None,
+        on_end: GestureCallback | None = None,
+        min_fingers: int = 3,
+        swipe_distance: float = 200.0,
+        swipe_velocity: float = 0.5,
+        pinch_threshold: float = 0.1,
+        hold_msec: int = 300,
+        touch_slop: float = 16.0,
+        pointer_gestures: PointerGesturesV1 | None = None,
+        seat: Seat | None = None,
+    ) -> None:
+        """Recognize compositor gestures from pointer gesture and touch events
+
+        Swipes, pinches and holds of touchpads with at least `min_fingers`
+        fingers are handled by the compositor, others are forwarded to clients
+        through `pointer_gestures`, if given. With a touch point registry,
+        multi-finger touch gestures are recognized as swipes or pinches too.
+
+        `on_begin` and `on_end` are called as gestures begin and end. Updates
+        are coalesced: `on_update` is called once per frame of the attached
+        outputs with the accumulated state, such that the scene is updated
+        once per frame however many events the device sends. Outputs are
+        attached with `attach_output`, whose frame listener must run before
+        the scene output is committed, i.e. outputs should be attached before
+        the compositor listens to their frame events. Alternatively, `flush`
+        can be called before committing.
+
+        When a gesture ends, `Gesture.committed` tells whether it met the
+        thresholds: a swipe must move at least `swipe_distance` or be flung
+        faster than `swipe_velocity` px/ms along its direction, a pinch must
+        scale by at least `pinch_threshold` and a hold must last `hold_msec`.
+        Touch gestures are recognized as pinches or, once the fingers moved
+        `touch_slop` px, as swipes.
+
+        :param cursor:
+            The cursor whose gesture events are recognized.
+        :param touch_points:
+            The registry of touch points to recognize touch gestures from,
+            created before the engine.
+        :param pointer_gestures:
+            The pointer gestures manager to forward unhandled gestures with.
+        :param seat:
+            The seat to forward unhandled gestures to.
+        """
+        self._on_begin = on_begin
+        self._on_update = on_update
+        self._on_end = on_end
+        self.min_fingers = min_fingers
+        self.swipe_distance = swipe_distance
+        self.swipe_velocity = swipe_velocity
+        self.pinch_threshold = pinch_threshold
+        self.hold_msec = hold_msec
+        self.touch_slop = touch_slop
+        self._pointer_gestures = pointer_gestures
+        self._seat = seat
+
+        self._gesture: Gesture | None = None
+        # Whether the active pointer gesture is forwarded to clients
+        self._forwarding = False
+        self._update_pending = False
+        self._outputs: dict[ffi.CData, tuple[Output, Listener]] = {}
+
+        self._listeners: list[Listener] = []
+        self._listen(cursor.swipe_begin, self._on_swipe_begin)
+        self._listen(cursor.swipe_update, self._on_swipe_update)
+        self._listen(cursor.swipe_end, self._on_swipe_end)
+        self._listen(cursor.pinch_begin, self._on_pinch_begin)
+        self._listen(cursor.pinch_update, self._on_pinch_update)
+        self._listen(cursor.pinch_end, self._on_pinch_end)
+        self._listen(cursor.hold_begin, self._on_hold_begin)
+        self._listen(cursor.hold_end, self._on_hold_end)
+
+        self._touch_points = touch_points
+        self._touch: _TouchTracking | None = None
+        if touch_points is not None:
+            self._listen(cursor.touch_frame_event, self._on_touch_frame)
+            self._listen(cursor.touch_cancel_event, self._on_touch_cancel)
+
+    @property
+    def active(self) -> Gesture | None:
+        """The gesture in progress, if any"""
+        return self._gesture
+
+    def attach_output(self, output: Output) -> None:
+        """Deliver gesture updates on the frames of the output"""
+        if output._ptr in self._outputs:
+            return
+        listener = Listener(self._on_frame)
+        output.frame_event.add(listener)
+        self._outputs[output._ptr] = (output, listener)
+
+    def detach_output(self, output: Output) -> None:
+        """Stop delivering gesture updates on the frames of the output"""
+        entry = self._outputs.pop(output._ptr, None)
+        if entry is not None:
+            entry[1].remove()
+
+    def flush(self) -> None:
+        """Deliver the pending gesture update, if any"""
+        if not self._update_pending:
+            return
+        self._update_pending = False
+        if self._gesture is not None and self._on_update is not None:
+            self._on_update(self._gesture)
+
+    def destroy(self) -> None:
+        """Stop recognizing gestures"""
+        for listener in self._listeners:
+            listener.remove()
+        self._listeners.clear()
+        for _, listener in self._outputs.values():
+            listener.remove()
+        self._outputs.clear()
+        self._gesture = None
+        self._touch = None
+
+    def _listen(self, signal: Any, callback: Callable[[Listener, Any], None]) -> None:
+        listener = Listener(callback)
+        signal.add(listener)
+        self._listeners.append(listener)
+
+    def _begin(self, gesture: Gesture) -> None:
+        self._gesture = gesture
+        self._update_pending = False
+        if self._on_begin is not None:
+            self._on_begin(gesture)
+
+    def _update(self) -> None:
+        if self._update_pending:
+            return
+        self._update_pending = True
+        for output, _ in self._outputs.values():
+            output.schedule_frame()
+
+    def _end(self, cancelled: bool) -> None:
+        gesture = self._gesture
+        if gesture is None:
+            return
+        self.flush()
+        self._gesture = None
+
+        gesture.cancelled = cancelled
+        gesture.committed = not cancelled and self._is_committed(gesture)
+        if self._on_end is not None:
+            self._on_end(gesture)
+
+    def _is_committed(self, gesture: Gesture) -> bool:
+        if gesture.type == GestureType.HOLD:
+            return gesture.duration_msec >= self.hold_msec
+        if gesture.type == GestureType.PINCH:
+            return abs(gesture.scale - 1) >= self.pinch_threshold
+
+        direction = gesture.direction
+        vx, vy = gesture.velocity
+        if direction in (Edges.LEFT, Edges.RIGHT):
+            distance, speed = abs(gesture.dx), vx
+        else:
+            distance, speed = abs(gesture.dy), vy
+        if direction in (Edges.LEFT, Edges.TOP):
+            speed = -speed
+        return distance >= self.swipe_distance or speed >= self.swipe_velocity
+
+    def _on_frame(self, listener: Listener, data: Any) -> None:
+        self.flush()
+
+    # Touchpad gestures
+
+    def _pointer_begin(
+        self, gesture_type: GestureType, fingers: int, time_msec: int
+    ) -> bool:
+        """Begin a pointer gesture, returns False if it is forwarded instead"""
+        self._forwarding = fingers < self.min_fingers or self._gesture is not None
+        if self._forwarding:
+            return False
+        self._begin(Gesture(gesture_type, GestureSource.POINTER, fingers, time_msec))
+        return True
+
+    def _forward_target(self) -> tuple[PointerGesturesV1, Seat] | None:
+        if self._pointer_gestures is None or self._seat is None:
+            return None
+        return self._pointer_gestures, self._seat
+
+    def _on_swipe_begin(
+        self, listener: Listener, event: PointerSwipeBeginEvent
+    ) -> None:
+        if self._pointer_begin(GestureType.SWIPE, event.fingers, event.time_msec):
+            return
+        if forward := self._forward_target():
+            pointer_gestures, seat = forward
+            pointer_gestures.send_swipe_begin(seat, event.time_msec, event.fingers)
+
+    def _on_swipe_update(
+        self, listener: Listener, event: PointerSwipeUpdateEvent
+    ) -> None:
+        if self._forwarding:
+            if forward := self._forward_target():
+                pointer_gestures, seat = forward
+                pointer_gestures.send_swipe_update(
+                    seat, event.time_msec, event.dx, event.dy
+                )
+            return
+        gesture = self._gesture
+        if gesture is None or gesture.source != GestureSource.POINTER:
+            return
+        gesture._move(event.time_msec, event.dx, event.dy)
+        self._update()
+
+    def _on_swipe_end(self, listener: Listener, event: PointerSwipeEndEvent) -> None:
+        if self._forwarding:
+            self._forwarding = False
+            if forward := self._forward_target():
+                pointer_gestures, seat = forward
+                pointer_gestures.send_swipe_end(seat, event.time_msec, event.cancelled)
+            return
+        self._end_pointer(event.time_msec, event.cancelled)
+
+    def _on_pinch_begin(
+        self, listener: Listener, event: PointerPinchBeginEvent
+    ) -> None:
+        if self._pointer_begin(GestureType.PINCH, event.fingers, event.time_msec):
+            return
+        if forward := self._forward_target():
+            pointer_gestures, seat = forward
+            pointer_gestures.send_pinch_begin(seat, event.time_msec, event.fingers)
+
+    def _on_pinch_update(
+        self, listener: Listener, event: PointerPinchUpdateEvent
+    ) -> None:
+        if self._forwarding:
+            if forward := self._forward_target():
+                pointer_gestures, seat = forward
+                pointer_gestures.send_pinch_update(
+                    seat,
+                    event.time_msec,
+                    event.dx,
+                    event.dy,
+                    event.scale,
+                    event.rotation,
+                )
+            return
+        gesture = self._gesture
+        if gesture is None or gesture.source != GestureSource.POINTER:
+            return
+        gesture._move(event.time_msec, event.dx, event.dy)
+        gesture.scale = event.scale
+        gesture.rotation += event.rotation
+        self._update()
+
+    def _on_pinch_end(self, listener: Listener, event: PointerPinchEndEvent) -> None:
+        if self._forwarding:
+            self._forwarding = False
+            if forward := self._forward_target():
+                pointer_gestures, seat = forward
+                pointer_gestures.send_pinch_end(seat, event.time_msec, event.cancelled)
+            return
+        self._end_pointer(event.time_msec, event.cancelled)
+
+    def _on_hold_begin(self, listener: Listener, event: PointerHoldBeginEvent) -> None:
+        if self._pointer_begin(GestureType.HOLD, event.fingers, event.time_msec):
+            return
+        if forward := self._forward_target():
+            pointer_gestures, seat = forward
+            pointer_gestures.send_hold_begin(seat, event.time_msec, event.fingers)
+
+    def _on_hold_end(self, listener: Listener, event: PointerHoldEndEvent) -> None:
+        if self._forwarding:
+            self._forwarding = False
+            if forward := self._forward_target():
+                pointer_gestures, seat = forward
+                pointer_gestures.send_hold_end(seat, event.time_msec, event.cancelled)
+            return
+        self._end_pointer(event.time_msec, event.cancelled)
+
+    def _end_pointer(self, time_msec: int, cancelled: bool) -> None:
+        gesture = self._gesture
+        if gesture is None or gesture.source != GestureSource.POINTER:
+            return
+        gesture.time_msec = time_msec
+        self._end(cancelled)
+
+    # Touch gestures
+
+    def _on_touch_frame(self, listener: Listener, data: Any) -> None:
+        registry = self._touch_points
+        assert registry is not None
+
+        tracking = self._touch
+        if len(registry) < self.min_fingers or (
+            tracking is not None
+            and set(tracking.angles) != {p.touch_id for p in registry}
+        ):
+            # Fingers were lifted or added, which ends the gesture
+            if tracking is not None and tracking.gesture is not None:
+                self._end(cancelled=False)
+            self._touch = None
+            if len(registry) >= self.min_fingers:
+                self._touch = _TouchTracking(registry)
+            return
+
+        if tracking is None:
+            self._touch = _TouchTracking(registry)
+            return
+
+        centroid = registry.centroid()
+        assert centroid is not None
+        time_msec = max(point.time_msec for point in registry)
+        dx = centroid[0] - tracking.centroid[0]
+        dy = centroid[1] - tracking.centroid[1]
+        scale = (
+            _spread(registry, centroid) / tracking.spread if tracking.spread else 1.0
+        )
+        rotation = sum(
+            (
+                _angle(point.layout_x, point.layout_y, centroid)
+                - tracking.angles[point.touch_id]
+                + 180
+            )
+            % 360
+            - 180
+            for point in registry
+        ) / len(registry)
+
+        gesture = tracking.gesture
+        if gesture is None:
+            if self._gesture is not None:
+                # A touchpad gesture is in progress
+                return
+            # Recognize the gesture once the fingers moved far enough
+            if abs(scale - 1) >= self.pinch_threshold:
+                gesture_type = GestureType.PINCH
+            elif math.hypot(dx, dy) >= self.touch_slop:
+                gesture_type = GestureType.SWIPE
+            else:
+                return
+            gesture = Gesture(
+                gesture_type, GestureSource.TOUCH, len(registry), time_msec
+            )
+            tracking.gesture = gesture
+            self._begin(gesture)
+
+        gesture._move(time_msec, dx - gesture.dx, dy - gesture.dy)
+        gesture.scale = scale
+        gesture.rotation = rotation
+        self._update()
+
+    def _on_touch_cancel(self, listener: Listener, data: Any) -> None:
+        tracking = self._touch
+        self._touch = None
+        if tracking is not None and tracking.gesture is not None:
+            self._end(cancelled=True)
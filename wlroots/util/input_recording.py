@@ -0,0 +1,463 @@
+# Copyright (c) 2026
+
+from __future__ import annotations
+
+import enum
+import struct
+import time
+from collections.abc import Callable, Iterable, Iterator
+from typing import TYPE_CHECKING, BinaryIO, NamedTuple
+
+from pywayland.protocol.wayland import WlKeyboard
+from pywayland.server import Listener
+
+from wlroots.wlr_types.cursor import WarpMode
+from wlroots.wlr_types.input_device import ButtonState
+from wlroots.wlr_types.pointer import AxisOrientation, AxisSource
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from pywayland.server import Display, Signal
+    from pywayland.server.eventloop import EventSource
+
+    from wlroots.wlr_types import Cursor, Keyboard, PointerGesturesV1, Seat
+
+MAGIC = b"WLRINPUT"
+VERSION = 1
+
+_FILE_HEADER = struct.Struct("<8sH")
+# Event type and time_msec
+_EVENT_HEADER = struct.Struct("<BI")
+# The largest timeout of an event loop timer, in milliseconds
+_MAX_TIMEOUT_MSEC = 0x7FFFFFFF
+
+
+class InputEventType(enum.IntEnum):
+    MOTION = 1
+    MOTION_ABSOLUTE = 2
+    BUTTON = 3
+    AXIS = 4
+    FRAME = 5
+    TOUCH_DOWN = 6
+    TOUCH_UP = 7
+    TOUCH_MOTION = 8
+    TOUCH_CANCEL = 9
+    TOUCH_FRAME = 10
+    SWIPE_BEGIN = 11
+    SWIPE_UPDATE = 12
+    SWIPE_END = 13
+    PINCH_BEGIN = 14
+    PINCH_UPDATE = 15
+    PINCH_END = 16
+    HOLD_BEGIN = 17
+    HOLD_END = 18
+    KEY = 19
+
+
+_PAYLOADS = {
+    # delta_x, delta_y, unaccel_delta_x, unaccel_delta_y
+    InputEventType.MOTION: struct.Struct("<dddd"),
+    # x, y
+    InputEventType.MOTION_ABSOLUTE: struct.Struct("<dd"),
+    # button, button_state
+    InputEventType.BUTTON: struct.Struct("<IB"),
+    # source, orientation, delta, delta_discrete
+    InputEventType.AXIS: struct.Struct("<BBdi"),
+    InputEventType.FRAME: struct.Struct("<"),
+    # touch_id, x, y
+    InputEventType.TOUCH_DOWN: struct.Struct("<idd"),
+    # touch_id
+    InputEventType.TOUCH_UP: struct.Struct("<i"),
+    # touch_id, x, y
+    InputEventType.TOUCH_MOTION: struct.Struct("<idd"),
+    # touch_id
+    InputEventType.TOUCH_CANCEL: struct.Struct("<i"),
+    InputEventType.TOUCH_FRAME: struct.Struct("<"),
+    # fingers
+    InputEventType.SWIPE_BEGIN: struct.Struct("<I"),
+    # fingers, dx, dy
+    InputEventType.SWIPE_UPDATE: struct.Struct("<Idd"),
+    # cancelled
+    InputEventType.SWIPE_END: struct.Struct("<?"),
+    # fingers
+    InputEventType.PINCH_BEGIN: struct.Struct("<I"),
+    # fingers, dx, dy, scale, rotation
+    InputEventType.PINCH_UPDATE: struct.Struct("<Idddd"),
+    # cancelled
+    InputEventType.PINCH_END: struct.Struct("<?"),
+    # fingers
+    InputEventType.HOLD_BEGIN: struct.Struct("<I"),
+    # cancelled
+    InputEventType.HOLD_END: struct.Struct("<?"),
+    # keycode, key state
+    InputEventType.KEY: struct.Struct("<IB"),
+}
+
+
+class InputEvent(NamedTuple):
+    """A recorded input event
+
+    `values` holds the fields of the event, in the order listed for its type
+    in `_PAYLOADS`.
+    """
+
+    type: InputEventType
+    time_msec: int
+    values: tuple[Any, ...]
+
+
+class InputRecorder:
+    def __init__(self, stream: BinaryIO) -> None:
+        """Record the input events reaching cursors and keyboards
+
+        Events are written to the stream in a compact binary format, which
+        can be read back with `read_input_events` and replayed with
+        `InputReplayer`.
+
+        :param stream:
+            The binary stream to write the recording to.
+        """
+        self._stream = stream
+        self._listeners: list[Listener] = []
+        # Frame events have no timestamp, they are recorded with the timestamp
+        # of the events they group
+        self._last_time_msec = 0
+        self.event_count = 0
+
+        stream.write(_FILE_HEADER.pack(MAGIC, VERSION))
+
+    def _write(self, event_type: InputEventType, time_msec: int, *values: Any) -> None:
+        time_msec &= 0xFFFFFFFF
+        self._stream.write(_EVENT_HEADER.pack(event_type, time_msec))
+        self._stream.write(_PAYLOADS[event_type].pack(*values))
+        self._last_time_msec = time_msec
+        self.event_count += 1
+
+    def _write_frame(self, event_type: InputEventType) -> None:
+        self._write(event_type, self._last_time_msec)
+
+    def _listen(self, signal: Signal, callback: Callable[[Any], None]) -> None:
+        listener = Listener(lambda _listener, data: callback(data))
+        signal.add(listener)
+        self._listeners.append(listener)
+
+    def attach_cursor(self, cursor: Cursor) -> None:
+        """Record the pointer, touch and gesture events of the cursor"""
+        write = self._write
+        self._listen(
+            cursor.motion_event,
+            lambda e: write(
+                InputEventType.MOTION,
+                e.time_msec,
+                e.delta_x,
+                e.delta_y,
+                e.unaccel_delta_x,
+                e.unaccel_delta_y,
+            ),
+        )
+        self._listen(
+            cursor.motion_absolute_event,
+            lambda e: write(InputEventType.MOTION_ABSOLUTE, e.time_msec, e.x, e.y),
+        )
+        self._listen(
+            cursor.button_event,
+            lambda e: write(
+                InputEventType.BUTTON, e.time_msec, e.button, e.button_state
+            ),
+        )
+        self._listen(
+            cursor.axis_event,
+            lambda e: write(
+                InputEventType.AXIS,
+                e.time_msec,
+                e.source,
+                e.orientation,
+                e.delta,
+                e.delta_discrete,
+            ),
+        )
+        self._listen(
+            cursor.frame_event, lambda e: self._write_frame(InputEventType.FRAME)
+        )
+        self._listen(
+            cursor.touch_down_event,
+            lambda e: write(
+                InputEventType.TOUCH_DOWN, e.time_msec, e.touch_id, e.x, e.y
+            ),
+        )
+        self._listen(
+            cursor.touch_up_event,
+            lambda e: write(InputEventType.TOUCH_UP, e.time_msec, e.touch_id),
+        )
+        self._listen(
+            cursor.touch_motion_event,
+            lambda e: write(
+                InputEventType.TOUCH_MOTION, e.time_msec, e.touch_id, e.x, e.y
+            ),
+        )
+        self._listen(
+            cursor.touch_cancel_event,
+            lambda e: write(InputEventType.TOUCH_CANCEL, e.time_msec, e.touch_id),
+        )
+        self._listen(
+            cursor.touch_frame_event,
+            lambda e: self._write_frame(InputEventType.TOUCH_FRAME),
+        )
+        self._listen(
+            cursor.swipe_begin,
+            lambda e: write(InputEventType.SWIPE_BEGIN, e.time_msec, e.fingers),
+        )
+        self._listen(
+            cursor.swipe_update,
+            lambda e: write(
+                InputEventType.SWIPE_UPDATE, e.time_msec, e.fingers, e.dx, e.dy
+            ),
+        )
+        self._listen(
+            cursor.swipe_end,
+            lambda e: write(InputEventType.SWIPE_END, e.time_msec, e.cancelled),
+        )
+        self._listen(
+            cursor.pinch_begin,
+            lambda e: write(InputEventType.PINCH_BEGIN, e.time_msec, e.fingers),
+        )
+        self._listen(
+            cursor.pinch_update,
+            lambda e: write(
+                InputEventType.PINCH_UPDATE,
+                e.time_msec,
+                e.fingers,
+                e.dx,
+                e.dy,
+                e.scale,
+                e.rotation,
+            ),
+        )
+        self._listen(
+            cursor.pinch_end,
+            lambda e: write(InputEventType.PINCH_END, e.time_msec, e.cancelled),
+        )
+        self._listen(
+            cursor.hold_begin,
+            lambda e: write(InputEventType.HOLD_BEGIN, e.time_msec, e.fingers),
+        )
+        self._listen(
+            cursor.hold_end,
+            lambda e: write(InputEventType.HOLD_END, e.time_msec, e.cancelled),
+        )
+
+    def attach_keyboard(self, keyboard: Keyboard) -> None:
+        """Record the key events of the keyboard"""
+        self._listen(
+            keyboard.key_event,
+            lambda e: self._write(InputEventType.KEY, e.time_msec, e.keycode, e.state),
+        )
+
+    def close(self) -> None:
+        """Stop recording and flush the stream
+
+        The stream itself is not closed.
+        """
+        for listener in self._listeners:
+            listener.remove()
+        self._listeners.clear()
+        self._stream.flush()
+
+
+def read_input_events(stream: BinaryIO) -> Iterator[InputEvent]:
+    """Read the events of a recording made by `InputRecorder`"""
+    header = stream.read(_FILE_HEADER.size)
+    if len(header) != _FILE_HEADER.size:
+        raise ValueError("Truncated input recording header")
+    magic, version = _FILE_HEADER.unpack(header)
+    if magic != MAGIC:
+        raise ValueError("Not an input recording")
+    if version != VERSION:
+        raise ValueError(f"Unsupported input recording version: {version}")
+
+    while event_header := stream.read(_EVENT_HEADER.size):
+        if len(event_header) != _EVENT_HEADER.size:
+            raise ValueError("Truncated input recording")
+        event_type, time_msec = _EVENT_HEADER.unpack(event_header)
+        payload = _PAYLOADS[InputEventType(event_type)]
+        data = stream.read(payload.size)
+        if len(data) != payload.size:
+            raise ValueError("Truncated input recording")
+        yield InputEvent(InputEventType(event_type), time_msec, payload.unpack(data))
+
+
+class InputReplayer:
+    def __init__(
+        self,
+        display: Display,
+        events: Iterable[InputEvent],
+        *,
+        cursor: Cursor | None = None,
+        seat: Seat | None = None,
+        keyboard: Keyboard | None = None,
+        pointer_gestures: PointerGesturesV1 | None = None,
+        speed: float = 1.0,
+        dispatch: Callable[[InputEvent, int], bool] | None = None,
+        on_finished: Callable[[], None] | None = None,
+    ) -> None:
+        """Replay recorded input events on the display's event loop
+
+        Events are fed back into the compositor as follows:
+
+        - motion events move or warp the cursor,
+        - button, axis and frame events are notified to the seat,
+        - gesture events are sent through the pointer gestures manager,
+        - key events are fed to the keyboard as if they came from the device,
+          such that the compositor's key handlers and keybindings run.
+
+        Touch events, and events of any of the above whose target wasn't
+        given, are only handed to `dispatch`. As moving the cursor doesn't
+        update pointer focus, compositors typically use `dispatch` to run
+        their own motion handling after the default handling.
+
+        :param display:
+            The display whose event loop paces the replay.
+        :param events:
+            The events to replay, e.g. from `read_input_events`.
+        :param speed:
+            The replay speed relative to the recording, zero replays the
+            events as fast as possible.
+        :param dispatch:
+            Called with each event and its replay timestamp before the default
+            handling, which is skipped when it returns True.
+        :param on_finished:
+            Called once all events have been replayed.
+        """
+        if speed < 0:
+            raise ValueError(f"Replay speed must not be negative, got: {speed}")
+
+        self._events = iter(events)
+        self._cursor = cursor
+        self._seat = seat
+        self._keyboard = keyboard
+        self._pointer_gestures = pointer_gestures
+        self._speed = speed
+        self._dispatch = dispatch
+        self._on_finished = on_finished
+
+        self._timer: EventSource | None = display.get_event_loop().add_timer(
+            self._timer_callback, None
+        )
+        self._next: InputEvent | None = None
+        self._first_time_msec = 0
+        self._start = 0.0
+        self.event_count = 0
+
+    @property
+    def running(self) -> bool:
+        return self._next is not None
+
+    def start(self) -> None:
+        """Start replaying the events"""
+        self._next = next(self._events, None)
+        if self._next is None:
+            self._finish()
+            return
+        self._first_time_msec = self._next.time_msec
+        self._start = time.monotonic()
+        self._schedule()
+
+    def stop(self) -> None:
+        """Stop replaying, without calling `on_finished`"""
+        self._next = None
+        if self._timer is not None:
+            self._timer.remove()
+            self._timer = None
+
+    def _due(self, event: InputEvent) -> float:
+        # Frames are replayed right after the events they group, whatever
+        # their timestamp, as older recordings stored them with a zero
+        if self._speed == 0 or event.type in (
+            InputEventType.FRAME,
+            InputEventType.TOUCH_FRAME,
+        ):
+            return self._start
+        # Recorded timestamps are 32 bit milliseconds which may wrap
+        elapsed_msec = (event.time_msec - self._first_time_msec) & 0xFFFFFFFF
+        return self._start + elapsed_msec / 1000 / self._speed
+
+    def _schedule(self) -> None:
+        if self._next is None or self._timer is None:
+            return
+        delay = self._due(self._next) - time.monotonic()
+        # A timeout of zero disarms the timer
+        self._timer.timer_update(min(max(1, round(delay * 1000)), _MAX_TIMEOUT_MSEC))
+
+    def _timer_callback(self, data: Any) -> int:
+        now = time.monotonic()
+        while self._next is not None and self._due(self._next) <= now:
+            event = self._next
+            self._replay(event, round(now * 1000) & 0xFFFFFFFF)
+            self.event_count += 1
+            self._next = next(self._events, None)
+
+        if self._next is None:
+            self._finish()
+        else:
+            self._schedule()
+        return 0
+
+    def _finish(self) -> None:
+        self.stop()
+        if self._on_finished is not None:
+            self._on_finished()
+
+    def _replay(self, event: InputEvent, time_msec: int) -> None:
+        if self._dispatch is not None and self._dispatch(event, time_msec):
+            return
+
+        event_type = event.type
+        values = event.values
+        cursor = self._cursor
+        seat = self._seat
+        gestures = self._pointer_gestures
+
+        if event_type == InputEventType.MOTION:
+            if cursor is not None:
+                cursor.move(values[0], values[1])
+        elif event_type == InputEventType.MOTION_ABSOLUTE:
+            if cursor is not None:
+                cursor.warp(WarpMode.AbsoluteClosest, values[0], values[1])
+        elif event_type == InputEventType.BUTTON:
+            if seat is not None:
+                seat.pointer_notify_button(time_msec, values[0], ButtonState(values[1]))
+        elif event_type == InputEventType.AXIS:
+            if seat is not None:
+                seat.pointer_notify_axis(
+                    time_msec,
+                    AxisOrientation(values[1]),
+                    values[2],
+                    values[3],
+                    AxisSource(values[0]),
+                )
+        elif event_type == InputEventType.FRAME:
+            if seat is not None:
+                seat.pointer_notify_frame()
+        elif event_type == InputEventType.KEY:
+            if self._keyboard is not None:
+                self._keyboard.notify_key(
+                    time_msec, values[0], WlKeyboard.key_state(values[1])
+                )
+        elif gestures is not None and seat is not None:
+            if event_type == InputEventType.SWIPE_BEGIN:
+                gestures.send_swipe_begin(seat, time_msec, values[0])
+            elif event_type == InputEventType.SWIPE_UPDATE:
+                gestures.send_swipe_update(seat, time_msec, values[1], values[2])
+            elif event_type == InputEventType.SWIPE_END:
+                gestures.send_swipe_end(seat, time_msec, values[0])
+            elif event_type == InputEventType.PINCH_BEGIN:
+                gestures.send_pinch_begin(seat, time_msec, values[0])
+            elif event_type == InputEventType.PINCH_UPDATE:
+                gestures.send_pinch_update(seat, time_msec, *values[1:])
+            elif event_type == InputEventType.PINCH_END:
+                gestures.send_pinch_end(seat, time_msec, values[0])
+            elif event_type == InputEventType.HOLD_BEGIN:
+                gestures.send_hold_begin(seat, time_msec, values[0])
+            elif event_type == InputEventType.HOLD_END:
+                gestures.send_hold_end(seat, time_msec, values[0])
@@ -0,0 +1,450 @@
+# Copyright (c) 2026
+
+from __future__ import annotations
+
+import time
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+from wlroots.util.edges import Edges
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any
+
+    from pywayland.server import Display
+
+    from wlroots.util.box import Box, FrozenBox
+    from wlroots.wlr_types.xdg_shell import XdgToplevel
+    from wlroots.xwayland import SizeHints
+
+# The flags of xcb_size_hints_t, from xcb/xcb_icccm.h
+_SIZE_HINT_P_MIN_SIZE = 1 << 4
+_SIZE_HINT_P_MAX_SIZE = 1 << 5
+_SIZE_HINT_P_RESIZE_INC = 1 << 6
+_SIZE_HINT_BASE_SIZE = 1 << 8
+
+
+def _nearest(edges: array[int], value: int, threshold: int) -> int | None:
+    index = bisect_left(edges, value)
+    nearest = None
+    nearest_distance = threshold + 1
+    for i in (index - 1, index):
+        if 0 <= i < len(edges):
+            distance = abs(edges[i] - value)
+            if distance < nearest_distance:
+                nearest = edges[i]
+                nearest_distance = distance
+    return nearest
+
+
+class SnapEdgeIndex:
+    """The edges that windows snap to during an interactive move or resize
+
+    The left and right edges of the boxes are kept in one sorted array, the
+    top and bottom edges in another, so the edge nearest to a coordinate is
+    found by bisection. The index is built once at the start of a grab, from
+    the boxes of the outputs and of the other windows.
+    """
+
+    __slots__ = ("_xs", "_ys")
+
+    def __init__(self, boxes: Iterable[Box | FrozenBox] = ()) -> None:
+        xs = set()
+        ys = set()
+        for box in boxes:
+            if box.width <= 0 or box.height <= 0:
+                continue
+            xs.add(box.x)
+            xs.add(box.x + box.width)
+            ys.add(box.y)
+            ys.add(box.y + box.height)
+        self._xs = array("i", sorted(xs))
+        self._ys = array("i", sorted(ys))
+
+    def snap_x(self, x: int, threshold: int) -> int | None:
+        """The vertical edge nearest to x, if it is within the threshold"""
+        return _nearest(self._xs, x, threshold)
+
+    def snap_y(self, y: int, threshold: int) -> int | None:
+        """The horizontal edge nearest to y, if it is within the threshold"""
+        return _nearest(self._ys, y, threshold)
+
+
+class SizeConstraints:
+    """The sizes a window accepts, used to constrain interactive resizes
+
+    A maximum of zero means there is no maximum. The size is a multiple of
+    the increments above the base size, as with the size hints of X11
+    windows.
+    """
+
+    __slots__ = (
+        "base_height",
+        "base_width",
+        "height_inc",
+        "max_height",
+        "max_width",
+        "min_height",
+        "min_width",
+        "width_inc",
+    )
+
+    def __init__(
+        self,
+        min_width: int = 1,
+        min_height: int = 1,
+        max_width: int = 0,
+        max_height: int = 0,
+        *,
+        base_width: int = 0,
+        base_height: int = 0,
+        width_inc: int = 1,
+        height_inc: int = 1,
+    ) -> None:
+        self.min_width = max(min_width, 1)
+        self.min_height = max(min_height, 1)
+        self.max_width = max(max_width, 0)
+        self.max_height = max(max_height, 0)
+        self.base_width = base_width
+        self.base_height = base_height
+        self.width_inc = max(width_inc, 1)
+        self.height_inc = max(height_inc, 1)
+
+    @classmethod
+    def from_xdg_toplevel(cls, toplevel: XdgToplevel) -> SizeConstraints:
+        """The minimum and maximum sizes set by an xdg toplevel"""
+        current = toplevel._ptr.current
+        return cls(
+            current.min_width,
+            current.min_height,
+            current.max_width,
+            current.max_height,
+        )
+
+    @classmethod
+    def from_size_hints(cls, size_hints: SizeHints | None) -> SizeConstraints:
+        """The size hints of an XWayland surface
+
+        As in ICCCM, the base size defaults to the minimum size and the
+        minimum size to the base size.
+        """
+        if size_hints is None:
+            return cls()
+
+        flags = size_hints.flags
+        min_width = min_height = base_width = base_height = 0
+        if flags & _SIZE_HINT_P_MIN_SIZE:
+            min_width = size_hints.min_width
+            min_height = size_hints.min_height
+        if flags & _SIZE_HINT_BASE_SIZE:
+            base_width = size_hints.base_width
+            base_height = size_hints.base_height
+            if not flags & _SIZE_HINT_P_MIN_SIZE:
+                min_width = base_width
+                min_height = base_height
+        elif flags & _SIZE_HINT_P_MIN_SIZE:
+            base_width = min_width
+            base_height = min_height
+
+        max_width = max_height = 0
+        if flags & _SIZE_HINT_P_MAX_SIZE:
+            max_width = size_hints.max_width
+            max_height = size_hints.max_height
+
+        width_inc = height_inc = 1
+        if flags & _SIZE_HINT_P_RESIZE_INC:
+            width_inc = size_hints.width_inc
+            height_inc = size_hints.height_inc
+
+        return cls(
+            min_width,
+            min_height,
+            max_width,
+            max_height,
+            base_width=base_width,
+            base_height=base_height,
+            width_inc=width_inc,
+            height_inc=height_inc,
+        )
+
+    def constrain_width(self, width: int) -> int:
+        """The nearest accepted width, not above the given width if possible"""
+        return self._constrain(
+            width, self.min_width, self.max_width, self.base_width, self.width_inc
+        )
+
+    def constrain_height(self, height: int) -> int:
+        """The nearest accepted height, not above the given height if possible"""
+        return self._constrain(
+            height, self.min_height, self.max_height, self.base_height, self.height_inc
+        )
+
+    @staticmethod
+    def _constrain(size: int, minimum: int, maximum: int, base: int, inc: int) -> int:
+        if maximum and size > maximum:
+            size = maximum
+        if inc > 1:
+            size = base + (size - base) // inc * inc
+        if size < minimum:
+            # Round up to the first step at or above the minimum
+            size = base + -((base - minimum) // inc) * inc if inc > 1 else minimum
+        return size
+
+
+class MoveResizeController:
+    def __init__(
+        self,
+        display: Display,
+        on_resize: Callable[[int, int, int, int], Any],
+        *,
+        on_move: Callable[[int, int], Any] | None = None,
+        snap_threshold: int = 16,
+        configure_interval_ms: float = 16,
+    ) -> None:
+        """Drive the interactive move and resize of windows
+
+        The geometry of the grabbed window is tracked in layout coordinates
+        as plain integers, from the geometry given when the grab begins, so
+        motion events don't query the window nor allocate cdata.
+
+        Moves are reported on every motion, through `on_move`. Resizes
+        require the client to draw a new buffer, so they are throttled:
+        `on_resize` is called at most once per `configure_interval_ms`, the
+        last geometry being reported once the interval has elapsed.
+
+        :param display:
+            The display whose event loop is used for the throttled resizes.
+        :param on_resize:
+            Called with the x, y, width and height of the window geometry as
+            it is resized, e.g. to configure the window and move its node.
+        :param on_move:
+            Called with the x and y of the window geometry as it is moved.
+        :param snap_threshold:
+            The distance within which the edges of the window snap to the
+            edges of the snap index, 0 to disable snapping.
+        :param configure_interval_ms:
+            The minimum time between two calls of `on_resize`.
+        """
+        self._on_resize = on_resize
+        self._on_move = on_move
+        self.snap_threshold = snap_threshold
+        self._interval = configure_interval_ms / 1000
+        self._timer = display.get_event_loop().add_timer(self._timer_callback, None)
+
+        self.edges = Edges.NONE
+        self._moving = False
+        self._snap_edges: SnapEdgeIndex | None = None
+        self._constraints = SizeConstraints()
+
+        # Offset from the grabbed point of the window to the cursor
+        self._grab_x = 0.0
+        self._grab_y = 0.0
+        # The geometry when the grab began
+        self._start_x = 0
+        self._start_y = 0
+        self._start_width = 0
+        self._start_height = 0
+
+        self.x = 0
+        self.y = 0
+        self.width = 0
+        self.height = 0
+
+        self._pending = False
+        self._last_configure = 0.0
+        self._configured = (0, 0, 0, 0)
+
+    @property
+    def active(self) -> bool:
+        """Whether a move or resize is in progress"""
+        return self._moving or self.edges != Edges.NONE
+
+    def begin_move(
+        self,
+        cursor_x: float,
+        cursor_y: float,
+        geometry: Box | FrozenBox,
+        *,
+        snap_edges: SnapEdgeIndex | None = None,
+    ) -> None:
+        """Start moving a window
+
+        :param cursor_x:
+            The x coordinate of the cursor, in layout coordinates.
+        :param cursor_y:
+            The y coordinate of the cursor, in layout coordinates.
+        :param geometry:
+            The geometry of the window, in layout coordinates.
+        :param snap_edges:
+            The edges the edges of the window snap to.
+        """
+        self.end()
+        self._begin(geometry, snap_edges)
+        self._moving = True
+        self._grab_x = cursor_x - self.x
+        self._grab_y = cursor_y - self.y
+
+    def begin_resize(
+        self,
+        cursor_x: float,
+        cursor_y: float,
+        geometry: Box | FrozenBox,
+        edges: Edges,
+        *,
+        constraints: SizeConstraints | None = None,
+        snap_edges: SnapEdgeIndex | None = None,
+    ) -> None:
+        """Start resizing a window
+
+        :param cursor_x:
+            The x coordinate of the cursor, in layout coordinates.
+        :param cursor_y:
+            The y coordinate of the cursor, in layout coordinates.
+        :param geometry:
+            The geometry of the window, in layout coordinates.
+        :param edges:
+            The edges of the window that follow the cursor.
+        :param constraints:
+            The sizes the window accepts.
+        :param snap_edges:
+            The edges the resized edges of the window snap to.
+        """
+        self.end()
+        if edges == Edges.NONE:
+            return
+        self._begin(geometry, snap_edges)
+        self.edges = edges
+        if constraints is not None:
+            self._constraints = constraints
+
+        border_x = self.x + (self.width if edges & Edges.RIGHT else 0)
+        border_y = self.y + (self.height if edges & Edges.BOTTOM else 0)
+        self._grab_x = cursor_x - border_x
+        self._grab_y = cursor_y - border_y
+        self._configured = (self.x, self.y, self.width, self.height)
+
+    def motion(self, cursor_x: float, cursor_y: float) -> None:
+        """Update the grabbed window for the new cursor position"""
+        if self._moving:
+            self._move(int(cursor_x - self._grab_x), int(cursor_y - self._grab_y))
+        elif self.edges != Edges.NONE:
+            self._resize(int(cursor_x - self._grab_x), int(cursor_y - self._grab_y))
+
+    def end(self) -> None:
+        """End the grab, reporting the last geometry of a resize if pending"""
+        if self._pending:
+            self._configure()
+        self._timer.timer_update(0)
+        self._moving = False
+        self.edges = Edges.NONE
+        self._snap_edges = None
+        self._constraints = SizeConstraints()
+
+    def destroy(self) -> None:
+        """Release the timer of the controller, a pending resize is dropped"""
+        self._pending = False
+        self.end()
+        self._timer.remove()
+
+    def _begin(
+        self, geometry: Box | FrozenBox, snap_edges: SnapEdgeIndex | None
+    ) -> None:
+        self._snap_edges = snap_edges
+        self._start_x = self.x = geometry.x
+        self._start_y = self.y = geometry.y
+        self._start_width = self.width = geometry.width
+        self._start_height = self.height = geometry.height
+
+    def _move(self, x: int, y: int) -> None:
+        snap_edges = self._snap_edges
+        threshold = self.snap_threshold
+        if snap_edges is not None and threshold > 0:
+            x = self._snap_span(snap_edges.snap_x, x, self.width, threshold)
+            y = self._snap_span(snap_edges.snap_y, y, self.height, threshold)
+
+        if x != self.x or y != self.y:
+            self.x = x
+            self.y = y
+            if self._on_move is not None:
+                self._on_move(x, y)
+
+    @staticmethod
+    def _snap_span(
+        snap: Callable[[int, int], int | None], start: int, size: int, threshold: int
+    ) -> int:
+        # Snap whichever of the two edges of the span is closer to an edge
+        snapped_start = snap(start, threshold)
+        snapped_end = snap(start + size, threshold)
+        if snapped_end is not None and (
+            snapped_start is None
+            or abs(snapped_end - start - size) < abs(snapped_start - start)
+        ):
+            return snapped_end - size
+        if snapped_start is not None:
+            return snapped_start
+        return start
+
+    def _resize(self, border_x: int, border_y: int) -> None:
+        edges = self.edges
+        snap_edges = self._snap_edges
+        threshold = self.snap_threshold
+        if snap_edges is not None and threshold > 0:
+            if edges & (Edges.LEFT | Edges.RIGHT):
+                snapped = snap_edges.snap_x(border_x, threshold)
+                if snapped is not None:
+                    border_x = snapped
+            if edges & (Edges.TOP | Edges.BOTTOM):
+                snapped = snap_edges.snap_y(border_y, threshold)
+                if snapped is not None:
+                    border_y = snapped
+
+        left = self._start_x
+        right = left + self._start_width
+        top = self._start_y
+        bottom = top + self._start_height
+        constraints = self._constraints
+
+        if edges & Edges.LEFT:
+            width = constraints.constrain_width(right - border_x)
+            left = right - width
+        elif edges & Edges.RIGHT:
+            width = constraints.constrain_width(border_x - left)
+        else:
+            width = right - left
+
+        if edges & Edges.TOP:
+            height = constraints.constrain_height(bottom - border_y)
+            top = bottom - height
+        elif edges & Edges.BOTTOM:
+            height = constraints.constrain_height(border_y - top)
+        else:
+            height = bottom - top
+
+        self.x = left
+        self.y = top
+        self.width = width
+        self.height = height
+        if (left, top, width, height) == self._configured:
+            return
+
+        elapsed = time.monotonic() - self._last_configure
+        if elapsed >= self._interval:
+            self._configure()
+        elif not self._pending:
+            self._pending = True
+            # A timeout of zero would disarm the timer
+            self._timer.timer_update(max(1, round((self._interval - elapsed) * 1000)))
+
+    def _configure(self) -> None:
+        self._pending = False
+        self._last_configure = time.monotonic()
+        self._configured = (self.x, self.y, self.width, self.height)
+        self._on_resize(self.x, self.y, self.width, self.height)
+
+    def _timer_callback(self, data: Any) -> int:
+        if self._pending:
+            self._configure()
+        return 0
@@ -0,0 +1,277 @@
+# Copyright (c) 2026
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from pywayland.server import Listener
+
+from wlroots import ffi, lib, ptr_or_null
+from wlroots.wlr_types.cursor import WarpMode
+from wlroots.wlr_types.pointer_constraints_v1 import (
+    PointerConstraintV1,
+    PointerConstraintV1Region,
+    PointerConstraintV1StateField,
+    PointerConstraintV1Type,
+)
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from wlroots.util.touch_points import SurfaceAt
+    from wlroots.wlr_types import (
+        Cursor,
+        InputDevice,
+        PointerConstraintsV1,
+        RelativePointerManagerV1,
+        Seat,
+        SeatPointerFocus,
+    )
+    from wlroots.wlr_types.pointer import PointerMotionEvent
+
+
+class PointerMotionPipeline:
+    def __init__(
+        self,
+        cursor: Cursor,
+        seat: Seat,
+        pointer_focus: SeatPointerFocus,
+        surface_at: SurfaceAt,
+        *,
+        relative_pointer_manager: RelativePointerManagerV1 | None = None,
+        pointer_constraints: PointerConstraintsV1 | None = None,
+    ) -> None:
+        """Handle relative pointer motion, from the device to the focused client
+
+        A single call to `motion` sends relative motion to relative pointer
+        clients, applies the pointer constraint of the focused surface, moves
+        the cursor and updates the pointer focus of the seat.
+
+        While a locked constraint is active, the cursor doesn't move and only
+        relative motion is sent. While a confined constraint is active, the
+        cursor is kept within the region of the constraint and the focused
+        surface is sent motion without looking up the surface under the
+        cursor. Constraints are activated and deactivated as the focused
+        surface changes, and the cursor position hint of a locked constraint
+        is applied when it ends.
+
+        :param cursor:
+            The cursor to move.
+        :param seat:
+            The seat to send pointer events to.
+        :param pointer_focus:
+            Updates the pointer focus and cursor image of the seat.
+        :param surface_at:
+            Finds the surface under a point in layout coordinates.
+        :param relative_pointer_manager:
+            The manager to send relative motion with.
+        :param pointer_constraints:
+            The pointer constraints to apply.
+        """
+        self._cursor = cursor
+        self._seat = seat
+        self._pointer_focus = pointer_focus
+        self._surface_at = surface_at
+        self._relative_pointer_manager = relative_pointer_manager
+        self._pointer_constraints = pointer_constraints
+
+        self._constraint: PointerConstraintV1 | None = None
+        self._constraint_region: PointerConstraintV1Region | None = None
+        self._constraint_destroy_listener: Listener | None = None
+        # The focused surface the active constraint was looked up for
+        self._constraint_surface_ptr = ffi.NULL
+
+        self._new_constraint_listener: Listener | None = None
+        if pointer_constraints is not None:
+            self._new_constraint_listener = Listener(self._on_new_constraint)
+            pointer_constraints.new_constraint_event.add(self._new_constraint_listener)
+
+    @property
+    def active_constraint(self) -> PointerConstraintV1 | None:
+        """The pointer constraint currently applied, if any"""
+        return self._constraint
+
+    def motion(
+        self,
+        time_msec: int,
+        delta_x: float,
+        delta_y: float,
+        unaccel_delta_x: float | None = None,
+        unaccel_delta_y: float | None = None,
+        *,
+        input_device: InputDevice | None = None,
+    ) -> None:
+        """Process relative pointer motion
+
+        Motion events may be coalesced by the caller, in which case the deltas
+        are the sums of the deltas of the coalesced events.
+
+        :param time_msec:
+            The timestamp of the motion.
+        :param delta_x:
+            The accelerated motion along x.
+        :param delta_y:
+            The accelerated motion along y.
+        :param unaccel_delta_x:
+            The motion along x before acceleration, defaults to `delta_x`.
+        :param unaccel_delta_y:
+            The motion along y before acceleration, defaults to `delta_y`.
+        :param input_device:
+            The device the motion comes from, to respect its output mapping.
+        """
+        if self._relative_pointer_manager is not None:
+            lib.wlr_relative_pointer_manager_v1_send_relative_motion(
+                self._relative_pointer_manager._ptr,
+                self._seat._ptr,
+                time_msec * 1000,
+                delta_x,
+                delta_y,
+                delta_x if unaccel_delta_x is None else unaccel_delta_x,
+                delta_y if unaccel_delta_y is None else unaccel_delta_y,
+            )
+
+        constraint = self._constraint
+        if constraint is not None:
+            if constraint._ptr.type == lib.WLR_POINTER_CONSTRAINT_V1_LOCKED:
+                return
+            if self._confined_motion(time_msec, delta_x, delta_y, input_device):
+                return
+
+        lib.wlr_cursor_move(
+            self._cursor._ptr, ptr_or_null(input_device), delta_x, delta_y
+        )
+        self.refresh(time_msec)
+
+    def motion_event(self, event: PointerMotionEvent) -> None:
+        """Process the motion event of a pointer"""
+        ptr = event._ptr
+        self.motion(
+            ptr.time_msec,
+            ptr.delta_x,
+            ptr.delta_y,
+            ptr.unaccel_dx,
+            ptr.unaccel_dy,
+            input_device=event.pointer.base,
+        )
+
+    def refresh(self, time_msec: int) -> None:
+        """Update the pointer focus for the current cursor position
+
+        This should also be called when the surfaces under the cursor move.
+        """
+        found = self._surface_at(self._cursor._ptr.x, self._cursor._ptr.y)
+        if self._constraint is not None and (
+            found is None or found[0]._ptr != self._constraint_surface_ptr
+        ):
+            # Deactivate the constraint while its surface still has the
+            # pointer focus, as the cursor hint of a locked constraint is
+            # relative to it, then look up the surface under the cursor again
+            # as the hint may have moved it
+            self._deactivate_constraint()
+            found = self._surface_at(self._cursor._ptr.x, self._cursor._ptr.y)
+
+        if found is None:
+            self._pointer_focus.update(time_msec, None)
+        else:
+            self._pointer_focus.update(time_msec, *found)
+
+        focused_ptr = self._seat._ptr.pointer_state.focused_surface
+        if focused_ptr != self._constraint_surface_ptr:
+            self._update_constraint(focused_ptr)
+
+    def destroy(self) -> None:
+        """Stop processing motion, deactivating the active constraint"""
+        self._deactivate_constraint()
+        if self._new_constraint_listener is not None:
+            self._new_constraint_listener.remove()
+            self._new_constraint_listener = None
+
+    def _confined_motion(
+        self,
+        time_msec: int,
+        delta_x: float,
+        delta_y: float,
+        input_device: InputDevice | None,
+    ) -> bool:
+        region = self._constraint_region
+        assert region is not None
+        pointer_state = self._seat._ptr.pointer_state
+        surface_x = pointer_state.sx
+        surface_y = pointer_state.sy
+        confined = region.confine(surface_x + delta_x, surface_y + delta_y)
+        if confined is None:
+            # The region is empty, e.g. the surface has no input region yet
+            return False
+
+        lib.wlr_cursor_move(
+            self._cursor._ptr,
+            ptr_or_null(input_device),
+            confined[0] - surface_x,
+            confined[1] - surface_y,
+        )
+        lib.wlr_seat_pointer_notify_motion(
+            self._seat._ptr, time_msec, confined[0], confined[1]
+        )
+        return True
+
+    def _update_constraint(self, focused_ptr: ffi.CData) -> None:
+        self._deactivate_constraint()
+        self._constraint_surface_ptr = focused_ptr
+        if self._pointer_constraints is None or focused_ptr == ffi.NULL:
+            return
+
+        constraint_ptr = lib.wlr_pointer_constraints_v1_constraint_for_surface(
+            self._pointer_constraints._ptr, focused_ptr, self._seat._ptr
+        )
+        if constraint_ptr == ffi.NULL:
+            return
+
+        constraint = PointerConstraintV1(constraint_ptr)
+        self._constraint = constraint
+        if constraint.type == PointerConstraintV1Type.CONFINED:
+            self._constraint_region = PointerConstraintV1Region(constraint)
+        self._constraint_destroy_listener = Listener(self._on_constraint_destroy)
+        constraint.destroy_event.add(self._constraint_destroy_listener)
+        constraint.send_activated()
+
+    def _deactivate_constraint(self, destroyed: bool = False) -> None:
+        constraint = self._constraint
+        if constraint is None:
+            return
+
+        self._constraint = None
+        self._constraint_surface_ptr = ffi.NULL
+        if self._constraint_region is not None:
+            self._constraint_region.destroy()
+            self._constraint_region = None
+        if self._constraint_destroy_listener is not None:
+            self._constraint_destroy_listener.remove()
+            self._constraint_destroy_listener = None
+
+        if constraint.type == PointerConstraintV1Type.LOCKED:
+            self._warp_to_cursor_hint(constraint)
+        if not destroyed:
+            constraint.send_deactivated()
+
+    def _warp_to_cursor_hint(self, constraint: PointerConstraintV1) -> None:
+        current = constraint.current
+        if not current.committed & PointerConstraintV1StateField.CURSOR_HINT:
+            return
+
+        pointer_state = self._seat._ptr.pointer_state
+        if pointer_state.focused_surface != constraint._ptr.surface:
+            return
+        hint_x, hint_y = current.cursor_hint
+        origin_x = self._cursor.x - pointer_state.sx
+        origin_y = self._cursor.y - pointer_state.sy
+        self._cursor.warp(WarpMode.Layout, origin_x + hint_x, origin_y + hint_y)
+
+    def _on_new_constraint(
+        self, listener: Listener, constraint: PointerConstraintV1
+    ) -> None:
+        focused_ptr = self._seat._ptr.pointer_state.focused_surface
+        if self._constraint is None and constraint._ptr.surface == focused_ptr:
+            self._update_constraint(focused_ptr)
+
+    def _on_constraint_destroy(self, listener: Listener, data: Any) -> None:
+        self._deactivate_constraint(destroyed=True)
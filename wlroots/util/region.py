@@ -2,12 +2,26 @@
 
 from __future__ import annotations
 
+import enum
+from collections.abc import Iterable
 from types import TracebackType
+from typing import Any
 
 from pywayland.protocol.wayland import WlOutput
 
 from wlroots import Ptr, ffi, lib
-from wlroots.util.box import Box
+from wlroots.util._numpy import require_numpy
+from wlroots.util.box import Box, FrozenBox
+
+
+class RegionOverlap(enum.IntEnum):
+    OUT = lib.PIXMAN_REGION_OUT
+    IN = lib.PIXMAN_REGION_IN
+    PART = lib.PIXMAN_REGION_PART
+
+
+def _pixman_box(x: int, y: int, width: int, height: int) -> ffi.CData:
+    return ffi.new("struct pixman_box32 *", [x, y, x + width, y + height])
 
 
 class PixmanRegion32(Ptr):
@@ -28,6 +42,31 @@ class PixmanRegion32(Ptr):
     def init_rect(self, x: int, y: int, width: int, height: int) -> None:
         lib.pixman_region32_init_rect(self._ptr, x, y, width, height)
 
+    def init_with_extents(self, x: int, y: int, width: int, height: int) -> None:
+        """Initialize the region with the given extents and no rectangles"""
+        lib.pixman_region32_init_with_extents(
+            self._ptr, _pixman_box(x, y, width, height)
+        )
+
+    def init_rects(self, boxes: Iterable[Box | FrozenBox]) -> None:
+        """Initialize the region as the union of the given boxes"""
+        rects = [(box.x, box.y, box.x + box.width, box.y + box.height) for box in boxes]
+        self.init_rectangles(ffi.new("struct pixman_box32[]", rects))
+
+    def init_rectangles(self, rectangles: Any) -> None:
+        """Initialize the region as the union of an array of rectangles
+
+        The rectangles are given as a buffer of (x1, y1, x2, y2) int32
+        quadruplets, e.g. the result of `rectangles_as_memoryview` or an
+        (n, 4) int32 NumPy array, or as a `struct pixman_box32[]` cdata.
+        """
+        if isinstance(rectangles, ffi.CData):
+            rects = rectangles
+        else:
+            rects = ffi.from_buffer("struct pixman_box32[]", rectangles)
+        if not lib.pixman_region32_init_rects(self._ptr, rects, len(rects)):
+            raise MemoryError("Unable to allocate the rectangles of the region")
+
     def fini(self) -> None:
         lib.pixman_region32_fini(self._ptr)
 
@@ -45,6 +84,21 @@ class PixmanRegion32(Ptr):
         """Finish up when exiting the context"""
         self.fini()
 
+    def n_rects(self) -> int:
+        """The number of rectangles in the region"""
+        return lib.pixman_region32_n_rects(self._ptr)
+
+    @property
+    def extents(self) -> FrozenBox:
+        """The bounding box of the region"""
+        extents = lib.pixman_region32_extents(self._ptr)
+        return FrozenBox(
+            extents.x1,
+            extents.y1,
+            extents.x2 - extents.x1,
+            extents.y2 - extents.y1,
+        )
+
     def rectangles_as_boxes(self) -> list[Box]:
         nrects_ptr = ffi.new("int *")
         rects = lib.pixman_region32_rectangles(self._ptr, nrects_ptr)
@@ -58,6 +112,108 @@ class PixmanRegion32(Ptr):
             rects += 1
         return boxes
 
+    def _rectangles_buffer(self) -> ffi.buffer:
+        nrects_ptr = ffi.new("int *")
+        rects = lib.pixman_region32_rectangles(self._ptr, nrects_ptr)
+        return ffi.buffer(rects, nrects_ptr[0] * ffi.sizeof("struct pixman_box32"))
+
+    def rectangles_as_memoryview(self) -> memoryview:
+        """A view of the rectangles, of shape (n, 4) and int32 format
+
+        Each row holds the (x1, y1, x2, y2) corners of a rectangle. The view
+        shares the memory of the region, so it is only valid until the region
+        is next modified or finished. The view of an empty region is
+        one-dimensional, as memoryviews can't have zeros in their shape.
+        """
+        view = memoryview(self._rectangles_buffer()).cast("B")
+        if not len(view):
+            return view.cast("i")
+        return view.cast("i", (len(view) // ffi.sizeof("struct pixman_box32"), 4))
+
+    def rectangles_as_numpy(self) -> Any:
+        """An array of the rectangles, of shape (n, 4) and int32 dtype
+
+        As with `rectangles_as_memoryview`, the array shares the memory of
+        the region. Raises ImportError if NumPy is not installed.
+        """
+        np = require_numpy("PixmanRegion32.rectangles_as_numpy")
+        return np.frombuffer(self._rectangles_buffer(), dtype=np.int32).reshape(-1, 4)
+
+    def copy_from(self, src: PixmanRegion32) -> None:
+        """Set the region to a copy of another region"""
+        if not lib.pixman_region32_copy(self._ptr, src._ptr):
+            raise MemoryError("Unable to copy the region")
+
+    def union(self, other: PixmanRegion32) -> None:
+        """Add another region to the region"""
+        if not lib.pixman_region32_union(self._ptr, self._ptr, other._ptr):
+            raise MemoryError("Unable to compute the union of the regions")
+
+    def union_rect(self, x: int, y: int, width: int, height: int) -> None:
+        """Add a rectangle to the region"""
+        if not lib.pixman_region32_union_rect(
+            self._ptr, self._ptr, x, y, width, height
+        ):
+            raise MemoryError("Unable to compute the union of the region")
+
+    def intersect(self, other: PixmanRegion32) -> None:
+        """Restrict the region to its intersection with another region"""
+        if not lib.pixman_region32_intersect(self._ptr, self._ptr, other._ptr):
+            raise MemoryError("Unable to compute the intersection of the regions")
+
+    def intersect_rect(self, x: int, y: int, width: int, height: int) -> None:
+        """Restrict the region to its intersection with a rectangle"""
+        if not lib.pixman_region32_intersect_rect(
+            self._ptr, self._ptr, x, y, width, height
+        ):
+            raise MemoryError("Unable to compute the intersection of the region")
+
+    def subtract(self, other: PixmanRegion32) -> None:
+        """Remove another region from the region"""
+        if not lib.pixman_region32_subtract(self._ptr, self._ptr, other._ptr):
+            raise MemoryError("Unable to compute the difference of the regions")
+
+    def inverse(self, x: int, y: int, width: int, height: int) -> None:
+        """Set the region to the parts of a rectangle it doesn't cover"""
+        if not lib.pixman_region32_inverse(
+            self._ptr, self._ptr, _pixman_box(x, y, width, height)
+        ):
+            raise MemoryError("Unable to compute the inverse of the region")
+
+    def translate(self, x: int, y: int) -> None:
+        """Move the region by the given offset"""
+        lib.pixman_region32_translate(self._ptr, x, y)
+
+    def reset(self, x: int, y: int, width: int, height: int) -> None:
+        """Set the region to a single rectangle"""
+        lib.pixman_region32_reset(self._ptr, _pixman_box(x, y, width, height))
+
+    def clear(self) -> None:
+        """Make the region empty"""
+        lib.pixman_region32_clear(self._ptr)
+
+    def contains_point(self, x: int, y: int) -> bool:
+        """Whether the point lies within the region"""
+        return lib.pixman_region32_contains_point(self._ptr, x, y, ffi.NULL)
+
+    def contains_rectangle(
+        self, x: int, y: int, width: int, height: int
+    ) -> RegionOverlap:
+        """How much of the rectangle lies within the region"""
+        return RegionOverlap(
+            lib.pixman_region32_contains_rectangle(
+                self._ptr, _pixman_box(x, y, width, height)
+            )
+        )
+
+    def equal(self, other: PixmanRegion32) -> bool:
+        """Whether the two regions cover the same area
+
+        Unlike ``==``, which compares the wrapped pointers, this compares the
+        contents of the regions.
+        """
+        return lib.pixman_region32_equal(self._ptr, other._ptr)
+
     def transform(
         self,
         src: PixmanRegion32,
@@ -70,6 +226,33 @@ class PixmanRegion32(Ptr):
         """
         lib.wlr_region_transform(self._ptr, src._ptr, transform, width, height)
 
+    def scale(self, src: PixmanRegion32, scale: float) -> None:
+        """
+        Scales a region, rounding the rectangles outwards to whole pixels.
+        """
+        lib.wlr_region_scale(self._ptr, src._ptr, scale)
+
+    def scale_xy(self, src: PixmanRegion32, scale_x: float, scale_y: float) -> None:
+        """
+        Scales a region by different factors along x and y.
+        """
+        lib.wlr_region_scale_xy(self._ptr, src._ptr, scale_x, scale_y)
+
+    def expand(self, src: PixmanRegion32, distance: int) -> None:
+        """
+        Expands each rectangle of a region by `distance` in every direction.
+        """
+        lib.wlr_region_expand(self._ptr, src._ptr, distance)
+
+    def rotated_bounds(
+        self, src: PixmanRegion32, rotation: float, ox: int, oy: int
+    ) -> None:
+        """
+        Sets the region to the bounds of the region rotated by `rotation`
+        radians around the point (`ox`, `oy`).
+        """
+        lib.wlr_region_rotated_bounds(self._ptr, src._ptr, rotation, ox, oy)
+
     def not_empty(self) -> bool:
         """
         Wrapper around pixman_region32_not_empty
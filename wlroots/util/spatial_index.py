@@ -0,0 +1,214 @@
+# Copyright (c) 2026
+
+from __future__ import annotations
+
+import math
+from collections.abc import Hashable, Iterable, Iterator
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+from wlroots.util.box import Box, BoxArray, FrozenBox
+
+if TYPE_CHECKING:
+    from wlroots.wlr_types.scene import SceneNode
+
+K = TypeVar("K", bound=Hashable)
+
+
+class SpatialIndex(Generic[K]):
+    def __init__(self, cell_size: int = 256) -> None:
+        """Index the boxes of windows or surfaces for hit-testing
+
+        The boxes are bucketed into a uniform grid of square cells, so point
+        and box queries only look at the boxes sharing a cell with the query
+        rather than at every box. Each key also has a stacking order, and
+        queries return the topmost keys first, as the scene graph would.
+
+        :param cell_size:
+            The size of the cells of the grid, in layout coordinates. It
+            should be in the order of the size of the indexed boxes.
+        """
+        if cell_size <= 0:
+            raise ValueError("The cell size must be positive")
+        self._cell_size = cell_size
+        self._boxes: dict[K, FrozenBox] = {}
+        # The stacking order of each key, higher values are on top
+        self._stacking: dict[K, int] = {}
+        self._next_stacking = 0
+        self._lowest_stacking = 0
+        self._cells: dict[tuple[int, int], set[K]] = {}
+
+    def __len__(self) -> int:
+        return len(self._boxes)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._boxes
+
+    def __iter__(self) -> Iterator[K]:
+        """Iterate over the keys, from the top of the stack to the bottom"""
+        return iter(self._sorted(self._boxes))
+
+    def get(self, key: K) -> FrozenBox | None:
+        """The box of the key, if it is indexed"""
+        return self._boxes.get(key)
+
+    def insert(self, key: K, box: Box | FrozenBox | tuple[int, int, int, int]) -> None:
+        """Index the box of a key, on top of the stack
+
+        If the key is already indexed, its box is updated and it is raised to
+        the top of the stack.
+        """
+        self.update(key, box)
+        self.raise_to_top(key)
+
+    def update(self, key: K, box: Box | FrozenBox | tuple[int, int, int, int]) -> None:
+        """Set the box of a key, keeping its position in the stack
+
+        Keys that aren't indexed yet are put on top of the stack.
+        """
+        if isinstance(box, tuple):
+            box = FrozenBox(*box)
+        elif isinstance(box, Box):
+            box = FrozenBox.from_box(box)
+
+        previous = self._boxes.get(key)
+        if previous == box:
+            return
+        if previous is not None:
+            self._unlink(key, previous)
+        else:
+            self._stacking[key] = self._next_stacking
+            self._next_stacking += 1
+        self._boxes[key] = box
+        self._link(key, box)
+
+    def move(self, key: K, x: int, y: int) -> None:
+        """Move the box of an indexed key, keeping its size"""
+        box = self._boxes[key]
+        self.update(key, FrozenBox(x, y, box.width, box.height))
+
+    def place_node(self, key: K, node: SceneNode, x: int, y: int) -> None:
+        """Set the position of a scene node and move the box of the key with it
+
+        The box of the key is moved to the position of the node in layout
+        coordinates, so it should describe the node's geometry.
+        """
+        node.set_position(x, y)
+        self.move(key, *node.coords())
+
+    def remove(self, key: K) -> None:
+        """Stop indexing a key"""
+        box = self._boxes.pop(key, None)
+        if box is None:
+            return
+        self._unlink(key, box)
+        del self._stacking[key]
+
+    def clear(self) -> None:
+        """Stop indexing every key"""
+        self._boxes.clear()
+        self._stacking.clear()
+        self._cells.clear()
+
+    def raise_to_top(self, key: K) -> None:
+        """Place an indexed key above all of the other keys"""
+        if self._stacking[key] != self._next_stacking - 1:
+            self._stacking[key] = self._next_stacking
+            self._next_stacking += 1
+
+    def lower_to_bottom(self, key: K) -> None:
+        """Place an indexed key below all of the other keys"""
+        self._lowest_stacking -= 1
+        self._stacking[key] = self._lowest_stacking
+
+    def at(self, x: float, y: float) -> K | None:
+        """The topmost key whose box contains the point, if any"""
+        found = None
+        found_stacking = 0
+        for key in self._cells.get(self._cell(x, y), ()):
+            box = self._boxes[key]
+            if (
+                box.x <= x < box.x + box.width
+                and box.y <= y < box.y + box.height
+                and (found is None or self._stacking[key] > found_stacking)
+            ):
+                found = key
+                found_stacking = self._stacking[key]
+        return found
+
+    def all_at(self, x: float, y: float) -> list[K]:
+        """The keys whose box contains the point, topmost first"""
+        keys = []
+        for key in self._cells.get(self._cell(x, y), ()):
+            box = self._boxes[key]
+            if box.x <= x < box.x + box.width and box.y <= y < box.y + box.height:
+                keys.append(key)
+        return self._sorted(keys)
+
+    def intersecting(self, box: Box | FrozenBox) -> list[K]:
+        """The keys whose box intersects the given box, topmost first"""
+        if box.width <= 0 or box.height <= 0:
+            return []
+        x1 = box.x
+        y1 = box.y
+        x2 = box.x + box.width
+        y2 = box.y + box.height
+
+        candidates: set[K] = set()
+        for cell in self._cells_of(box):
+            candidates.update(self._cells.get(cell, ()))
+        keys = []
+        for key in candidates:
+            other = self._boxes[key]
+            if (
+                other.x < x2
+                and x1 < other.x + other.width
+                and other.y < y2
+                and y1 < other.y + other.height
+            ):
+                keys.append(key)
+        return self._sorted(keys)
+
+    def as_box_array(self) -> tuple[list[K], BoxArray]:
+        """The keys, topmost first, and a `BoxArray` of their boxes
+
+        This allows running the bulk queries of `BoxArray` over every box.
+        """
+        keys = self._sorted(self._boxes)
+        return keys, BoxArray(self._boxes[key] for key in keys)
+
+    def _sorted(self, keys: Iterable[K]) -> list[K]:
+        return sorted(keys, key=self._stacking.__getitem__, reverse=True)
+
+    def _cell(self, x: float, y: float) -> tuple[int, int]:
+        return math.floor(x) // self._cell_size, math.floor(y) // self._cell_size
+
+    def _cells_of(self, box: FrozenBox | Box) -> Iterator[tuple[int, int]]:
+        size = self._cell_size
+        x1 = box.x // size
+        y1 = box.y // size
+        x2 = (box.x + box.width - 1) // size
+        y2 = (box.y + box.height - 1) // size
+        for cell_x in range(x1, x2 + 1):
+            for cell_y in range(y1, y2 + 1):
+                yield cell_x, cell_y
+
+    def _link(self, key: K, box: FrozenBox) -> None:
+        if box.empty:
+            return
+        cells = self._cells
+        for cell in self._cells_of(box):
+            keys = cells.get(cell)
+            if keys is None:
+                cells[cell] = {key}
+            else:
+                keys.add(key)
+
+    def _unlink(self, key: K, box: FrozenBox) -> None:
+        if box.empty:
+            return
+        cells = self._cells
+        for cell in self._cells_of(box):
+            keys = cells[cell]
+            keys.discard(key)
+            if not keys:
+                del cells[cell]
@@ -0,0 +1,281 @@
+# Copyright (c) 2026
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
+
+from pywayland.server import Listener
+
+from wlroots import ffi, lib
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any
+
+    from wlroots.wlr_types import Cursor, Surface
+    from wlroots.wlr_types.touch import (
+        TouchCancelEvent,
+        TouchDownEvent,
+        TouchMotionEvent,
+        TouchUpEvent,
+    )
+
+    # Given layout coordinates, the surface under them and the surface-local
+    # coordinates, or None if there is no surface there
+    SurfaceAt = Callable[[float, float], tuple[Surface, float, float] | None]
+
+
+class TrackedTouchPoint:
+    """A touch point currently down on a touch device
+
+    The surface a touch point went down on keeps receiving its events until
+    it is lifted, so `surface` doesn't change as the point moves, while the
+    surface-local coordinates follow it. It is set to None if the surface is
+    destroyed while the point is down.
+    """
+
+    __slots__ = (
+        "_history",
+        "_history_count",
+        "_history_index",
+        "_surface_destroy_listener",
+        "_surface_origin",
+        "down_layout_x",
+        "down_layout_y",
+        "down_time_msec",
+        "layout_x",
+        "layout_y",
+        "surface",
+        "time_msec",
+        "touch_id",
+    )
+
+    def __init__(
+        self,
+        touch_id: int,
+        time_msec: int,
+        layout_x: float,
+        layout_y: float,
+        surface: Surface | None,
+        surface_origin: tuple[float, float],
+        history: int,
+    ) -> None:
+        self.touch_id = touch_id
+        self.surface = surface
+        self._surface_origin = surface_origin
+        self._surface_destroy_listener: Listener | None = None
+        if surface is not None:
+            self._surface_destroy_listener = Listener(self._on_surface_destroy)
+            surface.destroy_event.add(self._surface_destroy_listener)
+        self.down_time_msec = time_msec
+        self.down_layout_x = layout_x
+        self.down_layout_y = layout_y
+        self.time_msec = time_msec
+        self.layout_x = layout_x
+        self.layout_y = layout_y
+
+        # Ring buffer of (time_msec, layout_x, layout_y) triples
+        self._history = array("d", [0.0]) * (3 * max(history, 1))
+        self._history_index = 0
+        self._history_count = 0
+        self._record()
+
+    @property
+    def surface_x(self) -> float:
+        return self.layout_x - self._surface_origin[0]
+
+    @property
+    def surface_y(self) -> float:
+        return self.layout_y - self._surface_origin[1]
+
+    def _record(self) -> None:
+        history = self._history
+        index = self._history_index
+        history[index] = self.time_msec
+        history[index + 1] = self.layout_x
+        history[index + 2] = self.layout_y
+        self._history_index = (index + 3) % len(history)
+        self._history_count = min(self._history_count + 1, len(history) // 3)
+
+    def _release(self) -> None:
+        if self._surface_destroy_listener is not None:
+            self._surface_destroy_listener.remove()
+            self._surface_destroy_listener = None
+
+    def _on_surface_destroy(self, listener: Listener, data: Any) -> None:
+        self._release()
+        self.surface = None
+
+    def _move(self, time_msec: int, layout_x: float, layout_y: float) -> None:
+        self.time_msec = time_msec
+        self.layout_x = layout_x
+        self.layout_y = layout_y
+        self._record()
+
+    def history(self) -> Iterator[tuple[float, float, float]]:
+        """The recent positions of the point, oldest first
+
+        Yields (time_msec, layout_x, layout_y) tuples, the last of which is
+        the current position.
+        """
+        history = self._history
+        size = len(history)
+        start = (self._history_index - 3 * self._history_count) % size
+        for i in range(self._history_count):
+            index = (start + 3 * i) % size
+            yield history[index], history[index + 1], history[index + 2]
+
+    def velocity(self) -> tuple[float, float]:
+        """The velocity of the point over its recorded history, in px/ms"""
+        if self._history_count < 2:
+            return 0.0, 0.0
+        history = self._history
+        size = len(history)
+        first = (self._history_index - 3 * self._history_count) % size
+        last = (self._history_index - 3) % size
+        elapsed = history[last] - history[first]
+        if elapsed <= 0:
+            return 0.0, 0.0
+        return (
+            (history[last + 1] - history[first + 1]) / elapsed,
+            (history[last + 2] - history[first + 2]) / elapsed,
+        )
+
+
+class TouchPointRegistry:
+    def __init__(
+        self,
+        cursor: Cursor,
+        surface_at: SurfaceAt | None = None,
+        *,
+        history: int = 16,
+    ) -> None:
+        """Track the touch points of the touch devices attached to a cursor
+
+        Unlike `SeatTouchState.touch_points`, which walks the touch points of
+        the seat, touch points are kept in a dict by id, updated from the
+        touch events of the cursor. Each point keeps a short history of its
+        positions for gesture recognition.
+
+        The registry should be created before the compositor listens to the
+        touch events of the cursor, such that its handlers see up to date
+        touch points.
+
+        :param cursor:
+            The cursor whose touch events are tracked.
+        :param surface_at:
+            Finds the surface under a point in layout coordinates, used to
+            resolve the surface a touch point goes down on.
+        :param history:
+            The number of positions kept for each touch point.
+        """
+        self._cursor = cursor
+        self._surface_at = surface_at
+        self._history = history
+        self._points: dict[int, TrackedTouchPoint] = {}
+        self._coords = ffi.new("double[2]")
+
+        self._listeners = [
+            Listener(self._on_touch_down),
+            Listener(self._on_touch_motion),
+            Listener(self._on_touch_up),
+            Listener(self._on_touch_cancel),
+        ]
+        down, motion, up, cancel = self._listeners
+        cursor.touch_down_event.add(down)
+        cursor.touch_motion_event.add(motion)
+        cursor.touch_up_event.add(up)
+        cursor.touch_cancel_event.add(cancel)
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def __contains__(self, touch_id: int) -> bool:
+        return touch_id in self._points
+
+    def __iter__(self) -> Iterator[TrackedTouchPoint]:
+        return iter(self._points.values())
+
+    def __getitem__(self, touch_id: int) -> TrackedTouchPoint:
+        return self._points[touch_id]
+
+    def get(self, touch_id: int) -> TrackedTouchPoint | None:
+        """Get the touch point with the given id, if it is down"""
+        return self._points.get(touch_id)
+
+    def centroid(self) -> tuple[float, float] | None:
+        """The mean position of the touch points, in layout coordinates"""
+        if not self._points:
+            return None
+        count = len(self._points)
+        return (
+            sum(point.layout_x for point in self._points.values()) / count,
+            sum(point.layout_y for point in self._points.values()) / count,
+        )
+
+    def clear(self) -> None:
+        """Forget all touch points"""
+        for point in self._points.values():
+            point._release()
+        self._points.clear()
+
+    def destroy(self) -> None:
+        """Stop tracking touch points"""
+        for listener in self._listeners:
+            listener.remove()
+        self._listeners.clear()
+        self.clear()
+
+    def _remove(self, touch_id: int) -> None:
+        point = self._points.pop(touch_id, None)
+        if point is not None:
+            point._release()
+
+    def _to_layout_coords(self, event_ptr: ffi.CData) -> tuple[float, float]:
+        coords = self._coords
+        lib.wlr_cursor_absolute_to_layout_coords(
+            self._cursor._ptr,
+            ffi.addressof(event_ptr.touch.base),
+            event_ptr.x,
+            event_ptr.y,
+            coords,
+            coords + 1,
+        )
+        return coords[0], coords[1]
+
+    def _on_touch_down(self, listener: Listener, event: TouchDownEvent) -> None:
+        layout_x, layout_y = self._to_layout_coords(event._ptr)
+
+        surface = None
+        surface_origin = (layout_x, layout_y)
+        if self._surface_at is not None:
+            found = self._surface_at(layout_x, layout_y)
+            if found is not None:
+                surface, surface_x, surface_y = found
+                surface_origin = (layout_x - surface_x, layout_y - surface_y)
+
+        self._remove(event.touch_id)
+        self._points[event.touch_id] = TrackedTouchPoint(
+            event.touch_id,
+            event.time_msec,
+            layout_x,
+            layout_y,
+            surface,
+            surface_origin,
+            self._history,
+        )
+
+    def _on_touch_motion(self, listener: Listener, event: TouchMotionEvent) -> None:
+        point = self._points.get(event._ptr.touch_id)
+        if point is None:
+            return
+        layout_x, layout_y = self._to_layout_coords(event._ptr)
+        point._move(event._ptr.time_msec, layout_x, layout_y)
+
+    def _on_touch_up(self, listener: Listener, event: TouchUpEvent) -> None:
+        self._remove(event.touch_id)
+
+    def _on_touch_cancel(self, listener: Listener, event: TouchCancelEvent) -> None:
+        self._remove(event.touch_id)
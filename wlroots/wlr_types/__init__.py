@@ -9,6 +9,7 @@ from .compositor import (  # noqa: F401
     SurfaceState,
 )
 from .cursor import Cursor  # noqa: F401
+from .damage_ring import DamageRing  # noqa: F401
 from .data_control_v1 import DataControlManagerV1  # noqa: F401
 from .data_device_manager import DataDeviceManager  # noqa: F401
 from .export_dmabuf_v1 import ExportDmabufManagerV1  # noqa: F401
@@ -19,9 +20,13 @@ from .input_device import InputDevice  # noqa: F401
 from .input_inhibit import InputInhibitManager  # noqa: F401
 from .keyboard import Keyboard  # noqa: F401
 from .layer_shell_v1 import LayerShellV1  # noqa: F401
-from .matrix import Matrix  # noqa: F401
-from .output import Output, OutputState  # noqa: F401
-from .output_layout import OutputLayout, OutputLayoutOutput  # noqa: F401
+from .matrix import Matrix, MatrixArray  # noqa: F401
+from .output import Output, OutputState, OutputStateBuilder  # noqa: F401
+from .output_layout import (  # noqa: F401
+    OutputLayout,
+    OutputLayoutCache,
+    OutputLayoutOutput,
+)
 from .pointer import (  # noqa: F401
     PointerAxisEvent,
     PointerButtonEvent,
@@ -47,8 +52,8 @@ from .scene import (  # noqa: F401
     SceneTree,
 )
 from .screencopy_v1 import ScreencopyManagerV1  # noqa: F401
-from .seat import Seat  # noqa: F401
-from .texture import Texture  # noqa: F401
+from .seat import Seat, SeatPointerFocus  # noqa: F401
+from .texture import Texture, TextureCache  # noqa: F401
 from .viewporter import Viewporter  # noqa: F401
 from .virtual_keyboard_v1 import VirtualKeyboardManagerV1  # noqa: F401
 from .virtual_pointer_v1 import VirtualPointerManagerV1  # noqa: F401
@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+import contextlib
 import enum
+from collections.abc import Iterator
+from typing import Any
 
 from wlroots import Ptr, ffi, lib
+from wlroots.util._numpy import require_numpy
+from wlroots.util.drm_format import DrmFormatInfo, drm_format_info
 
 
 class BufferDataPtrAccessFlag(enum.IntFlag):
@@ -12,10 +17,89 @@ class BufferDataPtrAccessFlag(enum.IntFlag):
     WRITE = lib.WLR_BUFFER_DATA_PTR_ACCESS_WRITE
 
 
+class BufferMapping:
+    """The pixels of a buffer, mapped for CPU access by `Buffer.map`
+
+    The views of the mapping share the memory of the buffer, without
+    copying, and must not be used once the mapping is closed.
+    """
+
+    __slots__ = ("_data", "flags", "format", "format_info", "height", "stride", "width")
+
+    def __init__(
+        self,
+        data: ffi.CData,
+        fmt: int,
+        stride: int,
+        width: int,
+        height: int,
+        flags: BufferDataPtrAccessFlag,
+    ) -> None:
+        self._data = ffi.buffer(data, stride * height)
+        self.format = fmt
+        self.format_info: DrmFormatInfo | None = drm_format_info(fmt)
+        self.stride = stride
+        self.width = width
+        self.height = height
+        self.flags = flags
+
+    @property
+    def readonly(self) -> bool:
+        return not self.flags & BufferDataPtrAccessFlag.WRITE
+
+    def as_memoryview(self) -> memoryview:
+        """A view of the rows of the buffer, of shape (height, stride) and bytes
+
+        Each row holds the pixels of a line of the buffer, followed by any
+        padding up to the stride. The view of an empty buffer is
+        one-dimensional, as memoryviews can't have zeros in their shape. The
+        view is read-only unless the buffer was mapped for writing.
+        """
+        view = memoryview(self._data)
+        if self.readonly:
+            view = view.toreadonly()
+        if not len(view):
+            return view
+        return view.cast("B", (self.height, self.stride))
+
+    def as_numpy(self) -> Any:
+        """An array of the pixels, of shape (height, width, bytes per pixel)
+
+        The array is strided by the stride of the buffer, so the padding at
+        the end of the rows is skipped. If the format is not known, the array
+        holds the rows of the buffer, of shape (height, stride). Raises
+        ImportError if NumPy is not installed.
+        """
+        np = require_numpy("BufferMapping.as_numpy")
+        info = self.format_info
+        if info is None:
+            array = np.frombuffer(self._data, dtype=np.uint8).reshape(
+                self.height, self.stride
+            )
+        else:
+            array = np.ndarray(
+                (self.height, self.width, info.bytes_per_pixel),
+                dtype=np.uint8,
+                buffer=self._data,
+                strides=(self.stride, info.bytes_per_pixel, 1),
+            )
+        if self.readonly:
+            array.flags.writeable = False
+        return array
+
+
 class Buffer(Ptr):
     def __init__(self, ptr: ffi.CData) -> None:
         self._ptr = ptr
 
+    @property
+    def width(self) -> int:
+        return self._ptr.width
+
+    @property
+    def height(self) -> int:
+        return self._ptr.height
+
     def drop(self) -> None:
         """Destroys this wlr_texture."""
         lib.wlr_buffer_drop(self._ptr)
@@ -38,3 +122,18 @@ class Buffer(Ptr):
     def end_data_ptr_access(self) -> None:
         """End access to the underlying data"""
         lib.wlr_buffer_end_data_ptr_access(self._ptr)
+
+    @contextlib.contextmanager
+    def map(
+        self, flags: BufferDataPtrAccessFlag = BufferDataPtrAccessFlag.READ
+    ) -> Iterator[BufferMapping]:
+        """Map the pixels of the buffer within the context
+
+        Data access is ended when exiting the context, even on errors, after
+        which the views of the mapping must not be used.
+        """
+        data, fmt, stride = self.begin_data_ptr_access(flags)
+        try:
+            yield BufferMapping(data, fmt, stride, self.width, self.height, flags)
+        finally:
+            self.end_data_ptr_access()
@@ -143,6 +143,9 @@ class Cursor(PtrHasData):
             ptr=ffi.addressof(self._ptr.events.touch_frame),
         )
 
+        # The manager and name of the XCursor image last set, if any
+        self._xcursor: tuple[ffi.CData, str] | None = None
+
     @property
     def x(self) -> float:
         """The x position of the cursor"""
@@ -270,6 +273,7 @@ class Cursor(PtrHasData):
         """
         surface_ptr = ptr_or_null(surface)
         lib.wlr_cursor_set_surface(self._ptr, surface_ptr, hotspot[0], hotspot[1])
+        self._xcursor = None
 
     def __enter__(self) -> Cursor:
         """Context manager to clean up the cursor"""
@@ -304,10 +308,23 @@ class Cursor(PtrHasData):
         output_ptr = ptr_or_null(output)
         lib.wlr_cursor_map_input_to_output(self._ptr, input_device._ptr, output_ptr)
 
+    @property
+    def xcursor_name(self) -> str | None:
+        """The name of the XCursor image shown, None if a surface was set"""
+        if self._xcursor is None:
+            return None
+        return self._xcursor[1]
+
     def set_xcursor(self, manager: XCursorManager, name: str) -> None:
         """
         Set the cursor image from an XCursor theme.
 
-        The image will be loaded from the struct wlr_xcursor_manager.
+        The image will be loaded from the struct wlr_xcursor_manager. Setting
+        the image already shown is a no-op, the cursor picks the image at the
+        scale of each output by itself.
         """
-        lib.wlr_cursor_set_xcursor(self._ptr, manager._ptr, name.encode())
+        xcursor = (manager._ptr, name)
+        if xcursor == self._xcursor:
+            return
+        lib.wlr_cursor_set_xcursor(self._ptr, manager._ptr, manager._intern(name))
+        self._xcursor = xcursor
@@ -0,0 +1,175 @@
+# Copyright (c) 2026
+
+from __future__ import annotations
+
+from types import TracebackType
+from typing import TYPE_CHECKING
+
+from wlroots import Ptr, ffi, lib
+from wlroots.util.box import Box, FrozenBox
+from wlroots.util.region import PixmanRegion32
+
+if TYPE_CHECKING:
+    from wlroots.wlr_types.output import Output
+
+
+class DamageRing(Ptr):
+    def __init__(self) -> None:
+        """Track the damage of an output across its buffers
+
+        Damage is added to the ring in output-buffer-local coordinates, and
+        accumulated into the current damage until `rotate` is called after
+        each committed frame. As the output cycles through several buffers,
+        the region to repaint in a buffer is the damage of all of the frames
+        since the buffer was last used, as given by `get_buffer_damage` for
+        the age of the buffer.
+
+        The ring must be finished with `finish`, or used as a context manager.
+        """
+        self._ptr = ffi.new("struct wlr_damage_ring *")
+        lib.wlr_damage_ring_init(self._ptr)
+
+        # Reused between frames, to avoid allocating regions per frame
+        self._buffer_damage = PixmanRegion32()
+        self._buffer_damage.init()
+        self._scratch = PixmanRegion32()
+        self._scratch.init()
+
+    def finish(self) -> None:
+        """Release the regions of the ring"""
+        lib.wlr_damage_ring_finish(self._ptr)
+        self._buffer_damage.fini()
+        self._scratch.fini()
+
+    def __enter__(self) -> DamageRing:
+        """Use the damage ring in a context manager"""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Finish the damage ring when exiting the context"""
+        self.finish()
+
+    @property
+    def width(self) -> int:
+        return self._ptr.width
+
+    @property
+    def height(self) -> int:
+        return self._ptr.height
+
+    @property
+    def current(self) -> PixmanRegion32:
+        """The damage accumulated since the last call to `rotate`"""
+        return PixmanRegion32(ffi.addressof(self._ptr, "current"))
+
+    def set_bounds(self, width: int, height: int) -> None:
+        """Set the size of the output buffers, damaging them whole if changed"""
+        lib.wlr_damage_ring_set_bounds(self._ptr, width, height)
+
+    def set_bounds_from_output(self, output: Output) -> None:
+        """Set the bounds to the size of the buffers of the output"""
+        lib.wlr_damage_ring_set_bounds(self._ptr, output._ptr.width, output._ptr.height)
+
+    def add(self, damage: PixmanRegion32) -> bool:
+        """Add a region, in output-buffer-local coordinates
+
+        Returns true if the damage is within the bounds of the ring.
+        """
+        return lib.wlr_damage_ring_add(self._ptr, damage._ptr)
+
+    def add_box(self, box: Box | FrozenBox) -> bool:
+        """Add a box, in output-buffer-local coordinates
+
+        Returns true if the damage is within the bounds of the ring.
+        """
+        return lib.wlr_damage_ring_add_box(self._ptr, box._ptr)
+
+    def add_whole(self) -> None:
+        """Damage the whole output"""
+        lib.wlr_damage_ring_add_whole(self._ptr)
+
+    def add_output_damage(
+        self,
+        damage: PixmanRegion32,
+        output: Output,
+        output_x: int = 0,
+        output_y: int = 0,
+    ) -> bool:
+        """Add a region in layout coordinates, as it is seen on the output
+
+        The region is moved to the origin of the output, scaled by the scale
+        of the output, rounding outwards to whole pixels, and transformed by
+        the transform of the output into output-buffer-local coordinates.
+
+        :param damage:
+            The damaged region, left unchanged.
+        :param output:
+            The output the ring tracks the damage of.
+        :param output_x:
+            The x coordinate of the output in the layout.
+        :param output_y:
+            The y coordinate of the output in the layout.
+        """
+        output_ptr = output._ptr
+        scratch = self._scratch
+        scratch.copy_from(damage)
+        scratch.translate(-output_x, -output_y)
+        scratch.scale(scratch, output_ptr.scale)
+
+        # As with wlr_output_transformed_resolution, without allocating
+        width = output_ptr.width
+        height = output_ptr.height
+        if output_ptr.transform % 2:
+            width, height = height, width
+        scratch.transform(
+            scratch,
+            lib.wlr_output_transform_invert(output_ptr.transform),
+            width,
+            height,
+        )
+        return self.add(scratch)
+
+    def rotate(self) -> None:
+        """Move the current damage to the previous frames
+
+        This should be called after each successful commit of the output.
+        """
+        lib.wlr_damage_ring_rotate(self._ptr)
+
+    def get_buffer_damage(self, buffer_age: int, damage: PixmanRegion32) -> None:
+        """Set the region to repaint in a buffer of the given age
+
+        A buffer age of zero or older than the ring damages the whole output.
+        """
+        lib.wlr_damage_ring_get_buffer_damage(self._ptr, buffer_age, damage._ptr)
+
+    def buffer_damage(self, buffer_age: int) -> PixmanRegion32:
+        """The region to repaint in a buffer of the given age
+
+        The region is owned by the ring and reused: it is only valid until
+        the next call, and must not be finished by the caller.
+        """
+        self.get_buffer_damage(buffer_age, self._buffer_damage)
+        return self._buffer_damage
+
+    def scissor_boxes(self, buffer_age: int) -> list[FrozenBox]:
+        """The boxes to repaint in a buffer of the given age
+
+        The boxes are the rectangles of `buffer_damage`, which don't overlap,
+        in output-buffer-local coordinates. Rendering can be limited to each
+        of them in turn with `Renderer.scissor`.
+        """
+        rects = self.buffer_damage(buffer_age).rectangles_as_memoryview()
+        # Flatten to (x1, y1, x2, y2) quadruplets
+        flat = rects.cast("B").cast("i")
+        return [
+            FrozenBox(
+                flat[i], flat[i + 1], flat[i + 2] - flat[i], flat[i + 3] - flat[i + 1]
+            )
+            for i in range(0, len(flat), 4)
+        ]
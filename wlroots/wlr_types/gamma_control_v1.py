@@ -1,8 +1,17 @@
 # Copyright (c) 2021 Matt Colligan
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from pywayland.server import Display, Signal
 
-from wlroots import PtrHasData, ffi, lib
+from wlroots import Ptr, PtrHasData, ffi, instance_or_none, lib
+
+from .output import Output
+
+if TYPE_CHECKING:
+    from .output import OutputState
 
 
 class GammaControlManagerV1(PtrHasData):
@@ -11,3 +20,68 @@ class GammaControlManagerV1(PtrHasData):
         self._ptr = lib.wlr_gamma_control_manager_v1_create(display._ptr)
 
         self.destroy_event = Signal(ptr=ffi.addressof(self._ptr.events.destroy))
+        self.set_gamma_event = Signal(
+            ptr=ffi.addressof(self._ptr.events.set_gamma),
+            data_wrapper=GammaControlManagerV1SetGammaEvent,
+        )
+
+    def get_control(self, output: Output) -> GammaControlV1 | None:
+        """Get the gamma control a client has created for the output, if any"""
+        ptr = lib.wlr_gamma_control_manager_v1_get_control(self._ptr, output._ptr)
+        return instance_or_none(GammaControlV1, ptr)
+
+
+class GammaControlV1(PtrHasData):
+    def __init__(self, ptr: ffi.CData) -> None:
+        """A wlr_gamma_control_v1 instance, created by a client for an output"""
+        self._ptr = ffi.cast("struct wlr_gamma_control_v1 *", ptr)
+
+    @property
+    def output(self) -> Output:
+        return Output(self._ptr.output)
+
+    @property
+    def ramp_size(self) -> int:
+        """The number of entries in each of the red, green and blue ramps"""
+        return self._ptr.ramp_size
+
+    @property
+    def table(self) -> memoryview | None:
+        """The gamma table set by the client, or None if it hasn't set one
+
+        The red, green and blue ramps follow each other, for a total of
+        3 * `ramp_size` uint16 values. The returned view is only valid until
+        the client sets a new table.
+        """
+        if self._ptr.table == ffi.NULL:
+            return None
+        size = 3 * self._ptr.ramp_size * ffi.sizeof("uint16_t")
+        return memoryview(ffi.buffer(self._ptr.table, size)).cast("H")
+
+    def apply(self, output_state: OutputState) -> bool:
+        """Set the gamma table of the client on the output state
+
+        If the client hasn't set a table, the gamma table is reset.
+        """
+        return lib.wlr_gamma_control_v1_apply(self._ptr, output_state._ptr)
+
+    def send_failed_and_destroy(self) -> None:
+        """Notify the client that the gamma table couldn't be applied"""
+        lib.wlr_gamma_control_v1_send_failed_and_destroy(self._ptr)
+
+
+class GammaControlManagerV1SetGammaEvent(Ptr):
+    def __init__(self, ptr: ffi.CData) -> None:
+        """Event emitted when the gamma table of an output needs to be updated"""
+        self._ptr = ffi.cast(
+            "struct wlr_gamma_control_manager_v1_set_gamma_event *", ptr
+        )
+
+    @property
+    def output(self) -> Output:
+        return Output(self._ptr.output)
+
+    @property
+    def control(self) -> GammaControlV1 | None:
+        """The gamma control for the output, None if it has been destroyed"""
+        return instance_or_none(GammaControlV1, self._ptr.control)
@@ -1,11 +1,21 @@
 # Copyright (c) Charbel Assaad 2023
 
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
 from pywayland.server import Display
 
-from wlroots import Ptr, lib
+from wlroots import Ptr, ffi, lib
 
 from .seat import Seat
 
+if TYPE_CHECKING:
+    from typing import Any
+
+    from pywayland.server.eventloop import EventSource
+
 
 class IdleNotifierV1(Ptr):
     def __init__(self, display: Display) -> None:
@@ -32,3 +42,84 @@ class IdleNotifierV1(Ptr):
         on a seat.
         """
         lib.wlr_idle_notifier_v1_notify_activity(self._ptr, seat._ptr)
+
+
+class _SeatActivity:
+    def __init__(self, seat: Seat, timer: EventSource) -> None:
+        self.seat = seat
+        self.timer = timer
+        self.last_notify = -float("inf")
+        self.pending = False
+
+
+class ThrottledIdleNotifierV1:
+    def __init__(
+        self, display: Display, notifier: IdleNotifierV1, interval_ms: float = 100
+    ) -> None:
+        """Coalesce activity notifications sent to an idle notifier
+
+        Notifying activity resets the idle timers of all clients watching the
+        seat, which is wasteful to do on every pointer motion. Activity is
+        forwarded at most once per `interval_ms` per seat: the first activity
+        after a quiet period, such as the transition from idle back to active,
+        is forwarded immediately, and activity within the interval is
+        forwarded once the interval has elapsed.
+
+        Clients may thus see the seat go idle up to `interval_ms` later than
+        without throttling.
+
+        :param display:
+            The display whose event loop is used for the trailing
+            notifications.
+        :param notifier:
+            The idle notifier to forward activity to.
+        :param interval_ms:
+            The minimum time between notifications for a seat.
+        """
+        self._event_loop = display.get_event_loop()
+        self.notifier = notifier
+        self._interval = interval_ms / 1000
+        self._seats: dict[ffi.CData, _SeatActivity] = {}
+
+    def notify_activity(self, seat: Seat) -> None:
+        """Notify for user activity on a seat, rate limited"""
+        activity = self._seats.get(seat._ptr)
+        if activity is None:
+            timer = self._event_loop.add_timer(self._timer_callback, seat._ptr)
+            activity = _SeatActivity(seat, timer)
+            self._seats[seat._ptr] = activity
+
+        if activity.pending:
+            return
+
+        now = time.monotonic()
+        elapsed = now - activity.last_notify
+        if elapsed >= self._interval:
+            activity.last_notify = now
+            self.notifier.notify_activity(seat)
+        else:
+            activity.pending = True
+            # A timeout of zero would disarm the timer
+            activity.timer.timer_update(
+                max(1, round((self._interval - elapsed) * 1000))
+            )
+
+    def remove_seat(self, seat: Seat) -> None:
+        """Stop tracking the seat, e.g. before it is destroyed"""
+        activity = self._seats.pop(seat._ptr, None)
+        if activity is not None:
+            activity.timer.remove()
+
+    def destroy(self) -> None:
+        """Release the timers of all seats, pending activity is dropped"""
+        for activity in self._seats.values():
+            activity.timer.remove()
+        self._seats.clear()
+
+    def _timer_callback(self, seat_ptr: Any) -> int:
+        activity = self._seats.get(seat_ptr)
+        if activity is not None and activity.pending:
+            activity.pending = False
+            activity.last_notify = time.monotonic()
+            self.notifier.notify_activity(activity.seat)
+        return 0
@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import enum
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
 from weakref import WeakKeyDictionary
 
 from pywayland.protocol.wayland import WlKeyboard
@@ -11,6 +14,10 @@ from pywayland.server import Signal
 from wlroots import Ptr, PtrHasData, ffi, lib
 from wlroots.wlr_types.input_device import InputDevice
 
+if TYPE_CHECKING:
+    from pywayland.server import Display
+    from pywayland.server.eventloop import EventSource
+
 _weakkeydict: WeakKeyDictionary[ffi.CData, ffi.CData] = WeakKeyDictionary()
 
 
@@ -134,6 +141,26 @@ class Keyboard(PtrHasData):
             self._ptr, zero[0], zero[0], mask._mask[0], zero[0]
         )
 
+    def notify_key(
+        self,
+        time_msec: int,
+        keycode: int,
+        state: WlKeyboard.key_state,
+        *,
+        update_state: bool = True,
+    ) -> None:
+        """Feed a key event to the keyboard, as if it came from the device
+
+        The xkb state of the keyboard is updated and the `key` event is
+        emitted, followed by the `modifiers` event if they changed.
+        """
+        event = ffi.new("struct wlr_keyboard_key_event *")
+        event.time_msec = time_msec
+        event.keycode = keycode
+        event.update_state = update_state
+        event.state = state
+        lib.wlr_keyboard_notify_key(self._ptr, event)
+
     @property
     def keycodes(self) -> int:
         """Keycodes associated with the keyboard"""
@@ -188,3 +215,225 @@ class KeyboardModifiers(Ptr):
     def group(self) -> int:
         """The modifier group"""
         return self._ptr.group
+
+
+KeybindingCallback = Callable[[], Any]
+
+
+class KeybindingTable:
+    def __init__(
+        self,
+        ignored_modifiers: KeyboardModifier = KeyboardModifier.CAPS
+        | KeyboardModifier.MOD2,
+        key_repeat: KeyRepeat | None = None,
+    ) -> None:
+        """A table of compositor keybindings
+
+        Bindings are compiled into a dictionary keyed on the modifier mask and
+        keysym, such that dispatching a key event is a single lookup per keysym
+        produced by the key. The keysyms are those produced by the current
+        state of the keyboard, e.g. Shift+1 produces `exclam` on a US layout.
+
+        :param ignored_modifiers:
+            Modifiers which are not taken into account when matching bindings,
+            by default Caps Lock and Num Lock.
+        :param key_repeat:
+            Repeats the bindings added with `repeat=True` while their key is
+            held.
+        """
+        self._bindings: dict[int, KeybindingCallback] = {}
+        self._repeating: set[int] = set()
+        self._key_repeat = key_repeat
+        self._modifier_mask = ~int(ignored_modifiers) & 0xFFFFFFFF
+        # Reused for every lookup of the keysyms of a key
+        self._syms_out = ffi.new("const xkb_keysym_t **")
+
+    def __len__(self) -> int:
+        return len(self._bindings)
+
+    @staticmethod
+    def _keysym(keysym: int | str) -> int:
+        if isinstance(keysym, int):
+            return keysym
+        value = lib.xkb_keysym_from_name(keysym.encode(), 0)
+        if value == 0:
+            raise ValueError(f"Unknown keysym name: {keysym}")
+        return value
+
+    def _key(self, modifiers: KeyboardModifier | int, keysym: int) -> int:
+        return (int(modifiers) & self._modifier_mask) << 32 | keysym
+
+    def add(
+        self,
+        modifiers: KeyboardModifier | int,
+        keysym: int | str,
+        callback: KeybindingCallback,
+        *,
+        repeat: bool = False,
+    ) -> None:
+        """Bind the keysym, pressed with exactly the given modifiers
+
+        :param modifiers:
+            The modifiers which must be held, e.g. `KeyboardModifier.LOGO`.
+        :param keysym:
+            The keysym, either as its value or as its name, e.g. "Return".
+        :param callback:
+            Called without arguments when the binding is pressed.
+        :param repeat:
+            Whether the binding repeats while its key is held, at the repeat
+            rate of the keyboard. Requires the table to have a `KeyRepeat`.
+        """
+        if repeat and self._key_repeat is None:
+            raise ValueError("Repeating keybindings require a KeyRepeat")
+        key = self._key(modifiers, self._keysym(keysym))
+        self._bindings[key] = callback
+        if repeat:
+            self._repeating.add(key)
+        else:
+            self._repeating.discard(key)
+
+    def remove(self, modifiers: KeyboardModifier | int, keysym: int | str) -> None:
+        """Remove the binding, if it exists"""
+        key = self._key(modifiers, self._keysym(keysym))
+        self._bindings.pop(key, None)
+        self._repeating.discard(key)
+
+    def clear(self) -> None:
+        """Remove all bindings"""
+        self._bindings.clear()
+        self._repeating.clear()
+
+    def lookup(
+        self, modifiers: KeyboardModifier | int, keysym: int
+    ) -> KeybindingCallback | None:
+        """Get the callback bound to the keysym with the given modifiers"""
+        return self._bindings.get(self._key(modifiers, keysym))
+
+    def dispatch(self, keyboard: Keyboard, key_event: KeyboardKeyEvent) -> bool:
+        """Run the binding matching the key event, if any
+
+        Only key presses trigger bindings. Returns True if a binding was run,
+        in which case the key event should not be forwarded to clients.
+
+        Pressing any key stops the repeat of the binding held before, as does
+        releasing its key.
+        """
+        event_ptr = key_event._ptr
+        key_repeat = self._key_repeat
+        if event_ptr.state != WlKeyboard.key_state.pressed:
+            if key_repeat is not None and key_repeat.keycode == event_ptr.keycode:
+                key_repeat.stop()
+            return False
+
+        if key_repeat is not None and key_repeat.keycode is not None:
+            key_repeat.stop()
+        if not self._bindings:
+            return False
+
+        keyboard_ptr = keyboard._ptr
+        modifiers = (
+            lib.wlr_keyboard_get_modifiers(keyboard_ptr) & self._modifier_mask
+        ) << 32
+        # Translate the libinput keycode to xkbcommon
+        nsyms = lib.xkb_state_key_get_syms(
+            keyboard_ptr.xkb_state, event_ptr.keycode + 8, self._syms_out
+        )
+        syms = self._syms_out[0]
+        for i in range(nsyms):
+            key = modifiers | syms[i]
+            callback = self._bindings.get(key)
+            if callback is not None:
+                callback()
+                if key_repeat is not None and key in self._repeating:
+                    key_repeat.start(keyboard, event_ptr.keycode, callback)
+                return True
+        return False
+
+
+class KeyRepeat:
+    def __init__(self, display: Display) -> None:
+        """Repeat a callback while a key is held
+
+        A single event loop timer is armed for the repeat delay of the
+        keyboard, then re-armed at its repeat rate for as long as the repeat
+        runs. The timer is kept for the lifetime of the repeater, starting and
+        stopping repeats doesn't create or destroy event sources.
+
+        Repeats should be stopped when the key is released, which
+        `KeybindingTable.dispatch` takes care of, and when keyboard focus
+        changes.
+
+        :param display:
+            The display whose event loop is used for the repeat timer.
+        """
+        self._timer: EventSource | None = display.get_event_loop().add_timer(
+            self._timer_callback, None
+        )
+        self._keyboard: Keyboard | None = None
+        self._callback: KeybindingCallback | None = None
+        self.keycode: int | None = None
+        self._next_repeat = 0.0
+
+    @property
+    def active(self) -> bool:
+        """Whether a key is currently repeating"""
+        return self.keycode is not None
+
+    def start(
+        self, keyboard: Keyboard, keycode: int, callback: KeybindingCallback
+    ) -> None:
+        """Start repeating the callback of the key just pressed
+
+        The callback is called after the repeat delay of the keyboard, then at
+        its repeat rate, until `stop` is called. Nothing is repeated if the
+        repeat rate of the keyboard is zero.
+        """
+        self.stop()
+        repeat_info = keyboard._ptr.repeat_info
+        if repeat_info.rate <= 0 or self._timer is None:
+            return
+
+        self._keyboard = keyboard
+        self._callback = callback
+        self.keycode = keycode
+        self._next_repeat = time.monotonic() + repeat_info.delay / 1000
+        self._timer.timer_update(max(1, repeat_info.delay))
+
+    def stop(self) -> None:
+        """Stop the repeat, if any"""
+        if self.keycode is None:
+            return
+        self._keyboard = None
+        self._callback = None
+        self.keycode = None
+        if self._timer is not None:
+            self._timer.timer_update(0)
+
+    def destroy(self) -> None:
+        """Stop the repeat and remove the repeat timer"""
+        self.stop()
+        if self._timer is not None:
+            self._timer.remove()
+            self._timer = None
+
+    def _timer_callback(self, data: Any) -> int:
+        callback = self._callback
+        keyboard = self._keyboard
+        if callback is None or keyboard is None:
+            return 0
+
+        callback()
+        # The callback may have stopped the repeat, e.g. by changing focus
+        if self._callback is not callback or self._timer is None:
+            return 0
+
+        rate = keyboard._ptr.repeat_info.rate
+        if rate <= 0:
+            self.stop()
+            return 0
+        # Schedule from the intended time of this repeat, rather than from
+        # now, such that the rate doesn't drift with the event loop latency
+        now = time.monotonic()
+        self._next_repeat = max(self._next_repeat + 1 / rate, now)
+        self._timer.timer_update(max(1, round((self._next_repeat - now) * 1000)))
+        return 0
@@ -2,16 +2,22 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+from typing import Any
+
 from pywayland.protocol.wayland import WlOutput
 
 from wlroots import Ptr, ffi, lib
-from wlroots.util.box import Box
+from wlroots.util._numpy import require_numpy
+from wlroots.util.box import Box, BoxArray, FrozenBox
 
 
 class Matrix(Ptr):
     def __init__(self, ptr: ffi.CData) -> None:
         """A matrix which encodes transformations used for rendering"""
         self._ptr = ptr
+        # The cdata owning the memory of the matrix, when it is a view into it
+        self._owner: ffi.CData | None = None
 
     @classmethod
     def identity(cls) -> Matrix:
@@ -32,7 +38,7 @@ class Matrix(Ptr):
     @classmethod
     def project_box(
         cls,
-        box: Box,
+        box: Box | FrozenBox,
         transform: WlOutput.transform,
         rotation: float,
         projection: Matrix,
@@ -44,6 +50,54 @@ class Matrix(Ptr):
         )
         return Matrix(mat_ptr)
 
+    @classmethod
+    def project_boxes(
+        cls,
+        boxes: BoxArray,
+        transform: WlOutput.transform,
+        rotation: float,
+        projection: Matrix,
+        out: MatrixArray | None = None,
+    ) -> MatrixArray:
+        """Project each box of the array, as with `project_box`
+
+        The matrices are computed in a single call into C.
+
+        :param boxes:
+            The boxes to project.
+        :param out:
+            An array of at least as many matrices as boxes to write the
+            matrices into, rather than allocating a new array.
+        """
+        if out is None:
+            out = MatrixArray(len(boxes))
+        elif len(out) < len(boxes):
+            raise ValueError("The output array is smaller than the box array")
+        lib.wrapped_matrix_project_boxes(
+            out._ptr, boxes._ptr, len(boxes), transform, rotation, projection._ptr
+        )
+        return out
+
+    def set_identity(self) -> None:
+        """Set the matrix to the identity matrix, in place"""
+        lib.wlr_matrix_identity(self._ptr)
+
+    def project_box_into(
+        self,
+        box: Box | FrozenBox,
+        transform: WlOutput.transform,
+        rotation: float,
+        projection: Matrix,
+    ) -> None:
+        """Set the matrix to the projection of a box, in place, as with `project_box`"""
+        lib.wlr_matrix_project_box(
+            self._ptr, box._ptr, transform, rotation, projection._ptr
+        )
+
+    def copy_from(self, other: Matrix) -> None:
+        """Set the matrix to the values of another matrix"""
+        ffi.memmove(self._ptr, other._ptr, ffi.sizeof("float[9]"))
+
     def transpose(self) -> Matrix:
         """Transpose the matrix"""
         mat_ptr = self._build_matrix_ptr()
@@ -72,6 +126,33 @@ class Matrix(Ptr):
         lib.wlr_matrix_multiply(mat_ptr, self._ptr, other._ptr)
         return Matrix(mat_ptr)
 
+    def imul(self, other: Matrix) -> None:
+        """Multiply the matrix by the given matrix, in place"""
+        lib.wlr_matrix_multiply(self._ptr, self._ptr, other._ptr)
+
+    def __imatmul__(self, other: Matrix) -> Matrix:
+        """Perform matrix multiplication with given matrix, in place"""
+        self.imul(other)
+        return self
+
+    def as_memoryview(self) -> memoryview[float]:
+        """A writable view of the matrix, of shape (3, 3) and float format"""
+        return (
+            memoryview(ffi.buffer(self._ptr, 9 * ffi.sizeof("float")))
+            .cast("B")
+            .cast("f", (3, 3))
+        )
+
+    def as_numpy(self) -> Any:
+        """A writable NumPy array of the matrix, of shape (3, 3)
+
+        Raises ImportError if NumPy is not installed.
+        """
+        np = require_numpy("Matrix.as_numpy")
+        return np.frombuffer(
+            ffi.buffer(self._ptr, 9 * ffi.sizeof("float")), dtype=np.float32
+        ).reshape(3, 3)
+
     def __str__(self) -> str:
         """String representation showing the matrix"""
         matrix_values = list(self._ptr)
@@ -82,3 +163,53 @@ class Matrix(Ptr):
     @staticmethod
     def _build_matrix_ptr() -> ffi.CData:
         return ffi.new("float [9]")
+
+
+class MatrixArray:
+    def __init__(self, size: int) -> None:
+        """A contiguous array of matrices, backed by a `float[n][9]`
+
+        The array can be filled with `Matrix.project_boxes` and reused from
+        frame to frame, and viewed as a `memoryview` or a NumPy array of shape
+        (n, 3, 3) without copying.
+
+        :param size:
+            The number of matrices in the array, initially zeroed.
+        """
+        self._ptr = ffi.new("float[][9]", size)
+
+    def __len__(self) -> int:
+        return len(self._ptr)
+
+    def __getitem__(self, index: int) -> Matrix:
+        """The matrix at the index, a view into the array rather than a copy"""
+        if index < 0:
+            index += len(self._ptr)
+        if not 0 <= index < len(self._ptr):
+            raise IndexError("MatrixArray index out of range")
+        matrix = Matrix(self._ptr[index])
+        matrix._owner = self._ptr
+        return matrix
+
+    def __iter__(self) -> Iterator[Matrix]:
+        for i in range(len(self._ptr)):
+            yield self[i]
+
+    def as_memoryview(self) -> memoryview[float]:
+        """A writable view of the matrices, of shape (n, 3, 3) and float format
+
+        The view of an empty array is one-dimensional, as memoryviews can't
+        have zeros in their shape.
+        """
+        view = memoryview(ffi.buffer(self._ptr)).cast("B")
+        if not len(self._ptr):
+            return view.cast("f")
+        return view.cast("f", (len(self._ptr), 3, 3))
+
+    def as_numpy(self) -> Any:
+        """A writable NumPy array of the matrices, of shape (n, 3, 3)
+
+        Raises ImportError if NumPy is not installed.
+        """
+        np = require_numpy("MatrixArray.as_numpy")
+        return np.frombuffer(ffi.buffer(self._ptr), dtype=np.float32).reshape(-1, 3, 3)
@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import enum
 from types import TracebackType
 from typing import TYPE_CHECKING, NamedTuple
 
@@ -11,6 +12,7 @@ from pywayland.server import Signal
 from pywayland.utils import wl_list_for_each
 
 from wlroots import Ptr, PtrHasData, ffi, lib, ptr_or_null, str_or_none
+from wlroots.util.clock import Timespec
 from wlroots.util.region import PixmanRegion32
 
 from .matrix import Matrix
@@ -22,6 +24,31 @@ if TYPE_CHECKING:
     from wlroots.renderer import Renderer
 
 
+class OutputAdaptiveSyncStatus(enum.IntEnum):
+    DISABLED = lib.WLR_OUTPUT_ADAPTIVE_SYNC_DISABLED
+    ENABLED = lib.WLR_OUTPUT_ADAPTIVE_SYNC_ENABLED
+
+
+class OutputPresentFlag(enum.IntFlag):
+    VSYNC = lib.WLR_OUTPUT_PRESENT_VSYNC
+    HW_CLOCK = lib.WLR_OUTPUT_PRESENT_HW_CLOCK
+    HW_COMPLETION = lib.WLR_OUTPUT_PRESENT_HW_COMPLETION
+    ZERO_COPY = lib.WLR_OUTPUT_PRESENT_ZERO_COPY
+
+
+class OutputStateField(enum.IntFlag):
+    BUFFER = lib.WLR_OUTPUT_STATE_BUFFER
+    DAMAGE = lib.WLR_OUTPUT_STATE_DAMAGE
+    MODE = lib.WLR_OUTPUT_STATE_MODE
+    ENABLED = lib.WLR_OUTPUT_STATE_ENABLED
+    SCALE = lib.WLR_OUTPUT_STATE_SCALE
+    TRANSFORM = lib.WLR_OUTPUT_STATE_TRANSFORM
+    ADAPTIVE_SYNC_ENABLED = lib.WLR_OUTPUT_STATE_ADAPTIVE_SYNC_ENABLED
+    GAMMA_LUT = lib.WLR_OUTPUT_STATE_GAMMA_LUT
+    RENDER_FORMAT = lib.WLR_OUTPUT_STATE_RENDER_FORMAT
+    SUBPIXEL = lib.WLR_OUTPUT_STATE_SUBPIXEL
+
+
 class Output(PtrHasData):
     def __init__(self, ptr: ffi.CData) -> None:
         """A compositor output region
@@ -47,7 +74,10 @@ class Output(PtrHasData):
         self.needs_frame_event = Signal(ptr=ffi.addressof(self._ptr.events.needs_frame))
         self.precommit_event = Signal(ptr=ffi.addressof(self._ptr.events.precommit))
         self.commit_event = Signal(ptr=ffi.addressof(self._ptr.events.commit))
-        self.present_event = Signal(ptr=ffi.addressof(self._ptr.events.present))
+        self.present_event = Signal(
+            ptr=ffi.addressof(self._ptr.events.present),
+            data_wrapper=OutputEventPresent,
+        )
         self.bind_event = Signal(ptr=ffi.addressof(self._ptr.events.bind))
         self.description_event = Signal(ptr=ffi.addressof(self._ptr.events.description))
         self.request_state_event = Signal(
@@ -103,6 +133,11 @@ class Output(PtrHasData):
             return None
         return OutputMode(self._ptr.current_mode)
 
+    @property
+    def refresh_mhz(self) -> int:
+        """The refresh rate of the current mode in mHz, may be zero"""
+        return self._ptr.refresh
+
     @property
     def scale(self) -> float:
         return self._ptr.scale
@@ -111,6 +146,26 @@ class Output(PtrHasData):
     def transform(self) -> WlOutput.transform:
         return WlOutput.transform(self._ptr.transform)
 
+    @property
+    def render_format(self) -> int:
+        """The DRM format of the buffers rendered to the output"""
+        return self._ptr.render_format
+
+    @property
+    def adaptive_sync_status(self) -> OutputAdaptiveSyncStatus:
+        """The effective adaptive sync (variable refresh rate) status"""
+        return OutputAdaptiveSyncStatus(self._ptr.adaptive_sync_status)
+
+    @property
+    def commit_seq(self) -> int:
+        """Commit sequence number, incremented on each commit and may overflow"""
+        return self._ptr.commit_seq
+
+    @property
+    def frame_pending(self) -> bool:
+        """Whether a submitted frame is still waiting to be displayed"""
+        return self._ptr.frame_pending
+
     @property
     def transform_matrix(self) -> Matrix:
         """The transform matrix giving the projection of the output"""
@@ -172,6 +227,17 @@ class Output(PtrHasData):
         else:
             self.rollback()
 
+    def get_gamma_size(self) -> int:
+        """Returns the size of the gamma table, zero if gamma is not supported"""
+        return lib.wlr_output_get_gamma_size(self._ptr)
+
+    def schedule_frame(self) -> None:
+        """Manually schedules a `frame` event
+
+        If a `frame` event is already pending, it is a no-op.
+        """
+        lib.wlr_output_schedule_frame(self._ptr)
+
     def init_render(self, allocator: Allocator, renderer: Renderer) -> None:
         """Initialize the output's rendering subsystem with the provided allocator and renderer.
 
@@ -186,14 +252,20 @@ class Output(PtrHasData):
                 "Output capabilities must match the capabilities of the output's backend."
             )
 
-    def attach_render(self) -> None:
+    def attach_render(self) -> int:
         """Attach the renderer's buffer to the output
 
         Compositors must call this function before rendering. After they are
         done rendering, they should call `.commit()` to submit the new frame.
+
+        Returns the age of the buffer, the number of frames since it was last
+        rendered to, or zero if its contents are undefined. It can be given to
+        `DamageRing.buffer_damage` to only repaint what changed.
         """
-        if not lib.wlr_output_attach_render(self._ptr, ffi.NULL):
+        buffer_age = ffi.new("int *")
+        if not lib.wlr_output_attach_render(self._ptr, buffer_age):
             raise RuntimeError("Unable to attach render")
+        return buffer_age[0]
 
     def commit(self, output_state: OutputState | None = None) -> bool:
         """Commit the pending output state
@@ -396,6 +468,22 @@ class OutputState(Ptr):
     def set_subpixel(self, subpixel: WlOutput.subpixel) -> None:
         lib.wlr_output_state_set_subpixel(self._ptr, subpixel)
 
+    def set_gamma_lut(
+        self,
+        ramp_size: int,
+        red: ffi.CData,
+        green: ffi.CData,
+        blue: ffi.CData,
+    ) -> bool:
+        """Sets the gamma table of the output
+
+        Each of `red`, `green` and `blue` must point to `ramp_size` uint16_t
+        values, which are copied into the state.
+        """
+        return lib.wlr_output_state_set_gamma_lut(
+            self._ptr, ramp_size, red, green, blue
+        )
+
     @property
     def mode(self) -> OutputMode | None:
         mode_ptr = self._ptr.mode
@@ -418,6 +506,157 @@ class OutputState(Ptr):
         lib.wlr_output_state_finish(self._ptr)
 
 
+class OutputStateBuilder:
+    def __init__(self, output: Output) -> None:
+        """Build an `OutputState` holding only what differs from the output
+
+        Each setter compares the requested value with the current state of the
+        output, and the value is only set on the resulting `OutputState` when
+        it differs. When nothing differs, `commit` and `test` return
+        immediately without calling into wlroots, so redundant configuration
+        requests don't trigger a commit, let alone a modeset.
+
+        The setters return the builder, so calls can be chained.
+
+        :param output:
+            The output which will be configured.
+        """
+        self.output = output
+        self._enabled: bool | None = None
+        self._mode: OutputMode | None = None
+        self._custom_mode: CustomMode | None = None
+        self._scale: float | None = None
+        self._transform: WlOutput.transform | None = None
+        self._adaptive_sync_enabled: bool | None = None
+        self._render_format: int | None = None
+
+    def set_enabled(self, enabled: bool) -> OutputStateBuilder:
+        self._enabled = enabled
+        return self
+
+    def set_mode(self, mode: OutputMode) -> OutputStateBuilder:
+        self._mode = mode
+        self._custom_mode = None
+        return self
+
+    def set_custom_mode(self, mode: CustomMode) -> OutputStateBuilder:
+        self._custom_mode = mode
+        self._mode = None
+        return self
+
+    def set_scale(self, scale: float) -> OutputStateBuilder:
+        self._scale = scale
+        return self
+
+    def set_transform(self, transform: WlOutput.transform) -> OutputStateBuilder:
+        self._transform = transform
+        return self
+
+    def set_adaptive_sync_enabled(self, enabled: bool) -> OutputStateBuilder:
+        self._adaptive_sync_enabled = enabled
+        return self
+
+    def set_render_format(self, format: int) -> OutputStateBuilder:
+        self._render_format = format
+        return self
+
+    def changed(self) -> OutputStateField:
+        """The fields which differ from the current state of the output"""
+        output = self.output
+        changed = OutputStateField(0)
+
+        enabling = self._enabled is True and not output.enabled
+        if self._enabled is not None and self._enabled != output.enabled:
+            changed |= OutputStateField.ENABLED
+        if self._enabled is False:
+            # Nothing else matters for an output being turned off
+            return changed
+
+        if self._mode is not None:
+            if enabling or self._mode != output.current_mode:
+                changed |= OutputStateField.MODE
+        elif self._custom_mode is not None:
+            width, height, refresh = self._custom_mode
+            if (
+                enabling
+                or (width, height) != (output._ptr.width, output._ptr.height)
+                or (refresh != 0 and refresh != output.refresh_mhz)
+            ):
+                changed |= OutputStateField.MODE
+
+        if self._scale is not None and self._scale != output.scale:
+            changed |= OutputStateField.SCALE
+        if self._transform is not None and self._transform != output.transform:
+            changed |= OutputStateField.TRANSFORM
+        if self._adaptive_sync_enabled is not None and self._adaptive_sync_enabled != (
+            output.adaptive_sync_status == OutputAdaptiveSyncStatus.ENABLED
+        ):
+            changed |= OutputStateField.ADAPTIVE_SYNC_ENABLED
+        if (
+            self._render_format is not None
+            and self._render_format != output.render_format
+        ):
+            changed |= OutputStateField.RENDER_FORMAT
+
+        return changed
+
+    def is_noop(self) -> bool:
+        """Whether applying the requested configuration would change nothing"""
+        return not self.changed()
+
+    def build(self) -> OutputState | None:
+        """Build the state holding the changed fields
+
+        Returns None if nothing differs from the current state of the output.
+        The caller is responsible for calling `OutputState.finish` on the
+        returned state.
+        """
+        changed = self.changed()
+        if not changed:
+            return None
+
+        state = OutputState()
+        if changed & OutputStateField.ENABLED:
+            state.set_enabled(bool(self._enabled))
+        if changed & OutputStateField.MODE:
+            if self._mode is not None:
+                state.set_mode(self._mode)
+            elif self._custom_mode is not None:
+                state.set_custom_mode(self._custom_mode)
+        if changed & OutputStateField.SCALE:
+            state.set_scale(self._scale)  # type: ignore[arg-type]
+        if changed & OutputStateField.TRANSFORM:
+            state.set_transform(self._transform)  # type: ignore[arg-type]
+        if changed & OutputStateField.ADAPTIVE_SYNC_ENABLED:
+            state.set_adaptive_sync_enabled(bool(self._adaptive_sync_enabled))
+        if changed & OutputStateField.RENDER_FORMAT:
+            state.set_render_format(self._render_format)  # type: ignore[arg-type]
+        return state
+
+    def test(self) -> bool:
+        """Test whether the output would accept the changed fields"""
+        state = self.build()
+        if state is None:
+            return True
+        try:
+            return self.output.test(state)
+        finally:
+            state.finish()
+
+    def commit(self) -> bool:
+        """Commit the changed fields to the output
+
+        Returns True without committing when nothing differs.
+        """
+        state = self.build()
+        if state is None:
+            return True
+        try:
+            return self.output.commit(state)
+        finally:
+            state.finish()
+
+
 class OutputEventRequestState(Ptr):
     def __init__(self, ptr: ffi.CData) -> None:
         self._ptr = ffi.cast("struct wlr_output_event_request_state *", ptr)
@@ -429,3 +668,45 @@ class OutputEventRequestState(Ptr):
     @property
     def state(self) -> OutputState:
         return OutputState(self._ptr.state)
+
+
+class OutputEventPresent(Ptr):
+    def __init__(self, ptr: ffi.CData) -> None:
+        """Event emitted when a committed frame has been displayed"""
+        self._ptr = ffi.cast("struct wlr_output_event_present *", ptr)
+
+    @property
+    def output(self) -> Output:
+        return Output(self._ptr.output)
+
+    @property
+    def commit_seq(self) -> int:
+        """The `Output.commit_seq` of the commit which has been presented"""
+        return self._ptr.commit_seq
+
+    @property
+    def presented(self) -> bool:
+        """Whether the frame was presented at all"""
+        return self._ptr.presented
+
+    @property
+    def when(self) -> Timespec | None:
+        """Time when the content update turned into light the first time"""
+        if self._ptr.when == ffi.NULL:
+            return None
+        return Timespec(self._ptr.when)
+
+    @property
+    def seq(self) -> int:
+        """Vertical retrace counter, zero if unavailable"""
+        return self._ptr.seq
+
+    @property
+    def refresh_nsec(self) -> int:
+        """Prediction of how many nanoseconds after `when` the very next output
+        refresh may occur, zero if unknown"""
+        return self._ptr.refresh
+
+    @property
+    def flags(self) -> OutputPresentFlag:
+        return OutputPresentFlag(self._ptr.flags)
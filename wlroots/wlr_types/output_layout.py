@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import math
+from array import array
 from types import TracebackType
+from typing import Any
 
-from pywayland.server import Signal
+from pywayland.protocol.wayland import WlOutput
+from pywayland.server import Listener, Signal
+from pywayland.utils import wl_list_for_each
 
 from wlroots import Ptr, ffi, lib
-from wlroots.util.box import Box
+from wlroots.util.box import Box, BoxArray, FrozenBox
 
 from .output import Output
 
@@ -140,3 +145,170 @@ class OutputLayoutOutput(Ptr):
     def __init__(self, ptr: ffi.CData) -> None:
         """A `struct wlr_output_layout_output`"""
         self._ptr = ptr
+
+
+class OutputLayoutCache:
+    def __init__(self, output_layout: OutputLayout) -> None:
+        """A snapshot of the geometry of the outputs in a layout
+
+        The box, scale and transform of each output are read once and kept
+        until the layout emits its change event, which it does whenever an
+        output is added, removed, moved or changes its mode, scale or
+        transform. Lookups on the snapshot then run in Python, without calls
+        into wlroots or allocations, so they are cheap enough to run on every
+        pointer motion.
+
+        The outputs are kept in the order of the layout, and lookups behave as
+        the `OutputLayout` methods of the same name.
+
+        :param output_layout:
+            The output layout to take snapshots of.
+        """
+        self._output_layout = output_layout
+        self._dirty = True
+        self._outputs: list[Output] = []
+        self._boxes: list[FrozenBox] = []
+        self._box_array = BoxArray()
+        self._scales: array[float] = array("d")
+        self._transforms: list[WlOutput.transform] = []
+        self._indices: dict[ffi.CData, int] = {}
+        self._extents = FrozenBox()
+
+        self._change_listener = Listener(self._on_change)
+        self._destroy_listener = Listener(self._on_destroy)
+        output_layout.change_event.add(self._change_listener)
+        output_layout.destroy_event.add(self._destroy_listener)
+
+    @property
+    def outputs(self) -> list[Output]:
+        """The outputs in the layout"""
+        self._update()
+        return self._outputs
+
+    @property
+    def boxes(self) -> BoxArray:
+        """The boxes of the outputs, in layout coordinates
+
+        The array is part of the snapshot and replaced when the layout
+        changes, it should not be modified.
+        """
+        self._update()
+        return self._box_array
+
+    @property
+    def scales(self) -> array[float]:
+        """The scales of the outputs"""
+        self._update()
+        return self._scales
+
+    @property
+    def transforms(self) -> list[WlOutput.transform]:
+        """The transforms of the outputs"""
+        self._update()
+        return self._transforms
+
+    def invalidate(self) -> None:
+        """Take a new snapshot on the next lookup"""
+        self._dirty = True
+
+    def output_at(self, x: float, y: float) -> Output | None:
+        """The output at the layout coordinates, if any"""
+        self._update()
+        for output, box in zip(self._outputs, self._boxes):
+            if box.x <= x < box.x + box.width and box.y <= y < box.y + box.height:
+                return output
+        return None
+
+    def get_box(self, reference: Output | None = None) -> FrozenBox:
+        """The box of an output, or the extents of the layout if None
+
+        The box is empty if the output isn't in the layout.
+        """
+        self._update()
+        if reference is None:
+            return self._extents
+        index = self._indices.get(reference._ptr)
+        if index is None:
+            return FrozenBox()
+        return self._boxes[index]
+
+    def output_coords(self, output: Output) -> tuple[float, float]:
+        """The coordinates of the output in the layout"""
+        box = self.get_box(output)
+        return float(box.x), float(box.y)
+
+    def closest_point(
+        self, lx: float, ly: float, reference: Output | None = None
+    ) -> tuple[float, float]:
+        """The closest point of the layout, or of the reference output"""
+        self._update()
+        boxes = self._boxes
+        if reference is not None:
+            index = self._indices.get(reference._ptr)
+            boxes = [] if index is None else [boxes[index]]
+
+        closest = (0.0, 0.0)
+        closest_distance = math.inf
+        for box in boxes:
+            x, y = box.closest_point(lx, ly)
+            distance = (lx - x) ** 2 + (ly - y) ** 2
+            # NaN for empty boxes, which are skipped
+            if distance < closest_distance:
+                closest = (x, y)
+                closest_distance = distance
+        return closest
+
+    def destroy(self) -> None:
+        """Stop following the changes of the layout"""
+        self._change_listener.remove()
+        self._destroy_listener.remove()
+        self._outputs = []
+        self._boxes = []
+        self._box_array = BoxArray()
+        self._scales = array("d")
+        self._transforms = []
+        self._indices = {}
+        self._extents = FrozenBox()
+        self._dirty = False
+
+    def _update(self) -> None:
+        if not self._dirty:
+            return
+        self._dirty = False
+
+        layout_ptr = self._output_layout._ptr
+        box_ptr = ffi.new("struct wlr_box *")
+        outputs: list[Output] = []
+        boxes: list[FrozenBox] = []
+        scales: array[float] = array("d")
+        transforms: list[WlOutput.transform] = []
+        indices: dict[ffi.CData, int] = {}
+        layout_output_ptr: ffi.CData
+        for layout_output_ptr in wl_list_for_each(
+            "struct wlr_output_layout_output *",
+            layout_ptr.outputs,
+            "link",
+            ffi=ffi,
+        ):
+            output_ptr = layout_output_ptr.output
+            lib.wlr_output_layout_get_box(layout_ptr, output_ptr, box_ptr)
+            indices[output_ptr] = len(outputs)
+            outputs.append(Output(output_ptr))
+            boxes.append(FrozenBox(box_ptr.x, box_ptr.y, box_ptr.width, box_ptr.height))
+            scales.append(output_ptr.scale)
+            transforms.append(WlOutput.transform(output_ptr.transform))
+
+        lib.wlr_output_layout_get_box(layout_ptr, ffi.NULL, box_ptr)
+        self._extents = FrozenBox(box_ptr.x, box_ptr.y, box_ptr.width, box_ptr.height)
+        self._outputs = outputs
+        self._boxes = boxes
+        self._box_array = BoxArray(boxes)
+        self._scales = scales
+        self._transforms = transforms
+        self._indices = indices
+
+    def _on_change(self, listener: Listener, data: Any) -> None:
+        self._dirty = True
+
+    def _on_destroy(self, listener: Listener, data: Any) -> None:
+        self.destroy()
@@ -10,7 +10,7 @@ from pywayland.utils import wl_list_for_each
 
 from wlroots import Ptr, PtrHasData, ffi, lib, ptr_or_null
 
-from .output import CustomMode, Output, OutputMode, OutputState
+from .output import CustomMode, Output, OutputMode, OutputState, OutputStateBuilder
 
 
 class OutputHeadV1State(Ptr):
@@ -102,6 +102,31 @@ class OutputHeadV1State(Ptr):
         """
         lib.wlr_output_head_v1_state_apply(self._ptr, output_state._ptr)
 
+    def build_state(self) -> OutputStateBuilder:
+        """
+        Create an OutputStateBuilder for the output holding the head state.
+
+        Unlike `apply`, committing the returned builder only touches the fields
+        which differ from the current state of the output, and is a no-op if
+        the head state matches it entirely.
+
+        The position needs to be applied manually by the caller.
+        """
+        builder = OutputStateBuilder(self.output).set_enabled(self.enabled)
+        if not self.enabled:
+            return builder
+
+        mode = self.mode
+        if mode is not None:
+            builder.set_mode(mode)
+        else:
+            builder.set_custom_mode(self.custom_mode)
+        return (
+            builder.set_scale(self.scale)
+            .set_transform(self.transform)
+            .set_adaptive_sync_enabled(self.adaptive_sync_enabled)
+        )
+
 
 class OutputConfigurationV1(Ptr):
     def __init__(self, ptr: ffi.CData) -> None:
@@ -3,12 +3,22 @@
 from __future__ import annotations
 
 import enum
+from typing import TYPE_CHECKING, NamedTuple
 
-from pywayland.server import Display, Signal
+from pywayland.server import Display, Listener, Signal
 
 from wlroots import Ptr, ffi, lib
 
-from .output import Output
+from .output import Output, OutputState
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from wlroots.util.frame_pacing import FramePacer, RenderDelayScheduler
+
+    from .scene import SceneOutput
+
+    FrameScheduler = FramePacer | RenderDelayScheduler
 
 
 class OutputPowerManagementV1Mode(enum.IntEnum):
@@ -52,3 +62,124 @@ class OutputPowerV1SetModeEvent(Ptr):
     @property
     def mode(self) -> OutputPowerManagementV1Mode:
         return OutputPowerManagementV1Mode(self._ptr.mode)
+
+
+class _PoweredOutput(NamedTuple):
+    output: Output
+    scene_output: SceneOutput | None
+    scheduler: FrameScheduler | None
+    destroy_listener: Listener
+
+
+class OutputPowerController:
+    def __init__(self, manager: OutputPowerManagerV1) -> None:
+        """Apply the power mode requests of an output power manager
+
+        Requests to power off an output disable it with an `OutputState`
+        commit, and suspend the frame scheduler registered for the output such
+        that no frames are rendered for a blanked screen. When the output is
+        powered on again, it is re-enabled, the scene output is fully damaged
+        and a single frame is scheduled to repaint it.
+
+        Requests for outputs that were not registered with `add_output` are
+        applied without touching any scene output or scheduler.
+
+        :param manager:
+            The output power manager whose `set_mode` requests are handled.
+        """
+        self._outputs: dict[ffi.CData, _PoweredOutput] = {}
+
+        self._set_mode_listener = Listener(self._on_set_mode)
+        self._manager_destroy_listener = Listener(self._on_manager_destroy)
+        manager.set_mode_event.add(self._set_mode_listener)
+        manager.destroy_event.add(self._manager_destroy_listener)
+
+    def add_output(
+        self,
+        output: Output,
+        scene_output: SceneOutput | None = None,
+        scheduler: FrameScheduler | None = None,
+    ) -> None:
+        """Manage the power state of the given output
+
+        :param output:
+            The output to manage.
+        :param scene_output:
+            The scene output rendering to the output, repainted entirely when
+            the output is powered on.
+        :param scheduler:
+            The frame pacer or render scheduler driving the scene output,
+            suspended while the output is powered off.
+        """
+        self.remove_output(output)
+
+        destroy_listener = Listener(self._on_output_destroy)
+        output.destroy_event.add(destroy_listener)
+        self._outputs[output._ptr] = _PoweredOutput(
+            output, scene_output, scheduler, destroy_listener
+        )
+
+    def remove_output(self, output: Output) -> None:
+        """Stop managing the power state of the given output"""
+        powered_output = self._outputs.pop(output._ptr, None)
+        if powered_output is not None:
+            powered_output.destroy_listener.remove()
+
+    def set_mode(self, output: Output, mode: OutputPowerManagementV1Mode) -> bool:
+        """Power the given output on or off
+
+        Returns False if the output rejected the commit.
+        """
+        powered_output = self._outputs.get(output._ptr)
+        power_on = mode == OutputPowerManagementV1Mode.ON
+        if output.enabled == power_on:
+            return True
+
+        if not power_on and powered_output and powered_output.scheduler:
+            powered_output.scheduler.suspend()
+
+        state = OutputState()
+        state.set_enabled(power_on)
+        committed = output.commit(state)
+        state.finish()
+
+        if powered_output is None:
+            return committed
+
+        if not committed:
+            # The output keeps its previous power state
+            if not power_on and powered_output.scheduler:
+                powered_output.scheduler.resume()
+            return False
+
+        if power_on:
+            if powered_output.scheduler:
+                powered_output.scheduler.resume()
+            if powered_output.scene_output:
+                powered_output.scene_output.damage_whole()
+            output.schedule_frame()
+
+        return True
+
+    def destroy(self) -> None:
+        """Stop handling power mode requests"""
+        for powered_output in self._outputs.values():
+            powered_output.destroy_listener.remove()
+        self._outputs.clear()
+        self._set_mode_listener.remove()
+        self._manager_destroy_listener.remove()
+
+    def _on_set_mode(
+        self, listener: Listener, event: OutputPowerV1SetModeEvent
+    ) -> None:
+        self.set_mode(event.output, event.mode)
+
+    def _on_output_destroy(self, listener: Listener, data: Any) -> None:
+        for key, powered_output in self._outputs.items():
+            if powered_output.destroy_listener is listener:
+                del self._outputs[key]
+                listener.remove()
+                break
+
+    def _on_manager_destroy(self, listener: Listener, data: Any) -> None:
+        self.destroy()
@@ -3,17 +3,21 @@
 from __future__ import annotations
 
 import enum
+from array import array
 from typing import TYPE_CHECKING
 from weakref import WeakKeyDictionary
 
-from pywayland.server import Signal
+from pywayland.server import Listener, Signal
 
 from wlroots import Ptr, ffi, lib
+from wlroots.util.box import _EDGE_EPSILON
 from wlroots.util.region import PixmanRegion32
 
 from .compositor import Surface
 
 if TYPE_CHECKING:
+    from typing import Any
+
     from pywayland.server import Display
 
 _weakkeydict: WeakKeyDictionary[ffi.CData, ffi.CData] = WeakKeyDictionary()
@@ -102,3 +106,115 @@ class PointerConstraintV1State(Ptr):
     @property
     def cursor_hint(self) -> tuple[float, float]:
         return self._ptr.cursor_hint.x, self._ptr.cursor_hint.y
+
+
+class PointerConstraintV1Region:
+    def __init__(self, constraint: PointerConstraintV1) -> None:
+        """The effective region of a pointer constraint, for frequent queries
+
+        The rectangles of the region of the constraint are copied into a flat
+        array of x1, y1, x2, y2 surface-local coordinates, which is refreshed
+        on the first query after the region may have changed, i.e. after a
+        `set_region` event or a commit of the constrained surface, whose input
+        region bounds the constraint. `contains` and `confine` then run
+        without crossing into C or creating any `Box`.
+
+        :param constraint:
+            The pointer constraint whose region is queried.
+        """
+        self._constraint = constraint
+        self._rects: array[int] = array("i")
+        self._extents = (0, 0, 0, 0)
+        self._dirty = True
+
+        self._set_region_listener = Listener(self._invalidate)
+        self._commit_listener = Listener(self._invalidate)
+        self._destroy_listener = Listener(self._on_destroy)
+        constraint.set_region_event.add(self._set_region_listener)
+        constraint.surface.commit_event.add(self._commit_listener)
+        constraint.destroy_event.add(self._destroy_listener)
+
+    @property
+    def rectangles(self) -> array[int]:
+        """The rectangles of the region, as consecutive x1, y1, x2, y2 values"""
+        if self._dirty:
+            self._update()
+        return self._rects
+
+    @property
+    def empty(self) -> bool:
+        return len(self.rectangles) == 0
+
+    def contains(self, x: float, y: float) -> bool:
+        """Whether the surface-local point is inside the region"""
+        if self._dirty:
+            self._update()
+        x1, y1, x2, y2 = self._extents
+        if not (x1 <= x < x2 and y1 <= y < y2):
+            return False
+
+        rects = self._rects
+        for i in range(0, len(rects), 4):
+            if rects[i] <= x < rects[i + 2] and rects[i + 1] <= y < rects[i + 3]:
+                return True
+        return False
+
+    def confine(self, x: float, y: float) -> tuple[float, float] | None:
+        """The point of the region closest to the surface-local point
+
+        Returns the point itself if it is inside the region, and None if the
+        region is empty.
+        """
+        if self.contains(x, y):
+            return x, y
+
+        rects = self._rects
+        best = None
+        best_distance = float("inf")
+        for i in range(0, len(rects), 4):
+            # The right and bottom edges are exclusive
+            cx = min(max(x, rects[i]), rects[i + 2] - _EDGE_EPSILON)
+            cy = min(max(y, rects[i + 1]), rects[i + 3] - _EDGE_EPSILON)
+            distance = (cx - x) ** 2 + (cy - y) ** 2
+            if distance < best_distance:
+                best = (cx, cy)
+                best_distance = distance
+        return best
+
+    def destroy(self) -> None:
+        """Stop tracking the region of the constraint"""
+        self._set_region_listener.remove()
+        self._commit_listener.remove()
+        self._destroy_listener.remove()
+        self._rects = array("i")
+        self._extents = (0, 0, 0, 0)
+        self._dirty = False
+
+    def _update(self) -> None:
+        self._dirty = False
+        region_ptr = ffi.addressof(self._constraint._ptr, "region")
+        nrects_ptr = ffi.new("int *")
+        rects_ptr = lib.pixman_region32_rectangles(region_ptr, nrects_ptr)
+
+        rects: array[int] = array("i")
+        nrects = nrects_ptr[0]
+        if nrects > 0:
+            size = nrects * ffi.sizeof("struct pixman_box32")
+            rects.frombytes(ffi.buffer(rects_ptr, size))
+        self._rects = rects
+
+        if rects:
+            self._extents = (
+                min(rects[0::4]),
+                min(rects[1::4]),
+                max(rects[2::4]),
+                max(rects[3::4]),
+            )
+        else:
+            self._extents = (0, 0, 0, 0)
+
+    def _invalidate(self, listener: Listener, data: Any) -> None:
+        self._dirty = True
+
+    def _on_destroy(self, listener: Listener, data: Any) -> None:
+        self.destroy()
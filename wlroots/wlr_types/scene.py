@@ -15,7 +15,7 @@ from wlroots.wlr_types import OutputLayoutOutput, Surface
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
-    from wlroots.util.box import Box
+    from wlroots.util.box import Box, FrozenBox
     from wlroots.util.clock import Timespec
     from wlroots.wlr_types import Buffer, Output, OutputLayout
     from wlroots.wlr_types.data_device_manager import DragIcon
@@ -124,6 +124,10 @@ class SceneOutput(Ptr):
         """Set the output's position in the scene-graph."""
         lib.wlr_scene_output_set_position(self._ptr, lx, ly)
 
+    def damage_whole(self) -> None:
+        """Damage the whole output, such that the next commit repaints everything."""
+        lib.wlr_damage_ring_add_whole(ffi.addressof(self._ptr.damage_ring))
+
 
 class SceneTree(PtrHasData):
     def __init__(self, ptr: ffi.CData) -> None:
@@ -277,6 +281,12 @@ class SceneNode(PtrHasData):
         """Move the node below all of its sibling nodes."""
         lib.wlr_scene_node_reparent(self._ptr, new_parent._ptr)
 
+    def coords(self) -> tuple[int, int]:
+        """The layout-local coordinates of the node, summed over its parents."""
+        coords = ffi.new("int[2]")
+        lib.wlr_scene_node_coords(self._ptr, coords, coords + 1)
+        return coords[0], coords[1]
+
     def node_at(self, lx: float, ly: float) -> tuple[SceneNode, float, float] | None:
         """
         Find the topmost node in this scene-graph that contains the point at the given
@@ -305,7 +315,7 @@ class SceneNode(PtrHasData):
             self._ptr, lib.buffer_iterator_callback, handle
         )
 
-    def subsurface_tree_set_clip(self, clip: Box | None) -> None:
+    def subsurface_tree_set_clip(self, clip: Box | FrozenBox | None) -> None:
         """
         Sets a cropping region for any subsurface trees that are children of this scene node.
 
@@ -365,7 +375,7 @@ class SceneLayerSurfaceV1(Ptr):
         """struct wlr_scene_tree"""
         return SceneTree(self._ptr.tree)
 
-    def configure(self, full_area: Box, usable_area: Box) -> None:
+    def configure(self, full_area: Box | FrozenBox, usable_area: Box) -> None:
         """
         Configure a layer_surface_v1, position its scene node in accordance to its
         current state, and update the remaining usable area.
@@ -374,7 +384,7 @@ class SceneLayerSurfaceV1(Ptr):
         its exclusive_zone is -1, and is usually the output dimensions. usable_area
         represents what remains of full_area that can be used if exclusive_zone is >= 0.
         usable_area is updated if the surface has a positive exclusive_zone, so that it
-        can be used for the next layer surface.
+        can be used for the next layer surface, and hence can't be a FrozenBox.
         """
         lib.wlr_scene_layer_surface_v1_configure(
             self._ptr, full_area._ptr, usable_area._ptr
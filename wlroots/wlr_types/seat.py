@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Iterator
 from types import TracebackType
+from typing import TYPE_CHECKING
 from weakref import WeakKeyDictionary
 
 from pywayland.protocol.wayland import WlSeat
@@ -18,6 +19,10 @@ from .input_device import ButtonState
 from .keyboard import Keyboard, KeyboardKeyEvent, KeyboardModifiers
 from .pointer import AxisOrientation, AxisSource
 
+if TYPE_CHECKING:
+    from .cursor import Cursor
+    from .xcursor_manager import XCursorManager
+
 _weakkeydict: WeakKeyDictionary[ffi.CData, ffi.CData] = WeakKeyDictionary()
 
 
@@ -477,6 +482,78 @@ class Seat(PtrHasData):
         self.destroy()
 
 
+class SeatPointerFocus:
+    def __init__(
+        self,
+        seat: Seat,
+        cursor: Cursor,
+        xcursor_manager: XCursorManager,
+        default_image: str = "default",
+    ) -> None:
+        """Keep the pointer focus and cursor image of a seat up to date
+
+        Calling `update` on every cursor motion only notifies the seat of a
+        pointer enter when the surface under the cursor changes, and only
+        sets the cursor image when it differs from the last one set.
+
+        :param seat:
+            The seat whose pointer focus is updated.
+        :param cursor:
+            The cursor whose image is updated.
+        :param xcursor_manager:
+            The XCursor manager the cursor images are loaded from.
+        :param default_image:
+            The XCursor image shown when the cursor isn't over a surface.
+        """
+        self._seat = seat
+        self._cursor = cursor
+        self._xcursor_manager = xcursor_manager
+        self.default_image = default_image
+        self._cursor_image: str | None = None
+
+    def update(
+        self,
+        time_msec: int,
+        surface: Surface | None,
+        surface_x: float = 0.0,
+        surface_y: float = 0.0,
+    ) -> None:
+        """Update the pointer focus for a cursor motion
+
+        If a surface is under the cursor, it gets pointer focus and the motion
+        is forwarded to it, pass the surface-local coordinates of the cursor.
+        Otherwise pointer focus is cleared and the default image is shown.
+        """
+        pointer_state = self._seat._ptr.pointer_state
+        if surface is None:
+            # Clear pointer focus so future button events and such are not
+            # sent to the last client to have the cursor over it
+            if pointer_state.focused_surface != ffi.NULL:
+                lib.wlr_seat_pointer_clear_focus(self._seat._ptr)
+            self.set_cursor_image(self.default_image)
+            return
+
+        if pointer_state.focused_surface != surface._ptr:
+            lib.wlr_seat_pointer_notify_enter(
+                self._seat._ptr, surface._ptr, surface_x, surface_y
+            )
+            # The client sets its own cursor image on enter
+            self._cursor_image = None
+        lib.wlr_seat_pointer_notify_motion(
+            self._seat._ptr, time_msec, surface_x, surface_y
+        )
+
+    def set_cursor_image(self, name: str) -> None:
+        """Set the XCursor image of the cursor, if it isn't shown already"""
+        if name != self._cursor_image:
+            self._cursor.set_xcursor(self._xcursor_manager, name)
+            self._cursor_image = name
+
+    def invalidate_cursor_image(self) -> None:
+        """Forget the last image set, e.g. after the cursor image was set elsewhere"""
+        self._cursor_image = None
+
+
 class PointerRequestSetCursorEvent(Ptr):
     def __init__(self, ptr: ffi.CData) -> None:
         self._ptr = ffi.cast("struct wlr_seat_pointer_request_set_cursor_event *", ptr)
@@ -3,7 +3,9 @@
 
 from __future__ import annotations
 
+import hashlib
 import typing
+from collections import OrderedDict
 
 from wlroots import Ptr, ffi, lib
 
@@ -71,3 +73,131 @@ class Texture(Ptr):
         if self._ptr is not None:
             ffi.release(self._ptr)
             self._ptr = None
+
+
+class TextureCache:
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024) -> None:
+        """Reuse the textures created from identical pixels
+
+        Textures are keyed by the renderer, a hash of the pixels, the format
+        and the size, so drawing the same decoration or icon again reuses its
+        texture instead of uploading the pixels again. The least recently used
+        textures are destroyed once the pixels of the cached textures exceed
+        `max_bytes`.
+
+        Textures returned by the cache are owned by it, and are shared by all
+        of the lookups of the same pixels: they must not be destroyed nor
+        updated by the caller. Textures returned since the last call to
+        `end_frame` are never evicted, so they can be drawn until the frame
+        ends, after which they must not be kept. The budget may be exceeded
+        while the textures of the current frame don't fit in it.
+
+        :param max_bytes:
+            The budget for the size of the pixels of the cached textures.
+        """
+        self.max_bytes = max_bytes
+        self._textures: OrderedDict[tuple[typing.Any, ...], tuple[Texture, int]] = (
+            OrderedDict()
+        )
+        self._bytes = 0
+        # The keys of the textures returned since the last end_frame
+        self._in_use: set[tuple[typing.Any, ...]] = set()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._textures)
+
+    @property
+    def bytes(self) -> int:
+        """The size of the pixels of the cached textures"""
+        return self._bytes
+
+    def from_pixels(
+        self,
+        renderer: Renderer,
+        fmt: int,
+        stride: int,
+        width: int,
+        height: int,
+        data: typing.Any,
+    ) -> Texture:
+        """Get the texture of the pixels, creating it if it isn't cached
+
+        The arguments are those of `Texture.from_pixels`, but the data may
+        also be any object supporting the buffer protocol, such as `bytes`,
+        a `memoryview` or a NumPy array, of at least `stride * height` bytes.
+        """
+        size = stride * height
+        if isinstance(data, ffi.CData):
+            pixels = ffi.buffer(data, size)
+        else:
+            pixels = memoryview(data).cast("B")[:size]
+        if len(pixels) < size:
+            raise ValueError("The pixel data is smaller than stride * height")
+
+        digest = hashlib.blake2b(pixels, digest_size=16).digest()
+        key = (renderer._ptr, digest, fmt, width, height, stride)
+        entry = self._textures.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._textures.move_to_end(key)
+            self._in_use.add(key)
+            return entry[0]
+
+        self.misses += 1
+        texture = Texture.from_pixels(
+            renderer, fmt, stride, width, height, ffi.from_buffer(pixels)
+        )
+        if texture._ptr == ffi.NULL:
+            raise RuntimeError("Unable to create texture from pixels")
+        self._textures[key] = (texture, size)
+        self._bytes += size
+        self._in_use.add(key)
+        self._evict()
+        return texture
+
+    def end_frame(self) -> None:
+        """Release the textures returned so far, evicting them if over budget
+
+        This should be called once the frame the textures were drawn in has
+        been rendered, e.g. after committing the output.
+        """
+        self._in_use.clear()
+        self._evict()
+
+    def discard_renderer(self, renderer: Renderer) -> None:
+        """Destroy the cached textures of a renderer, e.g. before destroying it
+
+        The textures are destroyed even if they were returned in the current
+        frame.
+        """
+        for key in [key for key in self._textures if key[0] == renderer._ptr]:
+            self._remove(key)
+
+    def clear(self) -> None:
+        """Destroy all of the cached textures, including those in use"""
+        for key in list(self._textures):
+            self._remove(key)
+
+    def _evict(self) -> None:
+        excess = self._bytes - self.max_bytes
+        if excess <= 0:
+            return
+        evicted = []
+        for key, (_, size) in self._textures.items():
+            if excess <= 0:
+                break
+            if key not in self._in_use:
+                evicted.append(key)
+                excess -= size
+        for key in evicted:
+            self._remove(key)
+        self.evictions += len(evicted)
+
+    def _remove(self, key: tuple[typing.Any, ...]) -> None:
+        texture, size = self._textures.pop(key)
+        self._bytes -= size
+        self._in_use.discard(key)
+        texture.destroy()
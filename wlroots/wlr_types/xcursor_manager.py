@@ -8,7 +8,7 @@ from typing import TYPE_CHECKING
 from wlroots import Ptr, ffi, lib
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterable, Iterator
 
 
 class XCursorManager(Ptr):
@@ -23,24 +23,44 @@ class XCursorManager(Ptr):
         ptr = lib.wlr_xcursor_manager_create(theme_ptr, size)
         self._ptr = ffi.gc(ptr, lib.wlr_xcursor_manager_destroy)
 
+        # Encoded cursor names, and the cursors looked up by name and scale.
+        # The cursors stay valid until the manager is destroyed.
+        self._names: dict[str, bytes] = {}
+        self._xcursors: dict[tuple[str, float], XCursor | None] = {}
+
         lib.wlr_xcursor_manager_load(self._ptr, scale)
 
     def destroy(self) -> None:
         """Destroy the x cursor manager"""
         if self._ptr is not None:
+            self._xcursors.clear()
             ffi.release(self._ptr)
             self._ptr = None
 
+    def _intern(self, name: str) -> bytes:
+        encoded = self._names.get(name)
+        if encoded is None:
+            encoded = self._names[name] = name.encode()
+        return encoded
+
     def get_xcursor(self, name: str, scale: float = 1) -> XCursor | None:
         """
         Retrieves a wlr_xcursor reference for the given cursor name at the given scale
         factor, or NULL if this wlr_xcursor_manager has not loaded a cursor theme at the
         requested scale.
+
+        Lookups are cached, the same XCursor is returned for the same name and scale.
         """
-        ptr = lib.wlr_xcursor_manager_get_xcursor(self._ptr, name.encode(), scale)
-        if ptr == ffi.NULL:
-            return None
-        return XCursor(ptr)
+        key = (name, scale)
+        try:
+            return self._xcursors[key]
+        except KeyError:
+            pass
+
+        ptr = lib.wlr_xcursor_manager_get_xcursor(self._ptr, self._intern(name), scale)
+        xcursor = None if ptr == ffi.NULL else XCursor(ptr)
+        self._xcursors[key] = xcursor
+        return xcursor
 
     def __enter__(self) -> XCursorManager:
         """Setup X cursor manager in a context manager"""
@@ -59,19 +79,36 @@ class XCursorManager(Ptr):
         """
         Ensures an xcursor theme at the given scale factor is loaded in the manager.
         """
+        # Cursors not found before may be provided by the newly loaded theme
+        self._xcursors = {
+            key: xcursor
+            for key, xcursor in self._xcursors.items()
+            if xcursor is not None
+        }
         return bool(lib.wlr_xcursor_manager_load(self._ptr, scale))
 
+    def load_scales(self, scales: Iterable[float]) -> bool:
+        """
+        Ensures the xcursor theme is loaded at each of the given scale factors, e.g. the
+        scales of all outputs at startup, so cursor images needn't be loaded lazily.
+        """
+        return all([self.load(scale) for scale in set(scales)])
+
 
 class XCursor(Ptr):
     """struct wlr_xcursor"""
 
     def __init__(self, ptr: ffi.CData) -> None:
         self._ptr = ptr
+        self._images: tuple[XCursorImage, ...] | None = None
 
     @property
     def images(self) -> Iterator[XCursorImage]:
-        for i in range(self._ptr.image_count):
-            yield XCursorImage(self._ptr.images[0][i])
+        if self._images is None:
+            self._images = tuple(
+                XCursorImage(self._ptr.images[i]) for i in range(self._ptr.image_count)
+            )
+        return iter(self._images)
 
 
 class XCursorImage(Ptr):
@@ -10,7 +10,7 @@ from weakref import WeakKeyDictionary
 from pywayland.server import Display, Signal
 
 from wlroots import Ptr, PtrHasData, ffi, lib, str_or_none
-from wlroots.util.box import Box
+from wlroots.util.box import Box, FrozenBox
 from wlroots.util.edges import Edges
 
 from .compositor import Surface
@@ -388,7 +388,7 @@ class XdgPopup(Ptr):
     def pending(self) -> XdgPopupState:
         return XdgPopupState(self._ptr.pending)
 
-    def unconstrain_from_box(self, box: Box) -> None:
+    def unconstrain_from_box(self, box: Box | FrozenBox) -> None:
         """
         Set the geometry of this popup to unconstrain it according to its xdg-positioner
         rules. The box should be in the popup's root toplevel parent surface coordinate
@@ -522,3 +522,11 @@ class SizeHints(Ptr):
     @property
     def height_inc(self) -> int:
         return self._ptr.height_inc
+
+    @property
+    def base_width(self) -> int:
+        return self._ptr.base_width
+
+    @property
+    def base_height(self) -> int:
+        return self._ptr.base_height